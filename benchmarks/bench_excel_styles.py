@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Excel 스타일 지정 방식 벤치마크 (셀별 스타일 객체 생성 vs 컬럼별 스타일 객체 공유)
+
+TC 수별로 다음 경로의 실행 시간, 출력 파일 크기, styles.xml 크기를 비교합니다.
+- template/per-cell : 템플릿 경로의 기존 방식 (셀마다 copy_cell_style + 줄바꿈 Alignment 생성)
+- template/shared   : write_testcases_to_template(engine="classic") (컬럼별 스타일 객체를 한 번만 만들어 공유)
+- new/classic       : create_new_testcase_excel(engine="classic")
+- new/stream        : create_new_testcase_excel(engine="stream")
+
+사용법:
+    python bench_excel_styles.py [--sizes 1000,10000,50000] [--keep <output_dir>]
+"""
+
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+# 스킬 스크립트(testcase-generator/scripts) import 경로
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "testcase-generator" / "scripts"))
+
+from write_excel import (
+    BASE_COLUMNS,
+    copy_cell_style,
+    create_new_testcase_excel,
+    find_column_mapping,
+    find_header_row,
+    write_testcases_to_template,
+)
+
+
+DEFAULT_SIZES = [1000, 10000, 50000]
+TEMPLATE_HEADER_ROW = 10
+
+
+def make_testcases(count: int) -> dict:
+    """벤치마크용 TC 데이터 생성 (줄바꿈 필드, 공란 필드 포함)"""
+    testcases = []
+    for i in range(1, count + 1):
+        tc = {
+            "test_case_id": f"IT_BM_{i:05d}",
+            "depth1": "OnePros",
+            "depth2": f"화면 {i % 40}",
+            "depth3": f"기능 그룹 {i % 7}",
+            "depth4": "",
+            "title": f"[버튼 {i}] 클릭",
+            "pre_condition": "" if i % 5 == 0 else "로그인 상태",
+            "test_step": f"1. 화면 {i % 40} 진입\n2. [버튼 {i}] 클릭",
+            "expected_result": f"# 버튼 {i} 동작 확인",
+            "requirement_id": "",
+            "reference": f"OnePros 화면 정의서 {i % 300 + 1}P",
+            "importance": "",
+            "writer": "",
+        }
+        if i % 5 == 0:
+            tc["_blank_reasons"] = {"pre_condition": "사전 조건 없음"}
+        testcases.append(tc)
+    return {
+        "project_info": {"project_name": "Benchmark", "version": "v1.0"},
+        "total_testcases": count,
+        "testcases": testcases,
+    }
+
+
+def make_template(path: Path):
+    """헤더 행 + 스타일이 지정된 첫 데이터 행을 가진 템플릿 생성"""
+    wb = Workbook()
+    sheet = wb.active
+    thin = Side(style="thin")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+
+    for col_idx, (name, _) in enumerate(BASE_COLUMNS, start=1):
+        header = sheet.cell(row=TEMPLATE_HEADER_ROW, column=col_idx, value=name)
+        header.font = Font(name="맑은 고딕", bold=True, color="FFFFFF")
+        header.fill = header_fill
+        header.border = border
+
+        sample = sheet.cell(row=TEMPLATE_HEADER_ROW + 1, column=col_idx)
+        sample.font = Font(name="맑은 고딕", size=9)
+        sample.alignment = Alignment(horizontal="left", vertical="center")
+        sample.border = border
+    sheet.cell(row=TEMPLATE_HEADER_ROW + 1, column=1, value=1)
+    wb.save(path)
+
+
+def write_template_per_cell(testcases_data: dict, template_path: Path, output_path: Path):
+    """기존 방식: 셀마다 스타일 객체를 새로 만들어 복사"""
+    shutil.copy(template_path, output_path)
+    wb = load_workbook(output_path)
+    sheet = wb.active
+
+    header_row = find_header_row(sheet)
+    column_map = find_column_mapping(sheet, header_row)
+    data_start_row = header_row + 1
+
+    for idx, tc in enumerate(testcases_data["testcases"]):
+        row_idx = data_start_row + idx
+        for field, col_idx in column_map.items():
+            value = tc.get(field, "")
+            cell = sheet.cell(row=row_idx, column=col_idx)
+            cell.value = value
+            copy_cell_style(sheet.cell(row=data_start_row, column=col_idx), cell)
+            if value and "\n" in str(value):
+                cell.alignment = Alignment(
+                    horizontal=cell.alignment.horizontal if cell.alignment else "left",
+                    vertical="top",
+                    wrap_text=True
+                )
+
+    wb.save(output_path)
+
+
+def styles_xml_size(xlsx_path: Path) -> int:
+    """출력 파일의 xl/styles.xml 크기 (bytes)"""
+    with zipfile.ZipFile(xlsx_path) as zf:
+        return zf.getinfo("xl/styles.xml").file_size
+
+
+def run_case(func, *args) -> float:
+    """함수 실행 시간 측정 (출력 메시지 숨김)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args)
+    return time.perf_counter() - start
+
+
+def run_benchmark(sizes, work_dir: Path):
+    """TC 수별 벤치마크 실행 및 결과 표 출력"""
+    template_path = work_dir / "template.xlsx"
+    make_template(template_path)
+
+    cases = [
+        ("template/per-cell", lambda data, out: write_template_per_cell(data, template_path, out)),
+        ("template/shared", lambda data, out: write_testcases_to_template(data, template_path, out, engine="classic")),
+        ("new/classic", lambda data, out: create_new_testcase_excel(data, out, engine="classic")),
+        ("new/stream", lambda data, out: create_new_testcase_excel(data, out, engine="stream")),
+    ]
+
+    print(f"{'rows':>7}  {'case':<18} {'time(s)':>8} {'file(KB)':>9} {'styles.xml(B)':>14}")
+    print("-" * 62)
+    for size in sizes:
+        testcases_data = make_testcases(size)
+        for name, func in cases:
+            output_path = work_dir / f"{name.replace('/', '_')}_{size}.xlsx"
+            elapsed = run_case(func, testcases_data, output_path)
+            file_kb = output_path.stat().st_size / 1024
+            print(f"{size:>7}  {name:<18} {elapsed:>8.2f} {file_kb:>9.0f} {styles_xml_size(output_path):>14}")
+        print()
+
+
+def main():
+    sizes = DEFAULT_SIZES
+    keep_dir = None
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--sizes" and i + 1 < len(args):
+            sizes = [int(s) for s in args[i + 1].split(",") if s]
+            i += 2
+        elif args[i] == "--keep" and i + 1 < len(args):
+            keep_dir = Path(args[i + 1])
+            i += 2
+        else:
+            print(f"Error: Unknown argument: {args[i]}")
+            print("Usage: python bench_excel_styles.py [--sizes 1000,10000,50000] [--keep <output_dir>]")
+            sys.exit(1)
+
+    if keep_dir:
+        keep_dir.mkdir(parents=True, exist_ok=True)
+        run_benchmark(sizes, keep_dir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="bench_excel_") as tmp:
+            run_benchmark(sizes, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
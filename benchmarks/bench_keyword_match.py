@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+규칙 테이블 키워드 매칭 벤치마크 (테이블별 `keyword in text` 루프 vs KeywordMatcher)
+
+컴포넌트 수별로 TC 생성 1회에 필요한 규칙 조회 결과(타입, Title, 단축키, 조건, Pre-condition, 동작)를
+두 방식으로 구해 실행 시간을 비교하고 결과가 같은지 확인합니다.
+- legacy  : 기존 방식 (함수마다 소문자 텍스트를 만들고 테이블을 앞에서부터 순회, 타입 분류는 생성기처럼 3회)
+- matcher : component_keywords / match_keywords (Aho-Corasick 1회 스캔 + 텍스트별 캐시)
+- generate: 참고용 generate_testcases 전체 실행 시간
+
+사용법:
+    python bench_keyword_match.py [--sizes 5000,20000] [--desc-repeat 2]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# 스킬 스크립트(testcase-generator/scripts) import 경로
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "testcase-generator" / "scripts"))
+
+from generate_testcase import (
+    ACTION_KEYWORDS,
+    COMPONENT_TYPE_KEYWORDS,
+    CONDITION_PATTERNS,
+    PRECONDITION_KEYWORDS,
+    SHORTCUT_MAP,
+    TITLE_KEYWORD_MAP,
+    TITLE_TYPE_KEYWORDS,
+    component_keywords,
+    generate_testcases,
+    match_keywords,
+)
+
+
+DEFAULT_SIZES = [5000, 20000]
+DEFAULT_DESC_REPEAT = 2
+
+NAMES = [
+    "Menu Item", "Patient Info", "Thumbnail Area", "Save Button", "Close Btn", "Search Field",
+    "Study List", "Setting Popup", "Viewer Panel", "Tool Bar", "Undo Icon", "Modality Filter",
+]
+PROSE = (
+    "선택한 항목의 상세 정보를 우측 패널에 표시한다. 사용자가 값을 변경하면 즉시 반영되며 이전 상태는 유지된다. "
+    "마우스 오버 시 Hint : 해당 기능 설명이 표시되고 클릭하면 관련 화면으로 이동한다. "
+)
+
+
+def make_components(count: int, desc_repeat: int) -> list:
+    """벤치마크용 컴포넌트 목록 생성 (영문 이름 + 한글 설명)"""
+    rnd = random.Random(count)
+    return [
+        {
+            "component": f"{rnd.choice(NAMES)} {i}",
+            "description": "\n".join(PROSE[rnd.randint(0, 40):] for _ in range(desc_repeat)),
+            "slide_number": i // 20 + 1,
+            "section": f"{i // 100:02d} 섹션",
+        }
+        for i in range(count)
+    ]
+
+
+def _first_group(mapping: dict, text: str):
+    for value, keywords in mapping.items():
+        for keyword in keywords:
+            if keyword in text:
+                return value
+    return None
+
+
+def _first_keyword(mapping: dict, text: str):
+    for keyword, value in mapping.items():
+        if keyword in text:
+            return value
+    return None
+
+
+def legacy_lookups(name: str, description: str) -> dict:
+    """기존 방식: 호출 지점마다 텍스트를 새로 만들고 테이블 순회"""
+    for _ in range(3):
+        comp_type = _first_group(COMPONENT_TYPE_KEYWORDS, f"{name} {description}".lower())
+    result = {
+        "type": comp_type,
+        "title_type": _first_group(TITLE_TYPE_KEYWORDS, f"{name} {description}".lower()),
+        "title": _first_keyword(TITLE_KEYWORD_MAP, f"{name} {description}".lower()),
+        "shortcut": _first_keyword(SHORTCUT_MAP, f"{name} {description}".lower()),
+        "condition": _first_keyword(CONDITION_PATTERNS, f"{name} {description}".lower()),
+        "precondition": _first_group(PRECONDITION_KEYWORDS, name.lower()),
+        "action": _first_group(ACTION_KEYWORDS, name.lower()),
+    }
+    return {key: value for key, value in result.items() if value is not None}
+
+
+def matcher_lookups(name: str, description: str) -> dict:
+    """KeywordMatcher: 전체 텍스트 1회 + 이름 1회 스캔"""
+    for _ in range(3):
+        hits = component_keywords(name, description)
+    name_hits = match_keywords(name.lower())
+    result = {key: value for key, value in hits.items() if key not in ("precondition", "action")}
+    for key in ("precondition", "action"):
+        if key in name_hits:
+            result[key] = name_hits[key]
+    return result
+
+
+def run_case(func, components):
+    start = time.perf_counter()
+    results = [func(c["component"], c["description"]) for c in components]
+    return results, time.perf_counter() - start
+
+
+def run_benchmark(sizes, desc_repeat: int):
+    print(f"{'N':>6}  {'legacy(s)':>10} {'matcher(s)':>11} {'speedup':>8}  {'generate(s)':>12}  same")
+    print("-" * 62)
+    for size in sizes:
+        components = make_components(size, desc_repeat)
+
+        legacy, legacy_time = run_case(legacy_lookups, components)
+        match_keywords.cache_clear()
+        matched, matcher_time = run_case(matcher_lookups, components)
+
+        match_keywords.cache_clear()
+        start = time.perf_counter()
+        generate_testcases({"all_components": components}, "IT_BM")
+        generate_time = time.perf_counter() - start
+
+        same = "yes" if legacy == matched else "NO"
+        print(f"{size:>6}  {legacy_time:>10.3f} {matcher_time:>11.3f} {legacy_time / matcher_time:>7.1f}x"
+              f"  {generate_time:>12.3f}  {same}")
+
+
+def main():
+    sizes = DEFAULT_SIZES
+    desc_repeat = DEFAULT_DESC_REPEAT
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--sizes" and i + 1 < len(args):
+            sizes = [int(s) for s in args[i + 1].split(",") if s]
+            i += 2
+        elif args[i] == "--desc-repeat" and i + 1 < len(args):
+            desc_repeat = int(args[i + 1])
+            i += 2
+        else:
+            print(f"Error: Unknown argument: {args[i]}")
+            print("Usage: python bench_keyword_match.py [--sizes 5000,20000] [--desc-repeat 2]")
+            sys.exit(1)
+
+    run_benchmark(sizes, desc_repeat)
+
+
+if __name__ == "__main__":
+    main()
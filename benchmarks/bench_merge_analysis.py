@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+이미지 분석 병합 매칭 벤치마크 (컴포넌트 순회 vs ComponentMatcher 인덱스)
+
+컴포넌트 수 N, 시각 요소 수 N인 데이터로 두 경로의 실행 시간을 비교하고 결과가 같은지 확인합니다.
+- linear  : 요소마다 find_matching_component로 전체 순회 + components.index (기존 방식, O(N²))
+- indexed : merge_image_analysis (ComponentMatcher 후보 조회)
+
+사용법:
+    python bench_merge_analysis.py [--sizes 500,1000,2000,4000]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 스킬 스크립트(testcase-generator/scripts) import 경로
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "testcase-generator" / "scripts"))
+
+from merge_analysis import (
+    create_component_from_visual,
+    find_matching_component,
+    merge_image_analysis,
+    merge_visual_info,
+)
+
+
+DEFAULT_SIZES = [500, 1000, 2000, 4000]
+
+COMPONENT_KINDS = [
+    ("Button", "클릭 시 동작 수행"),
+    ("Input", "텍스트 입력 필드"),
+    ("List", "항목 목록 테이블"),
+    ("Popup", "확인 팝업 모달"),
+    ("Icon", "상태 아이콘"),
+]
+ELEMENT_TYPES = ["button", "input", "list", "popup", "icon", "label"]
+
+
+def make_data(count: int):
+    """벤치마크용 추출 데이터 + 이미지 분석 결과 생성
+
+    요소의 절반은 기존 컴포넌트와 완전/포함/첫 단어 일치하고, 나머지는 새 컴포넌트로 추가됩니다.
+    """
+    components = []
+    for i in range(count):
+        kind, desc = COMPONENT_KINDS[i % len(COMPONENT_KINDS)]
+        components.append({
+            "no": i + 1,
+            "component": f"Menu{i:05d} Item {kind}",
+            "description": desc,
+            "slide_number": i // 20 + 1,
+            "section": "",
+        })
+
+    images = {}
+    for i in range(count):
+        variant = i % 4
+        if variant == 0:
+            label = f"Menu{i:05d} Item"     # 완전 일치 (접미사 제거 후)
+        elif variant == 1:
+            label = f"Menu{i:05d}"          # 포함 관계
+        elif variant == 2:
+            label = f"Unknown Widget {i:05d}" # 새 컴포넌트
+        else:
+            label = f"Extra Panel {i:05d} Area" # 새 컴포넌트
+        element = {
+            "label": label,
+            "type": ELEMENT_TYPES[i % len(ELEMENT_TYPES)],
+            "position": "상단",
+            "state": "enabled",
+        }
+        images.setdefault(i // 20 + 1, []).append(element)
+
+    extracted = {"all_components": components}
+    analysis = {
+        "analysis_date": "2026-01-01",
+        "images": [{"slide_number": s, "elements": e} for s, e in sorted(images.items())],
+    }
+    return extracted, analysis
+
+
+def merge_linear(extracted_data: dict, image_analysis: dict) -> list:
+    """기존 방식: 요소마다 전체 컴포넌트 순회"""
+    components = extracted_data.get("all_components", []).copy()
+    for image_result in image_analysis.get("images", []):
+        slide_number = image_result.get("slide_number", 0)
+        for element in image_result.get("elements", []):
+            match, _ = find_matching_component(element, components)
+            if match:
+                idx = components.index(match)
+                components[idx] = merge_visual_info(match, element)
+            else:
+                components.append(create_component_from_visual(element, slide_number))
+    for i, comp in enumerate(components, 1):
+        if comp.get("no", 0) == 0:
+            comp["no"] = i
+    return components
+
+
+def run_benchmark(sizes):
+    print(f"{'N':>6}  {'linear(s)':>10} {'indexed(s)':>11} {'speedup':>8}  same")
+    print("-" * 48)
+    prev = None
+    for size in sizes:
+        extracted, analysis = make_data(size)
+
+        start = time.perf_counter()
+        linear = merge_linear(extracted, analysis)
+        linear_time = time.perf_counter() - start
+
+        extracted, analysis = make_data(size)
+        start = time.perf_counter()
+        indexed = merge_image_analysis(extracted, analysis)["all_components"]
+        indexed_time = time.perf_counter() - start
+
+        same = "yes" if linear == indexed else "NO"
+        print(f"{size:>6}  {linear_time:>10.3f} {indexed_time:>11.3f} {linear_time / indexed_time:>7.1f}x  {same}")
+
+        if prev:
+            prev_size, prev_linear, prev_indexed = prev
+            ratio = size / prev_size
+            print(f"{'':>6}  x{linear_time / prev_linear:>9.1f} x{indexed_time / prev_indexed:>10.1f}"
+                  f"   (N x{ratio:.1f})")
+        prev = (size, linear_time, indexed_time)
+
+
+def main():
+    sizes = DEFAULT_SIZES
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--sizes" and i + 1 < len(args):
+            sizes = [int(s) for s in args[i + 1].split(",") if s]
+            i += 2
+        else:
+            print(f"Error: Unknown argument: {args[i]}")
+            print("Usage: python bench_merge_analysis.py [--sizes 500,1000,2000,4000]")
+            sys.exit(1)
+
+    run_benchmark(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+TC 청크 병합 벤치마크 (전체 로드 + 전역 정렬 vs 청크별 정렬 + k-way 스트리밍 병합)
+
+임시 디렉터리에 tc_chunk_*.json을 만들어 두 방식으로 병합하고
+실행 시간, 최대 메모리(tracemalloc), 출력 파일이 같은지 비교합니다.
+- legacy : 모든 청크 json.load → 전체 TC 수집 → 전역 정렬 → json.dump
+- stream : ChunkMerger (청크별 정렬 후 임시 파일 → 페이지 순 k-way 병합하며 바로 기록)
+
+사용법:
+    python bench_merge_tc_chunks.py [--chunks 40] [--tcs-per-chunk 500]
+"""
+
+import glob
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# 스킬 스크립트(testcase-generator/scripts) import 경로
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "testcase-generator" / "scripts"))
+
+from merge_tc_chunks import (
+    DEFAULT_TC_PREFIX,
+    ChunkMerger,
+    chunk_testcases,
+    detect_prefix,
+    normalize_field_names,
+    testcase_sort_key,
+    update_project_info,
+)
+
+
+DEFAULT_CHUNKS = 40
+DEFAULT_TCS_PER_CHUNK = 500
+
+# 청크당 담당 페이지 수 / 다른 TC를 참조하는 Reference 비율
+PAGES_PER_CHUNK = 15
+CROSS_REFERENCE_RATIO = 0.2
+
+
+def make_chunks(chunk_dir: Path, chunk_count: int, tcs_per_chunk: int):
+    """청크 에이전트 출력과 비슷한 tc_chunk_*.json 생성 (청크 안은 대체로 페이지 순)"""
+    rnd = random.Random(chunk_count * tcs_per_chunk)
+    for chunk_id in range(1, chunk_count + 1):
+        first_page = (chunk_id - 1) * PAGES_PER_CHUNK + 1
+        testcases = []
+        for seq in range(1, tcs_per_chunk + 1):
+            page = first_page + (seq - 1) * PAGES_PER_CHUNK // tcs_per_chunk
+            if rnd.random() < 0.1:
+                page += rnd.choice((-1, 1))
+            reference = f"{page}P"
+            if rnd.random() < CROSS_REFERENCE_RATIO:
+                reference += f" (참조: CHUNK{rnd.randint(1, chunk_count)}_{rnd.randint(1, tcs_per_chunk):03d})"
+            testcases.append({
+                "test_case_id": f"CHUNK{chunk_id}_{seq:03d}",
+                "depth1": "Viewer",
+                "depth2": f"{page:02d} 화면",
+                "title": f"[{page}P] 항목 {seq} 동작 확인",
+                "precondition": "프로그램 실행 상태",
+                "steps": "1. 해당 화면 진입\n2. 버튼 클릭\n3. 결과 확인",
+                "expected": "# 기능이 정상 동작함\n- 결과가 화면에 표시됨",
+                "reference": reference,
+                "importance": "M",
+            })
+        chunk_data = {
+            "chunk_id": chunk_id,
+            "project_info": {"app_name": "Bench", "version": "1.0"} if chunk_id == 1 else {},
+            "testcases": testcases,
+        }
+        with open(chunk_dir / f"tc_chunk_{chunk_id:03d}.json", "w", encoding="utf-8") as f:
+            json.dump(chunk_data, f, ensure_ascii=False, indent=2)
+
+
+def legacy_merge(chunk_dir: Path, output_file: Path):
+    """기존 방식: 전체 로드 → 전역 정렬 → 한 번에 기록"""
+    chunks = []
+    for chunk_file in sorted(glob.glob(str(chunk_dir / "tc_chunk_*.json"))):
+        with open(chunk_file, "r", encoding="utf-8") as f:
+            chunks.append(json.load(f))
+
+    # TC ID 접두사: TC가 있는 첫 청크의 첫 TC 기준
+    prefix = DEFAULT_TC_PREFIX
+    for chunk_data in chunks:
+        testcases = chunk_testcases(chunk_data)
+        if testcases:
+            prefix = detect_prefix(testcases[0].get("test_case_id", "")) or prefix
+            break
+
+    # 전체 TC 수집 → 전역 정렬 → ID 재할당
+    testcases = sorted(
+        (normalize_field_names(tc) for chunk_data in chunks for tc in chunk_testcases(chunk_data)),
+        key=testcase_sort_key,
+    )
+    id_mapping = {}
+    for idx, tc in enumerate(testcases, start=1):
+        new_id = f"{prefix}_{idx:03d}"
+        if tc.get("test_case_id"):
+            id_mapping[tc["test_case_id"]] = new_id
+        tc["test_case_id"] = new_id
+
+    # 크로스 레퍼런스 정규화 (긴 ID부터 치환, 치환 결과는 다시 치환하지 않음)
+    pattern = re.compile("|".join(map(re.escape, sorted(id_mapping, key=len, reverse=True)))) if id_mapping else None
+    for tc in testcases:
+        reference = tc.get("reference", "")
+        if pattern is not None and reference:
+            reference = pattern.sub(lambda match: id_mapping[match.group()], reference)
+        tc["reference"] = reference
+
+    project_info = {}
+    for chunk_data in chunks:
+        update_project_info(project_info, chunk_data.get("project_info", {}))
+    result = {
+        "project_info": project_info,
+        "total_testcases": len(testcases),
+        "merged_from_chunks": len(chunks),
+        "testcases": testcases,
+    }
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+def stream_merge(chunk_dir: Path, output_file: Path):
+    """ChunkMerger: 청크별 정렬 → k-way 병합하며 기록"""
+    with tempfile.TemporaryDirectory(dir=chunk_dir) as spill_dir:
+        merger = ChunkMerger(Path(spill_dir))
+        for chunk_file in sorted(glob.glob(str(chunk_dir / "tc_chunk_*.json"))):
+            merger.add_file(Path(chunk_file))
+        merger.write(output_file)
+
+
+def measure(merge, chunk_dir: Path, output_file: Path):
+    """(실행 시간, 최대 메모리) - 시간은 tracemalloc 없이 따로 측정"""
+    start = time.perf_counter()
+    merge(chunk_dir, output_file)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    merge(chunk_dir, output_file)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run_benchmark(chunk_count: int, tcs_per_chunk: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        chunk_dir = Path(tmp)
+        make_chunks(chunk_dir, chunk_count, tcs_per_chunk)
+        outputs = {"legacy": chunk_dir / "legacy.json", "stream": chunk_dir / "stream.json"}
+
+        print(f"chunks={chunk_count}, TCs={chunk_count * tcs_per_chunk}")
+        print(f"{'kind':>8}  {'time(s)':>8} {'peak(MB)':>9}")
+        print("-" * 28)
+        for kind, merge in (("legacy", legacy_merge), ("stream", stream_merge)):
+            elapsed, peak = measure(merge, chunk_dir, outputs[kind])
+            print(f"{kind:>8}  {elapsed:>8.2f} {peak / 1024 / 1024:>9.1f}")
+
+        same = outputs["legacy"].read_bytes() == outputs["stream"].read_bytes()
+        print()
+        print(f"same: {'yes' if same else 'NO'}")
+
+
+def main():
+    chunk_count = DEFAULT_CHUNKS
+    tcs_per_chunk = DEFAULT_TCS_PER_CHUNK
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--chunks" and i + 1 < len(args):
+            chunk_count = int(args[i + 1])
+            i += 2
+        elif args[i] == "--tcs-per-chunk" and i + 1 < len(args):
+            tcs_per_chunk = int(args[i + 1])
+            i += 2
+        else:
+            print(f"Error: Unknown argument: {args[i]}")
+            print("Usage: python bench_merge_tc_chunks.py [--chunks 40] [--tcs-per-chunk 500]")
+            sys.exit(1)
+
+    run_benchmark(chunk_count, tcs_per_chunk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pairwise 생성 방식 벤치마크 (전체 조합 탐색 greedy vs IPOG)
+
+조건 수를 늘려가며 두 방식의 실행 시간과 조합 수를 비교하고, IPOG 결과가 모든 값 쌍을 커버하는지 확인합니다.
+- legacy : 기존 방식 (행마다 itertools.product 전체를 탐색하며 미커버 쌍 목록을 재검사)
+- ipog   : generate_pairwise_combinations (IPOG + 비트셋 커버리지)
+
+legacy는 전체 조합 수가 --legacy-limit을 넘으면 건너뜁니다.
+
+사용법:
+    python bench_pairwise.py [--values 4] [--counts 3,4,5,6,7,10,20,40] [--legacy-limit 16384]
+"""
+
+import sys
+import time
+from itertools import combinations, product
+from pathlib import Path
+from typing import List
+
+# 스킬 스크립트(testcase-generator/scripts) import 경로
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "testcase-generator" / "scripts"))
+
+from test_design_techniques import TestCombination, TestCondition, generate_pairwise_combinations
+
+
+DEFAULT_VALUES = 4
+DEFAULT_COUNTS = [3, 4, 5, 6, 7, 10, 20, 40]
+DEFAULT_LEGACY_LIMIT = 16384
+
+
+def make_conditions(count: int, values: int) -> List[TestCondition]:
+    """벤치마크용 조건 목록 생성"""
+    return [
+        TestCondition(f"조건{i + 1}", [f"값{i + 1}-{v + 1}" for v in range(values)])
+        for i in range(count)
+    ]
+
+
+def legacy_pairwise(conditions: List[TestCondition]) -> List[TestCombination]:
+    """기존 방식: 행마다 전체 조합 중 미커버 쌍을 가장 많이 커버하는 조합 선택"""
+    result = []
+    uncovered_pairs = []
+    for i, cond1 in enumerate(conditions):
+        for j, cond2 in enumerate(conditions):
+            if i < j:
+                for v1 in cond1.values:
+                    for v2 in cond2.values:
+                        uncovered_pairs.append((i, j, v1, v2))
+
+    while uncovered_pairs:
+        best_combo = None
+        best_coverage = 0
+
+        all_values = [cond.values for cond in conditions]
+        for combo in product(*all_values):
+            coverage = 0
+            for i, j, v1, v2 in uncovered_pairs:
+                if combo[i] == v1 and combo[j] == v2:
+                    coverage += 1
+
+            if coverage > best_coverage:
+                best_coverage = coverage
+                best_combo = combo
+
+        if best_combo is None:
+            break
+
+        combo_dict = {cond.name: best_combo[i] for i, cond in enumerate(conditions)}
+        result.append(TestCombination(conditions=combo_dict, description="Pairwise 조합"))
+
+        uncovered_pairs = [
+            (i, j, v1, v2) for (i, j, v1, v2) in uncovered_pairs
+            if not (best_combo[i] == v1 and best_combo[j] == v2)
+        ]
+
+    return result
+
+
+def covers_all_pairs(conditions: List[TestCondition], combos: List[TestCombination]) -> bool:
+    """모든 조건 쌍의 모든 값 쌍이 커버되는지 확인"""
+    for cond1, cond2 in combinations(conditions, 2):
+        seen = {(c.conditions[cond1.name], c.conditions[cond2.name]) for c in combos}
+        if len(seen) < len(cond1.values) * len(cond2.values):
+            return False
+    return True
+
+
+def run_case(func, conditions):
+    """함수 실행 시간 측정"""
+    start = time.perf_counter()
+    combos = func(conditions)
+    return combos, time.perf_counter() - start
+
+
+def run_benchmark(counts, values: int, legacy_limit: int):
+    print(f"{'conds':>5}  {'legacy(s)':>10} {'rows':>5}  {'ipog(ms)':>9} {'rows':>5}  covered")
+    print("-" * 52)
+    for count in counts:
+        conditions = make_conditions(count, values)
+
+        if values ** count <= legacy_limit:
+            legacy, legacy_time = run_case(legacy_pairwise, conditions)
+            legacy_cols = f"{legacy_time:>10.3f} {len(legacy):>5}"
+        else:
+            legacy_cols = f"{'-':>10} {'-':>5}"
+
+        ipog, ipog_time = run_case(generate_pairwise_combinations, conditions)
+        covered = "yes" if covers_all_pairs(conditions, ipog) else "NO"
+        print(f"{count:>5}  {legacy_cols}  {ipog_time * 1000:>9.1f} {len(ipog):>5}  {covered}")
+
+
+def main():
+    counts = DEFAULT_COUNTS
+    values = DEFAULT_VALUES
+    legacy_limit = DEFAULT_LEGACY_LIMIT
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--counts" and i + 1 < len(args):
+            counts = [int(s) for s in args[i + 1].split(",") if s]
+            i += 2
+        elif args[i] == "--values" and i + 1 < len(args):
+            values = int(args[i + 1])
+            i += 2
+        elif args[i] == "--legacy-limit" and i + 1 < len(args):
+            legacy_limit = int(args[i + 1])
+            i += 2
+        else:
+            print(f"Error: Unknown argument: {args[i]}")
+            print("Usage: python bench_pairwise.py [--values 4] [--counts 3,4,5,6,7,10,20,40] [--legacy-limit 16384]")
+            sys.exit(1)
+
+    run_benchmark(counts, values, legacy_limit)
+
+
+if __name__ == "__main__":
+    main()
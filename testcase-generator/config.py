@@ -93,6 +93,22 @@ MAX_PARALLEL_AGENTS: int = _get_env_int("TC_MAX_PARALLEL_AGENTS", 10)
 # 최소 청크 수 (항상 이 수 이상의 에이전트로 병렬 처리)
 MIN_CHUNKS: int = _get_env_int("TC_MIN_CHUNKS", 3)
 
+# 청크 분할 방식 ("balanced": 예상 비용 기준 균형 분할, "greedy": 기존 페이지/컴포넌트 한도 순차 분할)
+CHUNK_PLANNER: str = _get_env_str("TC_CHUNK_PLANNER", "balanced")
+
+# 청크 예상 소요 시간 모델 (초, plan_chunks.py SlideCostModel 기본값)
+# 슬라이드 비용 = 슬라이드당 + 컴포넌트당 × 개수 + 설명 1000자당 × 글자 수 + 이미지당 × 개수
+CHUNK_COST_PER_SLIDE_SEC: int = _get_env_int("TC_CHUNK_COST_PER_SLIDE_SEC", 15)
+CHUNK_COST_PER_COMPONENT_SEC: int = _get_env_int("TC_CHUNK_COST_PER_COMPONENT_SEC", 4)
+CHUNK_COST_PER_1K_CHARS_SEC: int = _get_env_int("TC_CHUNK_COST_PER_1K_CHARS_SEC", 10)
+CHUNK_COST_PER_IMAGE_SEC: int = _get_env_int("TC_CHUNK_COST_PER_IMAGE_SEC", 8)
+
+# 청크(에이전트)당 고정 비용 (에이전트 시작, tc_plan 읽기 등)
+CHUNK_COST_PER_CHUNK_SEC: int = _get_env_int("TC_CHUNK_COST_PER_CHUNK_SEC", 60)
+
+# 청크(에이전트)당 목표 소요 시간 (초, 0이면 사용 안 함) - 예상 비용이 이 값을 넘지 않도록 분할
+CHUNK_TARGET_SEC: int = _get_env_int("TC_CHUNK_TARGET_SEC", 900)
+
 
 # ============================================================
 # Fullpage 이미지 설정
@@ -218,6 +234,53 @@ REF_MAP_MAX_AGENTS: int = _get_env_int("TC_REF_MAP_MAX_AGENTS", 5)
 REF_MAP_CONFIDENCE_THRESHOLD: float = 0.7
 
 
+# ============================================================
+# 추출 캐시 설정
+# ============================================================
+
+# 슬라이드 추출 결과 캐시 사용 여부 (output/.cache/)
+EXTRACTION_CACHE_ENABLED: bool = _get_env_str("TC_CACHE_ENABLED", "true").lower() == "true"
+
+# 캐시 최대 크기 (MB, 초과 시 오래 사용하지 않은 항목부터 삭제)
+EXTRACTION_CACHE_MAX_MB: int = _get_env_int("TC_CACHE_MAX_MB", 256)
+
+
+# ============================================================
+# 청크 실행 시간 기록 설정 (timing_store.py, output/.stats/)
+# ============================================================
+
+# 청크별 실제 소요 시간 기록 및 청크 분할 비용 모델 추정 사용 여부
+TIMING_STATS_ENABLED: bool = _get_env_str("TC_TIMING_STATS_ENABLED", "true").lower() == "true"
+
+# 비용 모델 추정에 필요한 최소 청크 기록 수 (미만이면 기본 계수 사용)
+TIMING_MIN_RUNS: int = _get_env_int("TC_TIMING_MIN_RUNS", 8)
+
+# 비용 모델 추정에 사용할 최근 청크 기록 수
+TIMING_HISTORY_LIMIT: int = _get_env_int("TC_TIMING_HISTORY_LIMIT", 500)
+
+# 추정 계수를 사용할 기록 대비 평균 오차 한도 (%, 이상이면 기본 계수 사용)
+TIMING_MAX_ERROR_PCT: int = _get_env_int("TC_TIMING_MAX_ERROR_PCT", 50)
+
+
+# ============================================================
+# 청크 병합 감시 설정 (merge_tc_chunks.py --watch)
+# ============================================================
+
+# tc_chunk_*.json 도착 확인 간격 (밀리초)
+MERGE_WATCH_POLL_MS: int = _get_env_int("TC_MERGE_WATCH_POLL_MS", 200)
+
+# 모든 청크를 기다리는 최대 시간 (초, 0이면 제한 없음)
+MERGE_WATCH_TIMEOUT_SEC: int = _get_env_int("TC_MERGE_WATCH_TIMEOUT_SEC", 3600)
+
+
+# ============================================================
+# 조합 테스트 설정
+# ============================================================
+
+# 전체 조합 목록 최대 크기 (generate_all_combinations, 초과 시 거부 또는 표본 추출)
+COMBINATION_BUDGET: int = _get_env_int("TC_COMBINATION_BUDGET", 10000)
+
+
 # ============================================================
 # 설정 출력 (디버깅용)
 # ============================================================
@@ -236,6 +299,8 @@ def print_config():
     print(f"MAX_COMPONENTS_PER_CHUNK: {MAX_COMPONENTS_PER_CHUNK}")
     print(f"MAX_PARALLEL_AGENTS:    {MAX_PARALLEL_AGENTS}")
     print(f"MIN_CHUNKS:             {MIN_CHUNKS}")
+    print(f"CHUNK_PLANNER:          {CHUNK_PLANNER}")
+    print(f"CHUNK_TARGET_SEC:       {CHUNK_TARGET_SEC}")
     print(f"DEFAULT_TC_PREFIX:      {DEFAULT_TC_PREFIX}")
     print(f"FULLPAGE_WIDTH:         {FULLPAGE_WIDTH}")
     print(f"FULLPAGE_HEIGHT:        {FULLPAGE_HEIGHT}")
@@ -247,6 +312,17 @@ def print_config():
     print(f"REF_MAP_TCS_PER_CHUNK:  {REF_MAP_TCS_PER_CHUNK}")
     print(f"REF_MAP_MAX_AGENTS:     {REF_MAP_MAX_AGENTS}")
     print(f"REF_MAP_CONFIDENCE_THRESHOLD: {REF_MAP_CONFIDENCE_THRESHOLD}")
+    print("-" * 60)
+    print(f"EXTRACTION_CACHE_ENABLED: {EXTRACTION_CACHE_ENABLED}")
+    print(f"EXTRACTION_CACHE_MAX_MB: {EXTRACTION_CACHE_MAX_MB}")
+    print("-" * 60)
+    print(f"TIMING_STATS_ENABLED:   {TIMING_STATS_ENABLED}")
+    print(f"TIMING_MIN_RUNS:        {TIMING_MIN_RUNS}")
+    print(f"TIMING_MAX_ERROR_PCT:   {TIMING_MAX_ERROR_PCT}")
+    print(f"MERGE_WATCH_POLL_MS:    {MERGE_WATCH_POLL_MS}")
+    print(f"MERGE_WATCH_TIMEOUT_SEC: {MERGE_WATCH_TIMEOUT_SEC}")
+    print("-" * 60)
+    print(f"COMBINATION_BUDGET:     {COMBINATION_BUDGET}")
     print("=" * 60)
 
 
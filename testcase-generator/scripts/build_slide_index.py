@@ -24,6 +24,8 @@ try:
 except ImportError:
     OUTPUT_DIR = Path(__file__).resolve().parent.parent.parent / "output"
 
+from extraction_cache import open_cache
+
 
 # 불용어 (키워드 인덱스에서 제외)
 STOP_WORDS = {
@@ -152,8 +154,15 @@ def build_section_map(slides_index: Dict[str, Dict]) -> Dict[str, List[int]]:
 def build_slide_index(
     pptx_data_path: Path,
     output_path: Path = None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
-    """슬라이드 인덱스 생성 메인 함수"""
+    """슬라이드 인덱스 생성 메인 함수
+
+    Args:
+        pptx_data_path: pptx_data.json 경로
+        output_path: 출력 경로 (기본: pptx_data.json과 같은 폴더의 slide_index.json)
+        use_cache: 슬라이드 엔트리 캐시 사용 여부 (output/.cache/)
+    """
     print("=" * 60)
     print("  슬라이드 인덱스 생성")
     print("=" * 60)
@@ -166,12 +175,29 @@ def build_slide_index(
     slides = pptx_data.get("slides", [])
     print(f"  총 {len(slides)}개 슬라이드")
 
-    # 슬라이드별 인덱스 엔트리 생성
+    if output_path is None:
+        output_path = pptx_data_path.parent / "slide_index.json"
+
+    # 슬라이드별 인덱스 엔트리 생성 (슬라이드 내용이 같으면 캐시 사용)
     print("슬라이드 인덱스 구축...")
+    cache = open_cache(output_path.resolve().parent) if use_cache else None
     slides_index = {}
     for slide in slides:
         slide_num = slide.get("slide_number", 0)
-        slides_index[str(slide_num)] = build_slide_entry(slide)
+        if cache is None:
+            slides_index[str(slide_num)] = build_slide_entry(slide)
+            continue
+
+        key = cache.make_key("slide_index", json.dumps(slide, ensure_ascii=False, sort_keys=True))
+        entry = cache.get(key)
+        if entry is None:
+            entry = build_slide_entry(slide)
+            cache.put(key, entry)
+        slides_index[str(slide_num)] = entry
+
+    if cache:
+        cache.evict()
+        print(f"  슬라이드 캐시: {cache.summary()}")
 
     # 역방향 인덱스 구축
     print("키워드 인덱스 구축...")
@@ -191,9 +217,6 @@ def build_slide_index(
     }
 
     # 저장
-    if output_path is None:
-        output_path = pptx_data_path.parent / "slide_index.json"
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
@@ -216,12 +239,14 @@ def main():
         print()
         print("Options:")
         print("  --output <path>   출력 파일 경로 (기본: output/slide_index.json)")
+        print("  --no-cache        슬라이드 캐시(output/.cache/) 사용 안 함")
         sys.exit(1)
 
     pptx_data_path = Path(sys.argv[1])
 
     # 옵션 파싱
     output_path = None
+    use_cache = True
 
     args = sys.argv[2:]
     i = 0
@@ -229,6 +254,9 @@ def main():
         if args[i] == "--output" and i + 1 < len(args):
             output_path = Path(args[i + 1])
             i += 2
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
         else:
             i += 1
 
@@ -236,7 +264,7 @@ def main():
         print(f"Error: File not found: {pptx_data_path}")
         sys.exit(1)
 
-    build_slide_index(pptx_data_path, output_path)
+    build_slide_index(pptx_data_path, output_path, use_cache)
 
 
 if __name__ == "__main__":
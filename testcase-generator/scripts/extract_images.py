@@ -18,6 +18,7 @@ PPTX 화면정의서에서 이미지를 추출하는 스크립트
 """
 
 import argparse
+import io
 import json
 import sys
 import shutil
@@ -26,6 +27,28 @@ from datetime import datetime
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 
+from pptx_reader import (
+    ENGINES,
+    DEFAULT_ENGINE,
+    open_package,
+    list_slide_parts,
+    read_relationships,
+    iter_slide_pictures,
+    emu_to_inches,
+)
+from extraction_cache import open_cache
+
+
+# PIL 이미지 포맷 → 컨텐츠 타입 (python-pptx Image.content_type과 동일)
+PIL_FORMAT_CONTENT_TYPES = {
+    "BMP": "image/bmp",
+    "GIF": "image/gif",
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "TIFF": "image/tiff",
+    "WMF": "image/x-wmf",
+}
+
 
 def check_win32com_available() -> bool:
     """win32com 사용 가능 여부 확인 (pywin32 + PowerPoint 설치 필요)"""
@@ -64,6 +87,7 @@ def create_gitignore(output_dir: Path):
 images/
 image_manifest.json
 image_analysis.json
+.cache/
 *.png
 *.jpg
 *.jpeg
@@ -221,17 +245,166 @@ def export_slides_fullpage(pptx_path: Path, output_dir: Path,
     return fullpage_images
 
 
-def extract_images_from_pptx(pptx_path: Path, output_dir: Path) -> dict:
+def _iter_pictures_pptx(pptx_path: Path):
+    """python-pptx로 (슬라이드 번호, 그림 shape) 순회 (기준 구현)"""
+    prs = Presentation(str(pptx_path))
+    for slide_num, slide in enumerate(prs.slides, 1):
+        for shape in slide.shapes:
+            # 이미지 shape 확인
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                yield slide_num, shape
+
+
+def _iter_pictures_fast(pptx_path: Path):
+    """zip을 한 번만 열어 (슬라이드 번호, 그림 레코드) 순회"""
+    with open_package(pptx_path) as zf:
+        for slide_num, part_name in enumerate(list_slide_parts(zf), 1):
+            for record in iter_slide_pictures(zf, part_name):
+                yield slide_num, record
+
+
+def _read_picture_pptx(shape) -> dict:
+    """python-pptx 그림 shape에서 이미지 데이터/위치 읽기"""
+    image = shape.image
+
+    # 이미지 크기 정보 (shape의 크기)
+    width = shape.width.inches if hasattr(shape.width, 'inches') else 0
+    height = shape.height.inches if hasattr(shape.height, 'inches') else 0
+
+    # 위치 정보
+    left = shape.left.inches if hasattr(shape.left, 'inches') else 0
+    top = shape.top.inches if hasattr(shape.top, 'inches') else 0
+
+    return {
+        "blob": image.blob,
+        "content_type": image.content_type,
+        "width": width,
+        "height": height,
+        "left": left,
+        "top": top,
+    }
+
+
+def _read_picture_fast(record: dict) -> dict:
+    """스트리밍 그림 레코드에서 이미지 데이터/위치 읽기"""
+    blob = record["blob"]
+    if blob is None:
+        raise ValueError("no embedded image")
+
+    # python-pptx와 동일하게 실제 이미지 바이트로 포맷 판별
+    from PIL import Image as PILImage
+    with PILImage.open(io.BytesIO(blob)) as pil_image:
+        image_format = pil_image.format
+    if image_format not in PIL_FORMAT_CONTENT_TYPES:
+        raise ValueError(f"unsupported image format: {image_format}")
+
+    return {
+        "blob": blob,
+        "content_type": PIL_FORMAT_CONTENT_TYPES[image_format],
+        "width": emu_to_inches(record["width"]),
+        "height": emu_to_inches(record["height"]),
+        "left": emu_to_inches(record["left"]),
+        "top": emu_to_inches(record["top"]),
+    }
+
+
+def _save_picture(picture_data: dict, slide_num: int, index: int, images_dir: Path) -> dict:
+    """이미지 파일 저장 후 manifest 항목 반환"""
+    content_type = picture_data["content_type"]
+    extension = get_image_extension(content_type)
+
+    # 파일명 생성
+    filename = f"slide_{slide_num:02d}_image_{index:02d}{extension}"
+    image_path = images_dir / filename
+
+    # 이미지 저장
+    with open(image_path, "wb") as f:
+        f.write(picture_data["blob"])
+
+    return {
+        "filename": filename,
+        "path": str(image_path.resolve()),
+        "slide_number": slide_num,
+        "image_index": index,
+        "content_type": content_type,
+        "size": {
+            "width_inches": round(picture_data["width"], 2),
+            "height_inches": round(picture_data["height"], 2)
+        },
+        "position": {
+            "left_inches": round(picture_data["left"], 2),
+            "top_inches": round(picture_data["top"], 2)
+        },
+        "analysis": None  # Claude Code 분석 후 채워짐
+    }
+
+
+def _slide_images_cache_key(zf, slide_num: int, part_name: str, cache) -> str:
+    """슬라이드 이미지 캐시 키 (슬라이드 XML + 관계 + 참조 미디어 내용)"""
+    parts = [slide_num, zf.read(part_name)]
+    for rel_target in sorted(set(read_relationships(zf, part_name).values())):
+        if rel_target.startswith("ppt/media/") and rel_target in zf.NameToInfo:
+            parts.extend([rel_target, zf.read(rel_target)])
+    return cache.make_key("images", *parts)
+
+
+def _extract_images_fast_cached(pptx_path: Path, images_dir: Path, cache) -> list:
+    """fast 엔진 + 캐시: 변경된 슬라이드만 이미지 판별/추출
+
+    캐시 적중 시에는 저장해 둔 manifest 항목을 그대로 쓰고,
+    이미지 파일이 없거나 크기가 다를 때만 zip에서 다시 꺼내 씁니다.
+    """
+    images = []
+    with open_package(pptx_path) as zf:
+        for slide_num, part_name in enumerate(list_slide_parts(zf), 1):
+            key = _slide_images_cache_key(zf, slide_num, part_name, cache)
+            cached = cache.get(key)
+
+            if cached is not None:
+                for entry in cached:
+                    image_info = dict(entry["image_info"])
+                    image_path = images_dir / image_info["filename"]
+                    blob_size = zf.getinfo(entry["part_name"]).file_size
+                    if not image_path.exists() or image_path.stat().st_size != blob_size:
+                        with open(image_path, "wb") as f:
+                            f.write(zf.read(entry["part_name"]))
+                    image_info["path"] = str(image_path.resolve())
+                    images.append(image_info)
+                continue
+
+            entries = []
+            index = 0
+            for record in iter_slide_pictures(zf, part_name):
+                try:
+                    image_info = _save_picture(_read_picture_fast(record), slide_num, index, images_dir)
+                except Exception as e:
+                    print(f"  [경고] 슬라이드 {slide_num} 이미지 추출 실패: {e}")
+                    continue
+                images.append(image_info)
+                cached_info = {k: v for k, v in image_info.items() if k != "path"}
+                entries.append({"part_name": record["part_name"], "image_info": cached_info})
+                index += 1
+
+            cache.put(key, entries)
+
+    return images
+
+
+def extract_images_from_pptx(pptx_path: Path, output_dir: Path,
+                             engine: str = DEFAULT_ENGINE, cache=None) -> dict:
     """PPTX에서 모든 이미지를 추출하여 저장
 
     Args:
         pptx_path: PPTX 파일 경로
         output_dir: 출력 폴더 경로
+        engine: "fast" (zip 스트리밍) 또는 "pptx" (python-pptx 기준 구현)
+        cache: 슬라이드 추출 캐시 (ExtractionCache, fast 엔진 전용, None이면 미사용)
 
     Returns:
         image_manifest: 추출된 이미지 목록과 메타데이터
     """
-    prs = Presentation(str(pptx_path))
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 엔진: {engine} (사용 가능: {', '.join(ENGINES)})")
 
     # 이미지 출력 폴더 생성
     images_dir = output_dir / "images"
@@ -247,59 +420,33 @@ def extract_images_from_pptx(pptx_path: Path, output_dir: Path) -> dict:
         "images": []
     }
 
+    if engine == "fast" and cache is not None:
+        manifest["images"] = _extract_images_fast_cached(pptx_path, images_dir, cache)
+        manifest["total_images"] = len(manifest["images"])
+        return manifest
+
+    if engine == "fast":
+        pictures = _iter_pictures_fast(pptx_path)
+        read_picture = _read_picture_fast
+    else:
+        pictures = _iter_pictures_pptx(pptx_path)
+        read_picture = _read_picture_pptx
+
     image_count = 0
+    slide_image_index = {}
 
-    for slide_num, slide in enumerate(prs.slides, 1):
-        slide_image_index = 0
+    for slide_num, picture in pictures:
+        index = slide_image_index.get(slide_num, 0)
 
-        for shape in slide.shapes:
-            # 이미지 shape 확인
-            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                try:
-                    image = shape.image
-                    content_type = image.content_type
-                    extension = get_image_extension(content_type)
-
-                    # 파일명 생성
-                    filename = f"slide_{slide_num:02d}_image_{slide_image_index:02d}{extension}"
-                    image_path = images_dir / filename
-
-                    # 이미지 저장
-                    with open(image_path, "wb") as f:
-                        f.write(image.blob)
-
-                    # 이미지 크기 정보 (shape의 크기)
-                    width = shape.width.inches if hasattr(shape.width, 'inches') else 0
-                    height = shape.height.inches if hasattr(shape.height, 'inches') else 0
-
-                    # 위치 정보
-                    left = shape.left.inches if hasattr(shape.left, 'inches') else 0
-                    top = shape.top.inches if hasattr(shape.top, 'inches') else 0
-
-                    # manifest에 추가
-                    image_info = {
-                        "filename": filename,
-                        "path": str(image_path.resolve()),
-                        "slide_number": slide_num,
-                        "image_index": slide_image_index,
-                        "content_type": content_type,
-                        "size": {
-                            "width_inches": round(width, 2),
-                            "height_inches": round(height, 2)
-                        },
-                        "position": {
-                            "left_inches": round(left, 2),
-                            "top_inches": round(top, 2)
-                        },
-                        "analysis": None  # Claude Code 분석 후 채워짐
-                    }
-                    manifest["images"].append(image_info)
+        try:
+            image_info = _save_picture(read_picture(picture), slide_num, index, images_dir)
+            manifest["images"].append(image_info)
 
-                    image_count += 1
-                    slide_image_index += 1
+            image_count += 1
+            slide_image_index[slide_num] = index + 1
 
-                except Exception as e:
-                    print(f"  [경고] 슬라이드 {slide_num} 이미지 추출 실패: {e}")
+        except Exception as e:
+            print(f"  [경고] 슬라이드 {slide_num} 이미지 추출 실패: {e}")
 
     manifest["total_images"] = image_count
 
@@ -317,13 +464,17 @@ def save_manifest(manifest: dict, output_dir: Path):
 
 
 def extract_and_save_images(pptx_path: str, output_dir: str = None,
-                            no_fullpage: bool = False) -> dict:
+                            no_fullpage: bool = False,
+                            engine: str = DEFAULT_ENGINE,
+                            use_cache: bool = True) -> dict:
     """PPTX에서 이미지 추출 및 저장 (메인 함수)
 
     Args:
         pptx_path: PPTX 파일 경로
         output_dir: 출력 폴더 경로 (기본: ./output)
         no_fullpage: True이면 fullpage 캡처 건너뜀
+        engine: 개별 이미지 추출 엔진 ("fast" 또는 "pptx")
+        use_cache: 슬라이드 캐시 사용 여부 (output/.cache/, fast 엔진 전용)
 
     Returns:
         manifest: 추출 결과 정보
@@ -349,7 +500,11 @@ def extract_and_save_images(pptx_path: str, output_dir: str = None,
 
     # 개별 이미지 추출
     print(f"  PPTX 파일: {pptx_path}")
-    manifest = extract_images_from_pptx(pptx_path, output_path)
+    cache = open_cache(output_path) if use_cache and engine == "fast" else None
+    manifest = extract_images_from_pptx(pptx_path, output_path, engine=engine, cache=cache)
+    if cache:
+        cache.evict()
+        print(f"  슬라이드 캐시: {cache.summary()}")
 
     # Fullpage 슬라이드 캡처
     if no_fullpage:
@@ -442,6 +597,19 @@ def main():
         help="슬라이드 전체 캡처(fullpage) 건너뛰기"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="슬라이드 추출 캐시(output/.cache/) 사용 안 함"
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help=f"개별 이미지 추출 엔진 (기본값: {DEFAULT_ENGINE})"
+    )
+
     args = parser.parse_args()
 
     # cleanup 모드
@@ -465,7 +633,9 @@ def main():
         manifest = extract_and_save_images(
             pptx_path=args.pptx_file,
             output_dir=args.output_dir,
-            no_fullpage=args.no_fullpage
+            no_fullpage=args.no_fullpage,
+            engine=args.engine,
+            use_cache=not args.no_cache
         )
 
         print()
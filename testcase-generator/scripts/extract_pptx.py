@@ -4,13 +4,25 @@
 PPTX 화면정의서에서 컴포넌트 정보를 추출하는 스크립트
 """
 
+import io
 import json
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt
 
+from pptx_reader import (
+    ENGINES,
+    DEFAULT_ENGINE,
+    open_package,
+    list_slide_parts,
+    read_slide_content,
+)
+from extraction_cache import open_cache
+
 
 def extract_table_data(table):
     """테이블에서 데이터 추출"""
@@ -161,16 +173,8 @@ def parse_raw_text_to_components(raw_texts, slide_number):
     return components
 
 
-def extract_slide_info(slide, slide_number):
-    """슬라이드에서 정보 추출"""
-    slide_info = {
-        "slide_number": slide_number,
-        "header": {},
-        "components": [],
-        "section_title": "",
-        "raw_text": []
-    }
-
+def collect_slide_content(slide):
+    """python-pptx 슬라이드에서 테이블과 텍스트 목록 수집"""
     tables = []
     text_content = []
 
@@ -184,7 +188,31 @@ def extract_slide_info(slide, slide_number):
         text = extract_text_from_shape(shape)
         if text:
             text_content.append(text)
-            slide_info["raw_text"].append(text)
+
+    return tables, text_content
+
+
+def extract_slide_info(slide, slide_number):
+    """슬라이드에서 정보 추출"""
+    tables, text_content = collect_slide_content(slide)
+    return build_slide_info(tables, text_content, slide_number)
+
+
+def extract_slide_info_from_xml(slide_xml, slide_number):
+    """슬라이드 XML에서 정보 추출 (fast 엔진)"""
+    tables, text_content = read_slide_content(slide_xml)
+    return build_slide_info(tables, text_content, slide_number)
+
+
+def build_slide_info(tables, text_content, slide_number):
+    """수집된 테이블/텍스트로 slide_info 구성 (엔진 공통)"""
+    slide_info = {
+        "slide_number": slide_number,
+        "header": {},
+        "components": [],
+        "section_title": "",
+        "raw_text": list(text_content)
+    }
 
     # 테이블 분석
     for table in tables:
@@ -218,20 +246,110 @@ def extract_slide_info(slide, slide_number):
     return slide_info
 
 
-def extract_pptx(pptx_path):
-    """PPTX 파일에서 전체 정보 추출"""
+def _extract_slides_pptx(pptx_path):
+    """python-pptx 객체 모델로 슬라이드 정보 추출 (기준 구현)"""
     prs = Presentation(pptx_path)
+    return [extract_slide_info(slide, i) for i, slide in enumerate(prs.slides, 1)]
+
+
+def _extract_slide_shard(pptx_path, shard):
+    """슬라이드 파트 묶음 추출 (워커 프로세스용, 각자 zip을 연다)
+
+    Args:
+        pptx_path: PPTX 파일 경로
+        shard: [(slide_number, part_name), ...]
+
+    Returns:
+        slide_info 목록
+    """
+    slides = []
+    with open_package(pptx_path) as zf:
+        for slide_number, part_name in shard:
+            with zf.open(part_name) as f:
+                slides.append(extract_slide_info_from_xml(f, slide_number))
+    return slides
+
+
+def _parse_slide_parts(pptx_path, slide_parts, workers=1):
+    """슬라이드 파트 목록 파싱 (workers > 1이면 프로세스 풀 사용)
+
+    슬라이드 파트를 워커 수만큼 나눠 프로세스 풀에서 파싱한 뒤
+    슬라이드 번호 순으로 다시 조립합니다 (직렬 실행과 동일한 결과).
+    """
+    workers = min(workers, len(slide_parts))
+    if workers <= 1:
+        return _extract_slide_shard(pptx_path, slide_parts)
+
+    # 슬라이드 크기 편차를 고르게 나누기 위해 번갈아 배분 (1, N+1, 2N+1, ...)
+    shards = [slide_parts[i::workers] for i in range(workers)]
+
+    slides = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard_slides in executor.map(_extract_slide_shard, repeat(str(pptx_path)), shards):
+            slides.extend(shard_slides)
+
+    slides.sort(key=lambda slide: slide["slide_number"])
+    return slides
+
+
+def _extract_slides_fast(pptx_path, workers=1, cache=None):
+    """zip + iterparse 스트리밍으로 슬라이드 정보 추출
+
+    cache가 있으면 슬라이드 XML 해시가 같은 슬라이드는 캐시에서 가져오고
+    변경된 슬라이드만 파싱합니다.
+    """
+    with open_package(pptx_path) as zf:
+        slide_parts = list(enumerate(list_slide_parts(zf), 1))
+
+        if cache is None:
+            return _parse_slide_parts(pptx_path, slide_parts, workers)
+
+        slides_by_number = {}
+        keys = {}
+        pending = []
+        for slide_number, part_name in slide_parts:
+            # slide_info에 슬라이드 번호가 들어가므로 키에 포함
+            key = cache.make_key("slide", slide_number, zf.read(part_name))
+            cached = cache.get(key)
+            if cached is None:
+                keys[slide_number] = key
+                pending.append((slide_number, part_name))
+            else:
+                slides_by_number[slide_number] = cached
+
+    for slide_info in _parse_slide_parts(pptx_path, pending, workers):
+        cache.put(keys[slide_info["slide_number"]], slide_info)
+        slides_by_number[slide_info["slide_number"]] = slide_info
+
+    return [slides_by_number[slide_number] for slide_number, _ in slide_parts]
+
+
+def extract_pptx(pptx_path, engine=DEFAULT_ENGINE, workers=1, cache=None):
+    """PPTX 파일에서 전체 정보 추출
+
+    Args:
+        pptx_path: PPTX 파일 경로
+        engine: "fast" (zip 스트리밍) 또는 "pptx" (python-pptx 기준 구현)
+        workers: 슬라이드 병렬 파싱 프로세스 수 (fast 엔진 전용, 1이면 직렬)
+        cache: 슬라이드 추출 캐시 (ExtractionCache, fast 엔진 전용, None이면 미사용)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 엔진: {engine} (사용 가능: {', '.join(ENGINES)})")
+
+    if workers > 1 and engine != "fast":
+        raise ValueError("--workers 옵션은 fast 엔진에서만 사용할 수 있습니다.")
+
+    if engine == "fast":
+        slides = _extract_slides_fast(pptx_path, workers, cache)
+    else:
+        slides = _extract_slides_pptx(pptx_path)
 
     result = {
         "file_path": str(pptx_path),
-        "total_slides": len(prs.slides),
-        "slides": []
+        "total_slides": len(slides),
+        "slides": slides
     }
 
-    for i, slide in enumerate(prs.slides, 1):
-        slide_info = extract_slide_info(slide, i)
-        result["slides"].append(slide_info)
-
     # 프로젝트 정보 집계
     for slide in result["slides"]:
         if slide["header"]:
@@ -239,31 +357,132 @@ def extract_pptx(pptx_path):
             break
 
     # 전체 컴포넌트 집계
-    all_components = []
-    for slide in result["slides"]:
+    result["all_components"] = list(iter_all_components(result["slides"]))
+
+    return result
+
+
+def iter_all_components(slides, counts=None):
+    """슬라이드 순서대로 컴포넌트를 yield (slide_number, section 부여)
+
+    Args:
+        slides: slide_info 이터러블 (제너레이터 가능)
+        counts: 지정 시 "total_slides", "total_components"를 소비하면서 집계
+    """
+    for slide in slides:
+        if counts is not None:
+            counts["total_slides"] = counts.get("total_slides", 0) + 1
         for comp in slide["components"]:
             comp["slide_number"] = slide["slide_number"]
             comp["section"] = slide["section_title"]
-            all_components.append(comp)
-
-    result["all_components"] = all_components
+            if counts is not None:
+                counts["total_components"] = counts.get("total_components", 0) + 1
+            yield comp
+
+
+def iter_slides(pptx_path, engine=DEFAULT_ENGINE, cache=None):
+    """슬라이드 정보를 슬라이드 번호 순으로 하나씩 추출 (스트리밍)
+
+    fast 엔진은 zip에서 슬라이드 파트를 하나씩 읽어 파싱하므로 전체 슬라이드를
+    메모리에 올리지 않습니다. cache가 있으면 _extract_slides_fast와 같은 키로
+    캐시를 조회/저장합니다. pptx 엔진은 기준 구현이라 프레젠테이션 전체를 엽니다.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 엔진: {engine} (사용 가능: {', '.join(ENGINES)})")
+
+    if engine != "fast":
+        prs = Presentation(pptx_path)
+        for i, slide in enumerate(prs.slides, 1):
+            yield extract_slide_info(slide, i)
+        return
+
+    with open_package(pptx_path) as zf:
+        for slide_number, part_name in enumerate(list_slide_parts(zf), 1):
+            if cache is None:
+                with zf.open(part_name) as f:
+                    yield extract_slide_info_from_xml(f, slide_number)
+                continue
+
+            slide_xml = zf.read(part_name)
+            key = cache.make_key("slide", slide_number, slide_xml)
+            slide_info = cache.get(key)
+            if slide_info is None:
+                slide_info = extract_slide_info_from_xml(io.BytesIO(slide_xml), slide_number)
+                cache.put(key, slide_info)
+            yield slide_info
+
+
+def stream_pptx(pptx_path, engine=DEFAULT_ENGINE, cache=None):
+    """PPTX 스트리밍 추출: (project_info, 슬라이드 이터레이터)
+
+    TC 생성에 project_info가 먼저 필요하므로 헤더가 있는 첫 슬라이드까지만
+    미리 읽어 두고, 나머지 슬라이드는 이터레이터를 소비할 때 추출합니다.
+    (헤더 슬라이드가 없으면 전체 슬라이드를 미리 읽게 됩니다.)
+    """
+    slides = iter_slides(pptx_path, engine, cache)
+    buffered = []
+    project_info = {}
+    for slide in slides:
+        buffered.append(slide)
+        if slide["header"]:
+            project_info = slide["header"]
+            break
 
-    return result
+    return project_info, chain(buffered, slides)
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python extract_pptx.py <pptx_file> [output_json]")
+        print("Usage: python extract_pptx.py <pptx_file> [output_json] [--engine fast|pptx] [--workers N] [--no-cache]")
         sys.exit(1)
 
-    pptx_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+    # 옵션 파싱
+    engine = DEFAULT_ENGINE
+    workers = 1
+    use_cache = True
+    positional = []
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--engine" and i + 1 < len(args):
+            engine = args[i + 1]
+            i += 2
+        elif args[i] == "--workers" and i + 1 < len(args):
+            workers = int(args[i + 1])
+            i += 2
+        elif args[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        else:
+            positional.append(args[i])
+            i += 1
+
+    if not positional:
+        print("Usage: python extract_pptx.py <pptx_file> [output_json] [--engine fast|pptx] [--workers N] [--no-cache]")
+        sys.exit(1)
+
+    pptx_path = Path(positional[0])
+    output_path = Path(positional[1]) if len(positional) > 1 else None
+
+    if engine not in ENGINES:
+        print(f"Error: Unknown engine: {engine} (choose from: {', '.join(ENGINES)})")
+        sys.exit(1)
+
+    if workers > 1 and engine != "fast":
+        print("Error: --workers requires --engine fast")
+        sys.exit(1)
 
     if not pptx_path.exists():
         print(f"Error: File not found: {pptx_path}")
         sys.exit(1)
 
-    result = extract_pptx(pptx_path)
+    # 캐시는 출력 파일이 있을 때만 사용 (output/.cache/), stdout 출력 시에는 사용 안 함
+    cache = None
+    if output_path and engine == "fast" and use_cache:
+        cache = open_cache(output_path.resolve().parent)
+
+    result = extract_pptx(pptx_path, engine=engine, workers=workers, cache=cache)
 
     output_json = json.dumps(result, ensure_ascii=False, indent=2)
 
@@ -271,6 +490,9 @@ def main():
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(output_json)
         print(f"Output saved to: {output_path}")
+        if cache:
+            cache.evict()
+            print(f"Slide cache: {cache.summary()}")
     else:
         print(output_json)
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+슬라이드 단위 추출 결과 디스크 캐시 (content-addressed)
+
+같은 화면정의서를 하루에도 여러 번 다시 돌리는데, 실제로 바뀌는 슬라이드는 몇 장뿐입니다.
+슬라이드 XML(+ 관련 미디어) 내용의 SHA-256을 키로 추출 결과를 저장해 두고
+내용이 같은 슬라이드는 다시 파싱하지 않고 캐시에서 꺼내 씁니다.
+
+저장 구조:
+    output/.cache/<키 앞 2자리>/<키>.json
+
+- 키에 캐시 포맷 버전과 용도(namespace)를 포함하므로 추출 로직이 바뀌면 버전만 올리면 됨
+- 조회 시 파일 수정 시각을 갱신하여 LRU 순서 유지
+- 최대 크기 초과 시 가장 오래 사용하지 않은 항목부터 삭제
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+# 중앙 설정에서 가져오기
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    from config import EXTRACTION_CACHE_ENABLED, EXTRACTION_CACHE_MAX_MB
+except ImportError:
+    EXTRACTION_CACHE_ENABLED = True
+    EXTRACTION_CACHE_MAX_MB = 256
+
+
+# 추출 결과 형식이 바뀌면 올려서 기존 캐시 무효화
+CACHE_FORMAT_VERSION = "1"
+
+# 출력 폴더 아래 캐시 폴더명
+CACHE_DIR_NAME = ".cache"
+
+
+class ExtractionCache:
+    """슬라이드 추출 결과 캐시
+
+    사용 예:
+        with ExtractionCache(output_dir / ".cache") as cache:
+            key = cache.make_key("slide", slide_number, slide_xml)
+            slide_info = cache.get(key)
+            if slide_info is None:
+                slide_info = extract(...)
+                cache.put(key, slide_info)
+        print(cache.summary())
+    """
+
+    def __init__(self, cache_dir: Path, max_mb: int = EXTRACTION_CACHE_MAX_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_mb * 1024 * 1024
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.evict()
+        return False
+
+    @staticmethod
+    def make_key(namespace: str, *parts: Any) -> str:
+        """캐시 키 생성 (포맷 버전 + 용도 + 각 내용의 SHA-256)
+
+        Args:
+            namespace: 캐시 용도 (예: "slide", "images", "slide_index")
+            parts: 키에 포함할 내용 (bytes, str, int)
+        """
+        digest = hashlib.sha256()
+        for part in (CACHE_FORMAT_VERSION, namespace) + parts:
+            if not isinstance(part, (bytes, bytearray)):
+                part = str(part).encode("utf-8")
+            # 길이 접두사로 경계 구분 ("ab"+"c" 와 "a"+"bc" 충돌 방지)
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        path = self._path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+
+        # LRU: 사용 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.stats["hits"] += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """캐시 저장 (임시 파일에 쓴 뒤 교체하여 부분 기록 방지)"""
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def evict(self) -> int:
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        total_size = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        if total_size <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            evicted += 1
+
+        self.stats["evictions"] += evicted
+        return evicted
+
+    def summary(self) -> str:
+        """hit/miss 요약 문자열"""
+        total = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / total if total else 0.0
+        text = f"hit {self.stats['hits']} / miss {self.stats['misses']} ({hit_rate:.0%})"
+        if self.stats["evictions"]:
+            text += f", 삭제 {self.stats['evictions']}"
+        return text
+
+
+def open_cache(output_dir: Path, enabled: bool = EXTRACTION_CACHE_ENABLED) -> Optional[ExtractionCache]:
+    """출력 폴더 기준 캐시 생성 (비활성화면 None)"""
+    if not enabled:
+        return None
+    return ExtractionCache(Path(output_dir) / CACHE_DIR_NAME)
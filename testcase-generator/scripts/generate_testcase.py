@@ -14,9 +14,16 @@
 import json
 import sys
 import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict
+from types import MappingProxyType
+from typing import List, Optional, Dict, Iterable, Iterator, Sequence, Tuple
+
+from regex_trie import trie_pattern
 
 
 @dataclass
@@ -265,17 +272,263 @@ COMPONENT_TYPE_KEYWORDS = {
     "popup": ["popup", "modal", "dialog", "팝업", "모달", "알림", "창"]
 }
 
+# Title 형식 결정용 컴포넌트 유형 키워드 (generate_detailed_title 분기 순서)
+TITLE_TYPE_KEYWORDS = {
+    "button": ["button", "btn", "버튼"],
+    "input": ["input", "field", "필드", "입력"],
+    "list": ["list", "table", "grid", "목록"],
+    "popup": ["popup", "modal", "dialog", "팝업"],
+}
+
+# 특수 Pre-condition 키워드 (PRECONDITION_BY_TYPE 키 → 컴포넌트 이름 키워드, 위쪽이 우선)
+PRECONDITION_KEYWORDS = {
+    "undo": ["undo", "실행취소"],
+    "redo": ["redo", "다시실행"],
+    "minimize": ["minimize", "최소화"],
+    "maximize": ["maximize", "최대화"],
+}
+
+# 기능 TC의 동작 키워드 (Test Step / Expected Result 분기, 위쪽이 우선)
+ACTION_KEYWORDS = {
+    "minimize": ["minimize", "최소화"],
+    "maximize": ["maximize", "최대화"],
+    "close": ["close", "닫기"],
+    "save": ["save", "저장"],
+    "cancel": ["cancel", "취소"],
+    "search": ["search", "검색"],
+    "delete": ["delete", "삭제"],
+    "add": ["add", "추가"],
+    "refresh": ["refresh", "새로고침"],
+    "back": ["back", "뒤로"],
+    "undo": ["undo", "실행취소"],
+    "redo": ["redo", "다시실행"],
+}
+
+# Title 접미사 제거 패턴
+BUTTON_SUFFIX_RE = re.compile(r'(Button|Btn|버튼)\s*$', re.IGNORECASE)
+FIELD_SUFFIX_RE = re.compile(r'(Input|Field|필드|입력)\s*$', re.IGNORECASE)
+LIST_SUFFIX_RE = re.compile(r'(List|Table|Grid|목록)\s*$', re.IGNORECASE)
+POPUP_SUFFIX_RE = re.compile(r'(Popup|Modal|Dialog|팝업)\s*$', re.IGNORECASE)
+SHORTCUT_RE = re.compile(r'(Ctrl\s*\+\s*\w+|Alt\s*\+\s*\w+|F\d+)', re.IGNORECASE)
+TITLE_SHORTCUT_RE = re.compile(r'(Ctrl\s*\+\s*\w+|F\d+)', re.IGNORECASE)
+
+
+class KeywordMatcher:
+    """여러 키워드 테이블을 하나의 패턴으로 컴파일한 다중 키워드 매처
+
+    테이블마다 (키워드 목록, 값) 항목을 우선순위 순서로 받습니다.
+    scan()은 텍스트를 한 번만 훑어 테이블별로 우선순위가 가장 높은(앞쪽) 항목의 값을 돌려주므로,
+    테이블을 앞에서부터 `keyword in text`로 검사해 첫 일치를 고르던 방식과 결과가 같습니다.
+
+    모든 키워드를 하나의 트라이로 묶어 정규식으로 컴파일하므로 텍스트 스캔은 re 엔진(C)에서 수행됩니다.
+    각 위치에서는 가장 긴 키워드만 일치하므로, 그 키워드의 접두사인 다른 키워드의 적중도
+    키워드별 출력 집합에 미리 합쳐 둡니다 (Aho-Corasick 출력 링크와 같은 역할).
+    """
+
+    def __init__(self, tables: Dict[str, List[Tuple[Sequence[str], object]]]):
+        self._values = {name: [value for _, value in entries] for name, entries in tables.items()}
+
+        # 키워드별 (테이블 → 최우선 순위)
+        own: Dict[str, Dict[str, int]] = {}
+        for name, entries in tables.items():
+            for priority, (keywords, _) in enumerate(entries):
+                for keyword in keywords:
+                    table_hits = own.setdefault(keyword.lower(), {})
+                    if priority < table_hits.get(name, len(entries)):
+                        table_hits[name] = priority
+
+        trie: dict = {}
+        for keyword in own:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = keyword
+
+        # 키워드 출력 집합 = 자신 + 접두사 키워드의 적중 (트라이 경로를 따라 누적)
+        self._hits: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        stack = [(trie, {})]
+        while stack:
+            node, inherited = stack.pop()
+            keyword = node.get("")
+            if keyword is not None:
+                inherited = dict(inherited)
+                for name, priority in own[keyword].items():
+                    if priority < inherited.get(name, priority + 1):
+                        inherited[name] = priority
+                self._hits[keyword] = tuple(inherited.items())
+            stack.extend((child, inherited) for ch, child in node.items() if ch)
+
+        self._pattern = re.compile(trie_pattern(trie)) if own else None
+
+    def scan(self, text: str) -> Dict[str, object]:
+        """텍스트(소문자)를 한 번 훑어 테이블별 최우선 일치 항목의 값을 반환 (일치 없는 테이블은 키 없음)"""
+        best: Dict[str, int] = {}
+        if self._pattern is None:
+            return best
+        search = self._pattern.search
+        hits = self._hits
+        match = search(text)
+        while match:
+            for name, priority in hits[match.group()]:
+                if priority < best.get(name, priority + 1):
+                    best[name] = priority
+            # 다음 위치부터 다시 검색 (겹치는 키워드 포함)
+            match = search(text, match.start() + 1)
+        return {name: self._values[name][priority] for name, priority in best.items()}
+
+
+def _keyword_table(mapping: dict) -> List[Tuple[Sequence[str], object]]:
+    """{키워드: 값} 매핑을 KeywordMatcher 테이블 항목으로 변환"""
+    return [((keyword,), value) for keyword, value in mapping.items()]
+
+
+def _group_table(mapping: dict) -> List[Tuple[Sequence[str], object]]:
+    """{값: [키워드, ...]} 매핑을 KeywordMatcher 테이블 항목으로 변환"""
+    return [(keywords, value) for value, keywords in mapping.items()]
+
+
+# 규칙 테이블 전체를 import 시 한 번 컴파일 (테이블을 수정했다면 다시 생성해야 함)
+KEYWORD_MATCHER = KeywordMatcher({
+    "type": _group_table(COMPONENT_TYPE_KEYWORDS),
+    "title_type": _group_table(TITLE_TYPE_KEYWORDS),
+    "title": _keyword_table(TITLE_KEYWORD_MAP),
+    "shortcut": _keyword_table(SHORTCUT_MAP),
+    "condition": _keyword_table(CONDITION_PATTERNS),
+    "precondition": _group_table(PRECONDITION_KEYWORDS),
+    "action": _group_table(ACTION_KEYWORDS),
+})
+
+
+@lru_cache(maxsize=1024)
+def match_keywords(text: str) -> Mapping[str, object]:
+    """소문자 텍스트의 규칙 테이블 일치 결과 (같은 컴포넌트 텍스트는 한 번만 스캔)
+
+    캐시된 결과를 여러 호출자가 공유하므로 읽기 전용 매핑으로 반환합니다.
+    """
+    return MappingProxyType(KEYWORD_MATCHER.scan(text))
+
+
+def component_keywords(component_name: str, description: str) -> Mapping[str, object]:
+    """컴포넌트 이름 + 설명 텍스트의 규칙 테이블 일치 결과"""
+    return match_keywords(f"{component_name} {description}".lower())
+
 
 def classify_component_type(component_name: str, description: str) -> str:
     """컴포넌트 이름과 설명으로 타입 분류"""
-    text = f"{component_name} {description}".lower()
+    return component_keywords(component_name, description).get("type", "default")
+
+
+@dataclass(frozen=True)
+class ComponentFeatures:
+    """컴포넌트 하나에서 TC 생성에 필요한 파생 정보
 
-    for comp_type, keywords in COMPONENT_TYPE_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text:
-                return comp_type
+    컴포넌트당 한 번 extract_component_features로 추출해 Title/Test Step/Expected Result/
+    Pre-condition/단축키/조건 빌더에 그대로 전달합니다 (소문자 변환, 키워드 매칭, 정규식 검색 1회).
+    """
+    __slots__ = (
+        "name", "description", "name_lower", "comp_type", "keywords", "name_keywords",
+        "title_shortcut", "shortcut", "position", "desc_results", "visual_info",
+    )
 
-    return "default"
+    name: str                           # 컴포넌트 이름 (원본)
+    description: str                    # 설명 (원본)
+    name_lower: str                     # 소문자 컴포넌트 이름
+    comp_type: str                      # button / input / list / popup / default
+    keywords: Mapping[str, object]      # 이름 + 설명의 규칙 테이블 일치 결과 (읽기 전용)
+    name_keywords: Mapping[str, object] # 이름만의 규칙 테이블 일치 결과 (동작, Pre-condition, 읽기 전용)
+    title_shortcut: str                 # Title용 단축키 (Ctrl+X, Fn), 없으면 ""
+    shortcut: Optional[str]             # 단축키 TC용 단축키 (SHORTCUT_MAP 포함), 없으면 None
+    position: str                       # 화면 내 위치 (시각 정보 또는 설명 기반)
+    desc_results: Tuple[str, ...]       # Expected Result용 "# 설명" 라인
+    visual_info: dict                   # 이미지 분석 시각 정보
+
+
+def _description_results(description: str) -> Tuple[str, ...]:
+    """description 라인들을 "# 결과문장" 형식으로 변환 (유의미한 설명만)"""
+    clean_desc = description.strip()
+    if clean_desc.startswith("#"):
+        clean_desc = clean_desc[1:].strip()
+
+    desc_results = []
+    if clean_desc:
+        for line in clean_desc.split("\n"):
+            line = line.strip()
+            if line and not line.startswith("#") and not line.startswith("-"):
+                if len(line) > 3:
+                    desc_results.append(f"# {line}")
+    return tuple(desc_results)
+
+
+def extract_component_features(component_name: str, description: str = "",
+                               visual_info: dict = None) -> ComponentFeatures:
+    """컴포넌트 이름/설명/시각 정보에서 ComponentFeatures 추출
+
+    Args:
+        component_name: 컴포넌트 이름
+        description: 설명 텍스트
+        visual_info: 이미지 분석에서 추출한 시각 정보 (선택)
+
+    Returns:
+        ComponentFeatures
+    """
+    visual_info = visual_info or {}
+    keywords = component_keywords(component_name, description)
+    name_lower = component_name.lower()
+
+    title_shortcut = ""
+    desc_lower = description.lower()
+    if "ctrl" in desc_lower or "f1" in desc_lower:
+        # Ctrl+S, Ctrl+Z 등 단축키 패턴 추출
+        shortcut_match = TITLE_SHORTCUT_RE.search(description)
+        if shortcut_match:
+            title_shortcut = shortcut_match.group(1)
+
+    return ComponentFeatures(
+        name=component_name,
+        description=description,
+        name_lower=name_lower,
+        comp_type=keywords.get("type", "default"),
+        keywords=keywords,
+        name_keywords=match_keywords(name_lower),
+        title_shortcut=title_shortcut,
+        shortcut=get_shortcut_for_component(component_name, description),
+        position=_extract_position(component_name, description, visual_info),
+        desc_results=_description_results(description),
+        visual_info=visual_info,
+    )
+
+
+def check_component_features(features: ComponentFeatures, component_name: str,
+                             description: str = "", visual_info: dict = None):
+    """미리 추출한 features가 함께 넘긴 컴포넌트 이름/설명/시각 정보에서 추출한 것인지 확인
+
+    빈 설명과 visual_info=None은 넘기지 않은 것으로 보고 비교하지 않습니다.
+
+    Raises:
+        ValueError: 다른 컴포넌트에서 추출한 features인 경우
+    """
+    mismatched = [
+        label for label, given, extracted in (
+            ("component_name", component_name, features.name),
+            ("description", description or features.description, features.description),
+            ("visual_info", features.visual_info if visual_info is None else visual_info or {}, features.visual_info),
+        )
+        if given != extracted
+    ]
+    if mismatched:
+        raise ValueError(
+            f"features와 인자가 다른 컴포넌트를 가리킵니다: {', '.join(mismatched)} "
+            f"(features: {features.name!r}, 인자: {component_name!r})"
+        )
+
+
+def resolve_component_features(component_name: str, description: str = "", visual_info: dict = None,
+                               features: ComponentFeatures = None) -> ComponentFeatures:
+    """features가 없으면 새로 추출하고, 있으면 인자와 같은 컴포넌트인지 확인 후 그대로 반환"""
+    if features is None:
+        return extract_component_features(component_name, description, visual_info)
+    check_component_features(features, component_name, description, visual_info)
+    return features
 
 
 def extract_hints_from_description(description: str) -> dict:
@@ -323,7 +576,8 @@ def generate_concise_title(component_name: str, description: str = "") -> str:
     return generate_detailed_title(component_name, description, "default")
 
 
-def generate_detailed_title(component_name: str, description: str = "", test_type: str = "default") -> str:
+def generate_detailed_title(component_name: str, description: str = "", test_type: str = "default",
+                            features: ComponentFeatures = None) -> str:
     """상세한 Title 생성 (수작업 TC 스타일)
 
     개선 사항:
@@ -335,32 +589,24 @@ def generate_detailed_title(component_name: str, description: str = "", test_typ
         component_name: 컴포넌트 이름
         description: 설명 텍스트 (단축키 정보 추출용)
         test_type: 테스트 유형 (functional, ui, hover, shortcut 등)
+        features: 미리 추출한 ComponentFeatures (없으면 새로 추출, 있으면 이름/설명이 같아야 함)
 
     Returns:
         상세한 Title 형식 (예: "[Save] 버튼 클릭", "저장 단축키 입력")
     """
-    text_lower = f"{component_name} {description}".lower()
+    features = resolve_component_features(component_name, description, features=features)
+    hits = features.keywords
+    title_type = hits.get("title_type")
     clean_name = component_name.strip()
-
-    # 단축키 정보 추출
-    shortcut = ""
-    if "ctrl" in description.lower() or "f1" in description.lower():
-        # Ctrl+S, Ctrl+Z 등 단축키 패턴 추출
-        shortcut_match = re.search(r'(Ctrl\s*\+\s*\w+|F\d+)', description, re.IGNORECASE)
-        if shortcut_match:
-            shortcut = shortcut_match.group(1)
+    shortcut = features.title_shortcut
 
     # 버튼 타입 판별 및 Title 생성
-    if "button" in text_lower or "btn" in text_lower or "버튼" in text_lower:
+    if title_type == "button":
         # 버튼 이름 추출 (Button, Btn 접미사 제거)
-        btn_name = re.sub(r'(Button|Btn|버튼)\s*$', '', clean_name, flags=re.IGNORECASE).strip()
+        btn_name = BUTTON_SUFFIX_RE.sub('', clean_name).strip()
 
         # 매핑 테이블에서 한글 키워드 찾기
-        korean_name = None
-        for keyword, title in TITLE_KEYWORD_MAP.items():
-            if keyword in btn_name.lower():
-                korean_name = title
-                break
+        korean_name = match_keywords(btn_name.lower()).get("title")
 
         if test_type == "shortcut" and shortcut:
             # 단축키 테스트: "저장 단축키 입력" 또는 "[Ctrl+S] 단축키 입력"
@@ -382,15 +628,11 @@ def generate_detailed_title(component_name: str, description: str = "", test_typ
                 return f"[{btn_name}] 버튼 클릭"
 
     # 입력 필드 타입
-    elif "input" in text_lower or "field" in text_lower or "필드" in text_lower or "입력" in text_lower:
-        field_name = re.sub(r'(Input|Field|필드|입력)\s*$', '', clean_name, flags=re.IGNORECASE).strip()
+    elif title_type == "input":
+        field_name = FIELD_SUFFIX_RE.sub('', clean_name).strip()
 
         # 매핑에서 한글명 찾기
-        korean_name = None
-        for keyword, title in TITLE_KEYWORD_MAP.items():
-            if keyword in field_name.lower():
-                korean_name = title
-                break
+        korean_name = match_keywords(field_name.lower()).get("title")
 
         if korean_name:
             return f"{korean_name} 입력"
@@ -398,8 +640,8 @@ def generate_detailed_title(component_name: str, description: str = "", test_typ
             return f"[{field_name}] 필드 입력"
 
     # 목록/테이블 타입
-    elif "list" in text_lower or "table" in text_lower or "grid" in text_lower or "목록" in text_lower:
-        list_name = re.sub(r'(List|Table|Grid|목록)\s*$', '', clean_name, flags=re.IGNORECASE).strip()
+    elif title_type == "list":
+        list_name = LIST_SUFFIX_RE.sub('', clean_name).strip()
 
         if test_type == "selection":
             return f"[{list_name}] 항목 선택"
@@ -407,8 +649,8 @@ def generate_detailed_title(component_name: str, description: str = "", test_typ
             return f"[{list_name}] 목록 표시"
 
     # 팝업/모달 타입
-    elif "popup" in text_lower or "modal" in text_lower or "dialog" in text_lower or "팝업" in text_lower:
-        popup_name = re.sub(r'(Popup|Modal|Dialog|팝업)\s*$', '', clean_name, flags=re.IGNORECASE).strip()
+    elif title_type == "popup":
+        popup_name = POPUP_SUFFIX_RE.sub('', clean_name).strip()
 
         if test_type == "close":
             return f"[{popup_name}] 팝업 닫기"
@@ -416,14 +658,14 @@ def generate_detailed_title(component_name: str, description: str = "", test_typ
             return f"[{popup_name}] 팝업 표시"
 
     # 기타 컴포넌트: 매핑 테이블 확인
-    for keyword, title in TITLE_KEYWORD_MAP.items():
-        if keyword in text_lower:
-            if test_type == "ui":
-                return f"{title} 표시 확인"
-            elif test_type == "functional":
-                return f"{title} 기능 확인"
-            else:
-                return title
+    title = hits.get("title")
+    if title:
+        if test_type == "ui":
+            return f"{title} 표시 확인"
+        elif test_type == "functional":
+            return f"{title} 기능 확인"
+        else:
+            return title
 
     # 매핑에 없으면 컴포넌트 이름 정리하여 반환
     suffixes = ["Button", "Input", "Field", "List", "Table", "버튼", "필드", "입력", "Area", "영역"]
@@ -472,7 +714,7 @@ def _build_navigation_path(depth1: str, depth2: str, component_name: str) -> str
 
 def generate_test_step(component_name: str, test_type: str, depths: dict,
                        description: str = "", context: dict = None,
-                       visual_info: dict = None) -> str:
+                       visual_info: dict = None, features: ComponentFeatures = None) -> str:
     """Test Step 생성 (화면정의서 데이터 기반)
 
     원칙: PPTX에서 추출된 데이터만 사용, 하드코딩 금지
@@ -484,20 +726,22 @@ def generate_test_step(component_name: str, test_type: str, depths: dict,
         description: 컴포넌트 설명 (PPTX에서 추출)
         context: 추가 컨텍스트 (shortcut 등)
         visual_info: 이미지 분석에서 추출한 시각 정보 (선택)
+        features: 미리 추출한 ComponentFeatures (없으면 새로 추출, 있으면 이름/설명/시각 정보가 같아야 함)
 
     Returns:
         Test Step 문자열
     """
     context = context or {}
-    visual_info = visual_info or {}
+    features = resolve_component_features(component_name, description, visual_info, features)
+    visual_info = features.visual_info
     steps = []
 
     # 화면 이름: Depth2(섹션명)를 사용, 없으면 "해당 화면"
     # 하드코딩된 "탭" 접미사 제거
     screen_name = depths.get("depth2", "") if depths.get("depth2") else "해당 화면"
 
-    # 컴포넌트 위치 추출 (시각 정보 또는 description에서)
-    position = _extract_position(component_name, description, visual_info)
+    # 컴포넌트 위치 (시각 정보 또는 description에서 추출)
+    position = features.position
 
     # 위치 문자열 생성 (시각 정보가 있으면 더 상세하게)
     if visual_info and position:
@@ -512,7 +756,7 @@ def generate_test_step(component_name: str, test_type: str, depths: dict,
     else:
         position_str = ""
 
-    comp_lower = component_name.lower()
+    action = features.name_keywords.get("action")
 
     # Step 1: 화면 진입
     steps.append(f"1. {screen_name} 화면 진입")
@@ -523,37 +767,37 @@ def generate_test_step(component_name: str, test_type: str, depths: dict,
 
     elif test_type == "functional":
         # 컴포넌트별 구체적인 동작 단계
-        if "minimize" in comp_lower or "최소화" in comp_lower:
+        if action == "minimize":
             steps.append(f"2. {position_str}최소화 버튼 클릭")
-        elif "maximize" in comp_lower or "최대화" in comp_lower:
+        elif action == "maximize":
             steps.append(f"2. {position_str}최대화 버튼 클릭")
-        elif "close" in comp_lower or "닫기" in comp_lower:
+        elif action == "close":
             steps.append(f"2. {position_str}닫기 버튼 클릭")
             # 후속 동작: 저장 확인 팝업
             steps.append("3. 팝업창 Save 버튼 클릭 (변경사항 있는 경우)")
-        elif "save" in comp_lower or "저장" in comp_lower:
+        elif action == "save":
             steps.append(f"2. {position_str}저장 버튼 클릭")
-        elif "cancel" in comp_lower or "취소" in comp_lower:
+        elif action == "cancel":
             steps.append(f"2. {position_str}취소 버튼 클릭")
-        elif "search" in comp_lower or "검색" in comp_lower:
+        elif action == "search":
             steps.append(f"2. {position_str}검색 필드에 검색어 입력")
             steps.append("3. 검색 버튼 클릭 또는 Enter 키 입력")
-        elif "delete" in comp_lower or "삭제" in comp_lower:
+        elif action == "delete":
             steps.append("2. 삭제할 항목 선택")
             steps.append(f"3. {position_str}삭제 버튼 클릭")
             steps.append("4. 확인 팝업에서 확인 버튼 클릭")
-        elif "add" in comp_lower or "추가" in comp_lower:
+        elif action == "add":
             steps.append(f"2. {position_str}추가 버튼 클릭")
             steps.append("3. 필요한 정보 입력")
             steps.append("4. 저장/확인 버튼 클릭")
-        elif "refresh" in comp_lower or "새로고침" in comp_lower:
+        elif action == "refresh":
             steps.append(f"2. {position_str}새로고침 버튼 클릭")
-        elif "back" in comp_lower or "뒤로" in comp_lower:
+        elif action == "back":
             steps.append(f"2. {position_str}뒤로가기 버튼 클릭")
-        elif "undo" in comp_lower or "실행취소" in comp_lower:
+        elif action == "undo":
             steps.append("2. 임의의 작업 수행")
             steps.append(f"3. {position_str}실행취소 버튼 클릭")
-        elif "redo" in comp_lower or "다시실행" in comp_lower:
+        elif action == "redo":
             steps.append("2. 임의의 작업 수행 후 실행취소")
             steps.append(f"3. {position_str}다시실행 버튼 클릭")
         else:
@@ -683,7 +927,8 @@ def _extract_position(component_name: str, description: str, visual_info: dict =
     return ""
 
 
-def _get_special_precondition(component_name: str, component_type: str) -> str:
+def _get_special_precondition(component_name: str, component_type: str,
+                              features: ComponentFeatures = None) -> str:
     """특수 컴포넌트의 Pre-condition 반환 (수작업 TC 스타일)
 
     개선된 Pre-condition 로직:
@@ -693,23 +938,21 @@ def _get_special_precondition(component_name: str, component_type: str) -> str:
     Args:
         component_name: 컴포넌트 이름
         component_type: 컴포넌트 타입
+        features: 미리 추출한 ComponentFeatures (선택)
 
     Returns:
         Pre-condition 문자열 (기본값: 빈 문자열)
     """
-    comp_lower = component_name.lower() if component_name else ""
-
-    # 특수 컴포넌트별 Pre-condition
-    if "undo" in comp_lower or "실행취소" in comp_lower:
-        return PRECONDITION_BY_TYPE.get("undo", "작업 내역이 있는 상태")
-    elif "redo" in comp_lower or "다시실행" in comp_lower:
-        return PRECONDITION_BY_TYPE.get("redo", "실행 취소된 작업이 있는 상태")
-    elif "minimize" in comp_lower or "최소화" in comp_lower:
-        # 최소화 복원 테스트의 경우
-        return PRECONDITION_BY_TYPE.get("minimize", "화면이 최소화된 상태")
-    elif "maximize" in comp_lower or "최대화" in comp_lower:
-        # 최대화 복원 테스트의 경우
-        return PRECONDITION_BY_TYPE.get("maximize", "화면이 최대화된 상태")
+    if features is not None:
+        check_component_features(features, component_name)
+        name_keywords = features.name_keywords
+    else:
+        name_keywords = match_keywords(component_name.lower() if component_name else "")
+
+    # 특수 컴포넌트별 Pre-condition (undo/redo/최소화/최대화 복원 테스트)
+    special = name_keywords.get("precondition")
+    if special:
+        return PRECONDITION_BY_TYPE.get(special, "")
     elif component_type == "popup":
         # 팝업 닫기 테스트의 경우
         return PRECONDITION_BY_TYPE.get("popup", "팝업이 표시된 상태")
@@ -720,7 +963,7 @@ def _get_special_precondition(component_name: str, component_type: str) -> str:
 
 def generate_expected_result(component_name: str, test_type: str, description: str = "",
                              position: str = "", context: dict = None,
-                             visual_info: dict = None) -> str:
+                             visual_info: dict = None, features: ComponentFeatures = None) -> str:
     """Expected Result 생성 (수작업 스타일 - 여러 # 결과문장)
 
     Part 2 개선 사항:
@@ -740,12 +983,14 @@ def generate_expected_result(component_name: str, test_type: str, description: s
         position: 위치 정보 (좌측 상단, 우측 상단 등)
         context: 추가 컨텍스트 정보 (hint, shortcut 등)
         visual_info: 이미지 분석에서 추출한 시각 정보 (선택)
+        features: 미리 추출한 ComponentFeatures (없으면 새로 추출, 있으면 이름/설명/시각 정보가 같아야 함)
 
     Returns:
         여러 "# 결과문장" 형식
     """
     context = context or {}
-    visual_info = visual_info or {}
+    features = resolve_component_features(component_name, description, visual_info, features)
+    visual_info = features.visual_info
     results = []
 
     # 시각적 상태/스타일 정보 추출
@@ -754,20 +999,8 @@ def generate_expected_result(component_name: str, test_type: str, description: s
     visual_color = visual_info.get("color", {})
     visual_desc = visual_info.get("visual_description", "")
 
-    # description에서 유의미한 정보 추출
-    clean_desc = description.strip()
-    if clean_desc.startswith("#"):
-        clean_desc = clean_desc[1:].strip()
-
-    # description 라인들을 # 형식으로 변환
-    desc_results = []
-    if clean_desc:
-        for line in clean_desc.split("\n"):
-            line = line.strip()
-            if line and not line.startswith("#") and not line.startswith("-"):
-                # 유의미한 설명만 추가
-                if len(line) > 3:
-                    desc_results.append(f"# {line}")
+    # description에서 추출한 "# 결과문장" 라인
+    desc_results = features.desc_results
 
     # 위치 정보 문자열
     position_str = f"{position}에 " if position else ""
@@ -782,42 +1015,42 @@ def generate_expected_result(component_name: str, test_type: str, description: s
 
     elif test_type == "functional":
         # 컴포넌트별 구체적인 기능 결과
-        comp_lower = component_name.lower()
+        action = features.name_keywords.get("action")
 
-        if "minimize" in comp_lower or "최소화" in comp_lower:
+        if action == "minimize":
             results.append("# 화면이 최소화되며, 프로그램 종료 안 됨")
             results.append("# 프로그램이 작업 표시줄에 표시되며, 백그라운드에서 상태 유지됨")
-        elif "maximize" in comp_lower or "최대화" in comp_lower:
+        elif action == "maximize":
             results.append("# 화면이 전체 화면으로 최대화됨")
             results.append("# 다시 클릭 시 원래 크기로 복원됨")
-        elif "close" in comp_lower or "닫기" in comp_lower:
+        elif action == "close":
             results.append(f"# {component_name} 클릭 시 해당 창/팝업이 닫힘")
             results.append("# 저장되지 않은 데이터가 있는 경우 확인 팝업 표시됨")
-        elif "save" in comp_lower or "저장" in comp_lower:
+        elif action == "save":
             results.append("# 입력/수정된 데이터가 정상적으로 저장됨")
             results.append("# 저장 완료 메시지 표시됨")
-        elif "cancel" in comp_lower or "취소" in comp_lower:
+        elif action == "cancel":
             results.append("# 변경사항이 저장되지 않고 이전 상태로 복원됨")
             results.append("# 해당 화면/팝업이 닫힘")
-        elif "search" in comp_lower or "검색" in comp_lower:
+        elif action == "search":
             results.append("# 검색 조건에 맞는 결과 목록이 표시됨")
             results.append("# 검색 결과가 없는 경우 '검색 결과 없음' 메시지 표시됨")
-        elif "delete" in comp_lower or "삭제" in comp_lower:
+        elif action == "delete":
             results.append("# 삭제 확인 팝업이 표시됨")
             results.append("# 확인 시 해당 항목이 삭제되며, 목록에서 제거됨")
-        elif "add" in comp_lower or "추가" in comp_lower:
+        elif action == "add":
             results.append("# 새 항목 입력/추가 화면이 표시됨")
             results.append("# 입력 완료 후 목록에 새 항목이 추가됨")
-        elif "refresh" in comp_lower or "새로고침" in comp_lower:
+        elif action == "refresh":
             results.append("# 현재 화면 데이터가 최신 상태로 갱신됨")
             results.append("# 로딩 인디케이터 표시 후 갱신 완료됨")
-        elif "back" in comp_lower or "뒤로" in comp_lower:
+        elif action == "back":
             results.append("# 이전 화면으로 이동됨")
             results.append("# 저장되지 않은 변경사항이 있는 경우 확인 팝업 표시됨")
-        elif "undo" in comp_lower or "실행취소" in comp_lower:
+        elif action == "undo":
             results.append("# 마지막 작업이 취소됨")
             results.append("# 이전 상태로 복원됨")
-        elif "redo" in comp_lower or "다시실행" in comp_lower:
+        elif action == "redo":
             results.append("# 취소된 작업이 다시 실행됨")
             results.append("# 작업 결과가 화면에 반영됨")
         else:
@@ -999,7 +1232,8 @@ def generate_testcases_for_component(
     app_name: str = "OnePros",
     doc_name: str = "",
     version: str = "",
-    project_info: dict = None
+    project_info: dict = None,
+    features: ComponentFeatures = None
 ) -> List[TestCase]:
     """컴포넌트에 대한 테스트케이스 생성 (개선된 버전 - 수작업 TC 스타일)
 
@@ -1015,6 +1249,8 @@ def generate_testcases_for_component(
     이미지 분석 개선:
     - visual_info를 활용한 정확한 위치 설명
     - 시각적 상태 변화 반영
+
+    features를 넘기면 컴포넌트 파생 정보(타입, 키워드, 위치 등)를 다시 추출하지 않습니다.
     """
 
     if project_info is None:
@@ -1028,8 +1264,9 @@ def generate_testcases_for_component(
     # 이미지 분석 정보 추출 (있으면 사용)
     visual_info = component.get("visual_info", {})
 
-    # 컴포넌트 타입 분류
-    comp_type = classify_component_type(comp_name, description)
+    # 컴포넌트 파생 정보 (타입, 키워드, 위치 등)
+    features = resolve_component_features(comp_name, description, visual_info, features)
+    comp_type = features.comp_type
 
     # Depth 구조 추출 (개선된 형식 - project_info, comp_type 전달)
     depths_ui = extract_depth_structure(
@@ -1044,11 +1281,11 @@ def generate_testcases_for_component(
     nav_path = _build_navigation_path(depths_ui["depth1"], depths_ui["depth2"], comp_name)
 
     # 상세한 Title 생성 (수작업 TC 스타일)
-    detailed_title = generate_detailed_title(comp_name, description, "ui")
+    detailed_title = generate_detailed_title(comp_name, description, "ui", features=features)
 
     # 타입별 사전 조건 (개선: 기본 TC는 빈 문자열)
     # 특수 컴포넌트(undo, redo, save 등)의 경우만 Pre-condition 설정
-    base_pre_condition = _get_special_precondition(comp_name, comp_type)
+    base_pre_condition = _get_special_precondition(comp_name, comp_type, features)
 
     # Reference 형식 개선 (전체 문서 참조)
     if doc_name and version:
@@ -1070,8 +1307,8 @@ def generate_testcases_for_component(
         depth4=depths_ui["depth4"],
         title=detailed_title,
         pre_condition=base_pre_condition,
-        test_step=generate_test_step(comp_name, "ui", depths_ui, description, visual_info=visual_info),
-        expected_result=generate_expected_result(comp_name, "ui", description, visual_info=visual_info),
+        test_step=generate_test_step(comp_name, "ui", depths_ui, description, features=features),
+        expected_result=generate_expected_result(comp_name, "ui", description, features=features),
         reference=reference
     )
     testcases.append(tc)
@@ -1087,8 +1324,8 @@ def generate_testcases_for_component(
             project_info=project_info,
             component_type=comp_type
         )
-        func_title = generate_detailed_title(comp_name, description, "functional")
-        # Part 2: 개선된 Test Step 사용 (visual_info 전달)
+        func_title = generate_detailed_title(comp_name, description, "functional", features=features)
+        # Part 2: 개선된 Test Step 사용 (ComponentFeatures 전달)
         tc_func = TestCase(
             test_case_id=generate_test_id(id_prefix, counter),
             depth1=depths_func["depth1"],
@@ -1097,8 +1334,8 @@ def generate_testcases_for_component(
             depth4=depths_func["depth4"],
             title=func_title,
             pre_condition=base_pre_condition,
-            test_step=generate_test_step(comp_name, "functional", depths_func, description, visual_info=visual_info),
-            expected_result=generate_expected_result(comp_name, "functional", description, visual_info=visual_info),
+            test_step=generate_test_step(comp_name, "functional", depths_func, description, features=features),
+            expected_result=generate_expected_result(comp_name, "functional", description, features=features),
             reference=reference
         )
         testcases.append(tc_func)
@@ -1113,8 +1350,8 @@ def generate_testcases_for_component(
             project_info=project_info,
             component_type=comp_type
         )
-        func_title = generate_detailed_title(comp_name, description, "functional")
-        # Part 2: 개선된 Test Step 사용 (visual_info 전달)
+        func_title = generate_detailed_title(comp_name, description, "functional", features=features)
+        # Part 2: 개선된 Test Step 사용 (ComponentFeatures 전달)
         tc_input = TestCase(
             test_case_id=generate_test_id(id_prefix, counter),
             depth1=depths_func["depth1"],
@@ -1123,8 +1360,8 @@ def generate_testcases_for_component(
             depth4=depths_func["depth4"],
             title=func_title,
             pre_condition=base_pre_condition,
-            test_step=generate_test_step(comp_name, "functional", depths_func, description, visual_info=visual_info),
-            expected_result=generate_expected_result(comp_name, "functional", description, visual_info=visual_info),
+            test_step=generate_test_step(comp_name, "functional", depths_func, description, features=features),
+            expected_result=generate_expected_result(comp_name, "functional", description, features=features),
             reference=reference
         )
         testcases.append(tc_input)
@@ -1139,8 +1376,8 @@ def generate_testcases_for_component(
             project_info=project_info,
             component_type=comp_type
         )
-        select_title = generate_detailed_title(comp_name, description, "selection")
-        # Part 2: 개선된 Test Step 사용 (visual_info 전달)
+        select_title = generate_detailed_title(comp_name, description, "selection", features=features)
+        # Part 2: 개선된 Test Step 사용 (ComponentFeatures 전달)
         tc_select = TestCase(
             test_case_id=generate_test_id(id_prefix, counter),
             depth1=depths_select["depth1"],
@@ -1149,8 +1386,8 @@ def generate_testcases_for_component(
             depth4=depths_select["depth4"],
             title=select_title,
             pre_condition="",  # 기본 Pre-condition 비움
-            test_step=generate_test_step(comp_name, "selection", depths_select, description, visual_info=visual_info),
-            expected_result=generate_expected_result(comp_name, "selection", description, visual_info=visual_info),
+            test_step=generate_test_step(comp_name, "selection", depths_select, description, features=features),
+            expected_result=generate_expected_result(comp_name, "selection", description, features=features),
             reference=reference
         )
         testcases.append(tc_select)
@@ -1165,8 +1402,8 @@ def generate_testcases_for_component(
             project_info=project_info,
             component_type=comp_type
         )
-        close_title = generate_detailed_title(comp_name, description, "close")
-        # Part 2: 개선된 Test Step 사용 (visual_info 전달)
+        close_title = generate_detailed_title(comp_name, description, "close", features=features)
+        # Part 2: 개선된 Test Step 사용 (ComponentFeatures 전달)
         tc_close = TestCase(
             test_case_id=generate_test_id(id_prefix, counter),
             depth1=depths_close["depth1"],
@@ -1175,8 +1412,8 @@ def generate_testcases_for_component(
             depth4=depths_close["depth4"],
             title=close_title,
             pre_condition="팝업이 표시된 상태",
-            test_step=generate_test_step(comp_name, "close", depths_close, description, visual_info=visual_info),
-            expected_result=generate_expected_result(comp_name, "close", description, visual_info=visual_info),
+            test_step=generate_test_step(comp_name, "close", depths_close, description, features=features),
+            expected_result=generate_expected_result(comp_name, "close", description, features=features),
             reference=reference
         )
         testcases.append(tc_close)
@@ -1197,19 +1434,13 @@ def get_shortcut_for_component(component_name: str, description: str) -> Optiona
     Returns:
         단축키 문자열 (예: "Ctrl+S") 또는 None
     """
-    text = f"{component_name} {description}".lower()
-
     # 1. description에서 직접 단축키 추출 (Ctrl+X, F1 패턴)
-    shortcut_match = re.search(r'(Ctrl\s*\+\s*\w+|Alt\s*\+\s*\w+|F\d+)', description, re.IGNORECASE)
+    shortcut_match = SHORTCUT_RE.search(description)
     if shortcut_match:
         return shortcut_match.group(1).replace(" ", "")
 
     # 2. SHORTCUT_MAP에서 키워드 매칭
-    for keyword, shortcut in SHORTCUT_MAP.items():
-        if keyword in text:
-            return shortcut
-
-    return None
+    return component_keywords(component_name, description).get("shortcut")
 
 
 def generate_shortcut_testcase(
@@ -1219,7 +1450,8 @@ def generate_shortcut_testcase(
     id_prefix: str,
     reference: str,
     depths: Dict[str, str],
-    nav_path: str
+    nav_path: str,
+    features: ComponentFeatures = None
 ) -> Optional[TestCase]:
     """단축키 테스트케이스 생성
 
@@ -1237,32 +1469,29 @@ def generate_shortcut_testcase(
         reference: 참조 문서
         depths: Depth 구조
         nav_path: 네비게이션 경로
+        features: 미리 추출한 ComponentFeatures (없으면 새로 추출)
 
     Returns:
         단축키 TestCase 또는 None (단축키가 없는 경우)
     """
     comp_name = component.get("component", "")
     description = component.get("description", "")
+    features = resolve_component_features(comp_name, description, features=features)
 
-    # 단축키 정보 추출
-    shortcut = get_shortcut_for_component(comp_name, description)
+    # 단축키 정보
+    shortcut = features.shortcut
     if not shortcut:
         return None
 
     # 한글 키워드 찾기
-    text_lower = f"{comp_name} {description}".lower()
-    korean_name = None
-    for keyword, title in TITLE_KEYWORD_MAP.items():
-        if keyword in text_lower:
-            korean_name = title
-            break
+    korean_name = features.keywords.get("title")
 
     # Title 생성: "저장 단축키 입력 (Ctrl+S)"
     if korean_name:
         title = f"{korean_name} 단축키 입력 ({shortcut})"
     else:
         # 버튼 이름에서 접미사 제거
-        btn_name = re.sub(r'(Button|Btn|버튼)\s*$', '', comp_name, flags=re.IGNORECASE).strip()
+        btn_name = BUTTON_SUFFIX_RE.sub('', comp_name).strip()
         title = f"[{btn_name}] 단축키 입력 ({shortcut})"
 
     # Test Step 생성
@@ -1289,7 +1518,8 @@ def generate_condition_variants(
     base_tc: TestCase,
     component: dict,
     counter_start: int,
-    id_prefix: str
+    id_prefix: str,
+    features: ComponentFeatures = None
 ) -> List[TestCase]:
     """조건별 TC 분리 생성
 
@@ -1306,20 +1536,19 @@ def generate_condition_variants(
         component: 컴포넌트 정보
         counter_start: 시작 TC 번호
         id_prefix: ID 접두사
+        features: 미리 추출한 ComponentFeatures (선택)
 
     Returns:
         조건별로 분리된 TestCase 목록 (조건 분리 불필요시 빈 리스트)
     """
-    comp_name = component.get("component", "")
-    description = component.get("description", "")
-    text_lower = f"{comp_name} {description}".lower()
+    if features is not None:
+        check_component_features(features, component.get("component", ""), component.get("description", ""))
+        hits = features.keywords
+    else:
+        hits = component_keywords(component.get("component", ""), component.get("description", ""))
 
     # 조건 분리가 필요한지 확인
-    conditions = None
-    for keyword, condition_list in CONDITION_PATTERNS.items():
-        if keyword in text_lower:
-            conditions = condition_list
-            break
+    conditions = hits.get("condition")
 
     if not conditions:
         return []
@@ -1475,7 +1704,8 @@ def generate_exception_testcases(
     global_counter: int,
     id_prefix: str = "IT_OO",
     doc_name: str = "",
-    version: str = ""
+    version: str = "",
+    features: ComponentFeatures = None
 ) -> List[TestCase]:
     """예외/에러 테스트케이스 생성
 
@@ -1488,6 +1718,7 @@ def generate_exception_testcases(
         id_prefix: ID 접두사
         doc_name: 문서명
         version: 버전
+        features: 미리 추출한 ComponentFeatures (선택)
 
     Returns:
         예외 테스트케이스 목록
@@ -1498,7 +1729,11 @@ def generate_exception_testcases(
     slide_number = component.get("slide_number", 1)
 
     # 컴포넌트 타입 분류
-    comp_type = classify_component_type(comp_name, description)
+    if features is not None:
+        check_component_features(features, comp_name, description)
+        comp_type = features.comp_type
+    else:
+        comp_type = classify_component_type(comp_name, description)
 
     # Depth 구조 추출
     depths = extract_depth_structure(section, comp_name)
@@ -1532,12 +1767,246 @@ def generate_exception_testcases(
     return testcases
 
 
+def generate_component_testcases(
+    component: dict,
+    global_counter: int,
+    id_prefix: str = "IT_OO",
+    project_info: dict = None,
+    include_exceptions: bool = False,
+    include_shortcuts: bool = True,
+    include_conditions: bool = True
+) -> List[TestCase]:
+    """컴포넌트 하나에서 나오는 전체 테스트케이스 생성
+
+    기본 TC + 단축키 TC + 조건별 TC + 예외 TC를 순서대로 생성합니다.
+    TC ID는 global_counter부터 순차 부여됩니다.
+
+    Args:
+        component: 컴포넌트 정보 (section, slide_number 포함)
+        global_counter: 첫 TC 번호
+        id_prefix: 테스트케이스 ID 접두사
+        project_info: 프로젝트 정보
+        include_exceptions: 예외 테스트케이스 포함 여부
+        include_shortcuts: 단축키 테스트케이스 포함 여부
+        include_conditions: 조건별 TC 분리 포함 여부
+
+    Returns:
+        테스트케이스 목록
+    """
+    if project_info is None:
+        project_info = {}
+
+    # 프로젝트 정보에서 앱 이름, 문서명, 버전 추출
+    app_name = project_info.get("project_name", "OnePros")
+    doc_name = project_info.get("title", app_name)
+    version = project_info.get("version", "")
+
+    if not app_name:
+        app_name = "OnePros"
+
+    component_testcases = []
+
+    section = component.get("section", "")
+    comp_name = component.get("component", "")
+    description = component.get("description", "")
+    slide_number = component.get("slide_number", 1)
+
+    # 컴포넌트 파생 정보를 한 번만 추출해 모든 빌더에 전달
+    features = extract_component_features(comp_name, description, component.get("visual_info", {}))
+    comp_type = features.comp_type
+
+    # Depth 구조 추출 (개선된 버전 - project_info, comp_type 전달)
+    depths = extract_depth_structure(
+        section=section,
+        component_name=comp_name,
+        test_type="ui",
+        project_info=project_info,
+        component_type=comp_type
+    )
+
+    # 네비게이션 경로 생성
+    nav_path = _build_navigation_path(depths["depth1"], depths["depth2"], comp_name)
+
+    # Reference 형식
+    if doc_name and version:
+        reference = f"{doc_name} {version} 화면 정의서 {slide_number}P"
+    elif doc_name:
+        reference = f"{doc_name} 화면 정의서 {slide_number}P"
+    else:
+        reference = f"{app_name} 화면 정의서 {slide_number}P"
+
+    # 기본 테스트케이스 생성 (project_info 전달)
+    tc_list = generate_testcases_for_component(
+        component=component,
+        section=section,
+        global_counter=global_counter,
+        id_prefix=id_prefix,
+        app_name=app_name,
+        doc_name=doc_name,
+        version=version,
+        project_info=project_info,
+        features=features
+    )
+
+    component_testcases.extend(tc_list)
+    global_counter += len(tc_list)
+
+    # Part 3: 단축키 TC 생성 (버튼 타입인 경우)
+    if include_shortcuts and comp_type == "button":
+        shortcut_tc = generate_shortcut_testcase(
+            component=component,
+            section=section,
+            counter=global_counter,
+            id_prefix=id_prefix,
+            reference=reference,
+            depths=depths,
+            nav_path=nav_path,
+            features=features
+        )
+        if shortcut_tc:
+            component_testcases.append(shortcut_tc)
+            global_counter += 1
+
+    # Part 3: 조건별 TC 분리 (해당 컴포넌트인 경우)
+    if include_conditions and tc_list:
+        # 마지막 기능 TC를 기준으로 조건별 분리
+        base_tc = tc_list[-1]
+        condition_tc_list = generate_condition_variants(
+            base_tc=base_tc,
+            component=component,
+            counter_start=global_counter,
+            id_prefix=id_prefix,
+            features=features
+        )
+        if condition_tc_list:
+            component_testcases.extend(condition_tc_list)
+            global_counter += len(condition_tc_list)
+
+    # 예외 테스트케이스 생성 (옵션)
+    if include_exceptions:
+        exception_tc_list = generate_exception_testcases(
+            component=component,
+            section=section,
+            global_counter=global_counter,
+            id_prefix=id_prefix,
+            doc_name=doc_name,
+            version=version,
+            features=features
+        )
+        component_testcases.extend(exception_tc_list)
+
+    return component_testcases
+
+
+# 병렬 생성 시 워커에 넘기는 최소 컴포넌트 수 (프로세스 간 전송 비용 분산)
+MIN_COMPONENTS_PER_BATCH = 256
+
+
+def _generate_component_batch(
+    components: List[dict],
+    id_prefix: str,
+    project_info: dict,
+    include_exceptions: bool,
+    include_shortcuts: bool,
+    include_conditions: bool
+) -> List[List[TestCase]]:
+    """컴포넌트 묶음의 TC 생성 (워커 프로세스용, TC ID는 임시값)"""
+    return [
+        generate_component_testcases(
+            component=component,
+            global_counter=1,
+            id_prefix=id_prefix,
+            project_info=project_info,
+            include_exceptions=include_exceptions,
+            include_shortcuts=include_shortcuts,
+            include_conditions=include_conditions
+        )
+        for component in components
+    ]
+
+
+def _generate_component_batch_rows(*args) -> List[List[tuple]]:
+    """_generate_component_batch 결과를 ID를 뺀 필드 값 튜플로 반환 (워커 → 부모 전송량/직렬화 비용 절감)"""
+    # dataclass __init__이 필드 순서대로 속성을 설정하므로 vars() 값 순서 = TestCase 인자 순서 (첫 값이 ID)
+    return [[tuple(vars(tc).values())[1:] for tc in testcases] for testcases in _generate_component_batch(*args)]
+
+
+def generate_component_testcase_lists(
+    components: List[dict],
+    id_prefix: str = "IT_OO",
+    project_info: dict = None,
+    include_exceptions: bool = False,
+    include_shortcuts: bool = True,
+    include_conditions: bool = True,
+    workers: int = 1
+) -> List[List[TestCase]]:
+    """컴포넌트별 TC 목록 생성 (ID 미부여 1단계)
+
+    컴포넌트 하나의 TC는 다른 컴포넌트와 무관하므로, workers > 1이면 컴포넌트를
+    연속 구간으로 나눠 프로세스 풀에서 생성하고 원래 컴포넌트 순서대로 모읍니다.
+    반환된 TC의 test_case_id는 임시값(병렬 생성 시 빈 문자열)이며 assign_test_ids 등으로 부여해야 합니다.
+
+    Args:
+        components: 컴포넌트 목록
+        id_prefix: 테스트케이스 ID 접두사
+        project_info: 프로젝트 정보
+        include_exceptions: 예외 테스트케이스 포함 여부
+        include_shortcuts: 단축키 테스트케이스 포함 여부
+        include_conditions: 조건별 TC 분리 포함 여부
+        workers: 생성 프로세스 수 (1이면 직렬)
+
+    Returns:
+        컴포넌트 순서의 TC 목록 리스트
+    """
+    if project_info is None:
+        project_info = {}
+    options = (id_prefix, project_info, include_exceptions, include_shortcuts, include_conditions)
+
+    workers = min(workers, -(-len(components) // MIN_COMPONENTS_PER_BATCH))
+    if workers <= 1:
+        return _generate_component_batch(components, *options)
+
+    # 워커당 여러 묶음으로 나눠 컴포넌트별 TC 수 편차를 분산 (map은 묶음 순서를 유지)
+    batch_size = max(MIN_COMPONENTS_PER_BATCH, -(-len(components) // (workers * 4)))
+    batches = [components[i:i + batch_size] for i in range(0, len(components), batch_size)]
+
+    testcase_lists: List[List[TestCase]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_rows in executor.map(_generate_component_batch_rows, batches, *(repeat(o) for o in options)):
+            testcase_lists.extend([TestCase("", *row) for row in rows] for rows in batch_rows)
+    return testcase_lists
+
+
+def assign_test_ids(testcase_lists: List[List[TestCase]], id_prefix: str, start: int = 1) -> List[TestCase]:
+    """컴포넌트별 TC 목록에 순차 ID 부여 (2단계)
+
+    컴포넌트별 TC 수의 누적합(prefix sum)으로 각 컴포넌트의 첫 번호를 정하므로
+    전역 카운터를 순서대로 넘기던 직렬 생성과 같은 ID가 부여됩니다.
+
+    Args:
+        testcase_lists: 컴포넌트 순서의 TC 목록 리스트
+        id_prefix: 테스트케이스 ID 접두사
+        start: 첫 TC 번호
+
+    Returns:
+        ID가 부여된 전체 TC 목록
+    """
+    all_testcases = []
+    offsets = accumulate((len(tcs) for tcs in testcase_lists), initial=start)
+    for first_number, testcases in zip(offsets, testcase_lists):
+        for number, tc in enumerate(testcases, first_number):
+            tc.test_case_id = generate_test_id(id_prefix, number)
+        all_testcases.extend(testcases)
+    return all_testcases
+
+
 def generate_testcases(
     extracted_data: dict,
     id_prefix: str = "IT_OO",
     include_exceptions: bool = False,
     include_shortcuts: bool = True,
-    include_conditions: bool = True
+    include_conditions: bool = True,
+    workers: int = 1
 ) -> List[TestCase]:
     """추출된 데이터로 전체 테스트케이스 생성 (개선된 버전)
 
@@ -1547,6 +2016,7 @@ def generate_testcases(
     - 예외 테스트케이스 생성 옵션 추가
     - Part 3: 단축키 TC 자동 생성 옵션 추가
     - Part 3: 조건별 TC 분리 옵션 추가
+    - workers > 1이면 컴포넌트별 생성을 프로세스 풀에서 수행하고 ID는 누적합으로 부여 (직렬과 동일 결과)
 
     Args:
         extracted_data: 추출된 PPTX 데이터
@@ -1554,127 +2024,105 @@ def generate_testcases(
         include_exceptions: 예외 테스트케이스 포함 여부
         include_shortcuts: 단축키 테스트케이스 포함 여부 (기본: True)
         include_conditions: 조건별 TC 분리 포함 여부 (기본: True)
+        workers: 생성 프로세스 수 (기본: 1, 직렬)
 
     Returns:
         테스트케이스 목록
     """
 
     all_testcases = []
-
-    # 프로젝트 정보에서 앱 이름, 문서명, 버전 추출
     project_info = extracted_data.get("project_info", {})
-    app_name = project_info.get("project_name", "OnePros")
-    doc_name = project_info.get("title", app_name)
-    version = project_info.get("version", "")
-
-    if not app_name:
-        app_name = "OnePros"
 
-    # 전역 순차 카운터 (1부터 시작)
-    global_counter = 1
+    if workers > 1:
+        testcase_lists = generate_component_testcase_lists(
+            extracted_data.get("all_components", []),
+            id_prefix=id_prefix,
+            project_info=project_info,
+            include_exceptions=include_exceptions,
+            include_shortcuts=include_shortcuts,
+            include_conditions=include_conditions,
+            workers=workers
+        )
+        return assign_test_ids(testcase_lists, id_prefix)
 
-    for component in extracted_data.get("all_components", []):
-        section = component.get("section", "")
-        comp_name = component.get("component", "")
-        description = component.get("description", "")
-        slide_number = component.get("slide_number", 1)
+    for component_testcases in iter_testcases(
+        extracted_data.get("all_components", []),
+        id_prefix=id_prefix,
+        project_info=project_info,
+        include_exceptions=include_exceptions,
+        include_shortcuts=include_shortcuts,
+        include_conditions=include_conditions
+    ):
+        all_testcases.extend(component_testcases)
 
-        # 컴포넌트 타입 분류
-        comp_type = classify_component_type(comp_name, description)
+    return all_testcases
 
-        # Depth 구조 추출 (개선된 버전 - project_info, comp_type 전달)
-        depths = extract_depth_structure(
-            section=section,
-            component_name=comp_name,
-            test_type="ui",
-            project_info=project_info,
-            component_type=comp_type
-        )
 
-        # 네비게이션 경로 생성
-        nav_path = _build_navigation_path(depths["depth1"], depths["depth2"], comp_name)
+def iter_testcases(
+    components: Iterable[dict],
+    id_prefix: str = "IT_OO",
+    project_info: dict = None,
+    include_exceptions: bool = False,
+    include_shortcuts: bool = True,
+    include_conditions: bool = True
+) -> Iterator[List[TestCase]]:
+    """컴포넌트 순서대로 TC를 생성하여 컴포넌트 단위로 yield (스트리밍)
 
-        # Reference 형식
-        if doc_name and version:
-            reference = f"{doc_name} {version} 화면 정의서 {slide_number}P"
-        elif doc_name:
-            reference = f"{doc_name} 화면 정의서 {slide_number}P"
-        else:
-            reference = f"{app_name} 화면 정의서 {slide_number}P"
+    components는 제너레이터여도 되며 한 번에 컴포넌트 하나만 소비합니다.
+    TC ID는 generate_testcases 직렬 경로와 같은 전역 순차 번호입니다.
+    """
+    # 전역 순차 카운터 (1부터 시작)
+    global_counter = 1
 
-        # 기본 테스트케이스 생성 (project_info 전달)
-        tc_list = generate_testcases_for_component(
+    for component in components:
+        component_testcases = generate_component_testcases(
             component=component,
-            section=section,
             global_counter=global_counter,
             id_prefix=id_prefix,
-            app_name=app_name,
-            doc_name=doc_name,
-            version=version,
-            project_info=project_info
+            project_info=project_info,
+            include_exceptions=include_exceptions,
+            include_shortcuts=include_shortcuts,
+            include_conditions=include_conditions
         )
+        global_counter += len(component_testcases)
+        yield component_testcases
 
-        all_testcases.extend(tc_list)
-        global_counter += len(tc_list)
-
-        # Part 3: 단축키 TC 생성 (버튼 타입인 경우)
-        if include_shortcuts and comp_type == "button":
-            shortcut_tc = generate_shortcut_testcase(
-                component=component,
-                section=section,
-                counter=global_counter,
-                id_prefix=id_prefix,
-                reference=reference,
-                depths=depths,
-                nav_path=nav_path
-            )
-            if shortcut_tc:
-                all_testcases.append(shortcut_tc)
-                global_counter += 1
-
-        # Part 3: 조건별 TC 분리 (해당 컴포넌트인 경우)
-        if include_conditions and tc_list:
-            # 마지막 기능 TC를 기준으로 조건별 분리
-            base_tc = tc_list[-1]
-            condition_tc_list = generate_condition_variants(
-                base_tc=base_tc,
-                component=component,
-                counter_start=global_counter,
-                id_prefix=id_prefix
-            )
-            if condition_tc_list:
-                all_testcases.extend(condition_tc_list)
-                global_counter += len(condition_tc_list)
-
-        # 예외 테스트케이스 생성 (옵션)
-        if include_exceptions:
-            exception_tc_list = generate_exception_testcases(
-                component=component,
-                section=section,
-                global_counter=global_counter,
-                id_prefix=id_prefix,
-                doc_name=doc_name,
-                version=version
-            )
-            all_testcases.extend(exception_tc_list)
-            global_counter += len(exception_tc_list)
 
-    return all_testcases
+def iter_testcase_dicts(testcases: Iterable[TestCase]) -> Iterator[dict]:
+    """테스트케이스를 하나씩 딕셔너리로 변환 (지연 변환)"""
+    for tc in testcases:
+        yield asdict(tc)
 
 
 def testcases_to_dict(testcases: List[TestCase]) -> List[dict]:
     """테스트케이스 리스트를 딕셔너리 리스트로 변환"""
-    return [asdict(tc) for tc in testcases]
+    return list(iter_testcase_dicts(testcases))
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python generate_testcase.py <extracted_json> [output_json] [id_prefix]")
+    usage = "Usage: python generate_testcase.py <extracted_json> [output_json] [id_prefix] [--workers N]"
+
+    # 옵션 파싱
+    workers = 1
+    positional = []
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--workers" and i + 1 < len(args):
+            workers = int(args[i + 1])
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+
+    if not positional:
+        print(usage)
         sys.exit(1)
 
-    input_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
-    id_prefix = sys.argv[3] if len(sys.argv) > 3 else "IT_OO"
+    input_path = Path(positional[0])
+    output_path = Path(positional[1]) if len(positional) > 1 else None
+    id_prefix = positional[2] if len(positional) > 2 else "IT_OO"
 
     if not input_path.exists():
         print(f"Error: File not found: {input_path}")
@@ -1683,7 +2131,7 @@ def main():
     with open(input_path, "r", encoding="utf-8") as f:
         extracted_data = json.load(f)
 
-    testcases = generate_testcases(extracted_data, id_prefix)
+    testcases = generate_testcases(extracted_data, id_prefix, workers=workers)
     result = {
         "project_info": extracted_data.get("project_info", {}),
         "total_testcases": len(testcases),
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+증분 테스트케이스 재생성
+
+이전 실행의 tc_data.json에 저장된 컴포넌트 인덱스(컴포넌트별 내용 해시 + TC ID 목록)와
+새로 추출한 컴포넌트를 비교하여, 추가/변경된 컴포넌트만 TC를 다시 생성하고
+나머지는 이전 TC를 그대로 재사용합니다.
+
+TC ID 규칙:
+- 변경 없는 컴포넌트: 이전 TC (ID 포함) 그대로 유지
+- 변경된 컴포넌트: 이전 ID를 앞에서부터 재사용, 늘어난 TC만 새 번호
+- 추가된 컴포넌트: 이전 최대 번호 다음부터 새 번호
+- 삭제된 컴포넌트: TC 제거 (ID는 재사용하지 않음)
+
+사용법:
+    py run_all.py "화면정의서.pptx" --incremental "output/화면정의서_tc_data.json"
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict
+from itertools import tee
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from generate_testcase import (
+    TestCase,
+    generate_component_testcase_lists,
+    generate_test_id,
+    iter_testcase_dicts,
+    iter_testcases,
+)
+
+
+# 인덱스 형식이 바뀌면 올려서 이전 인덱스 무시 (전체 재생성)
+INDEX_VERSION = 1
+
+# tc_data.json 안의 인덱스 키
+INDEX_KEY = "component_index"
+
+
+def component_fingerprint(component: dict) -> str:
+    """컴포넌트 내용 해시 (슬라이드 번호, 섹션, 이미지 분석 정보 포함)"""
+    payload = json.dumps(component, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def component_keys(components: List[dict]) -> List[str]:
+    """컴포넌트 식별 키 목록 (섹션 + 컴포넌트명 + 같은 이름 내 순번)
+
+    슬라이드 번호는 키에 넣지 않으므로 앞쪽에 슬라이드가 추가되어 번호가 밀려도
+    같은 컴포넌트로 인식되어 TC ID가 유지됩니다 (내용 변경으로 처리).
+    """
+    return list(iter_component_keys(components))
+
+
+def iter_component_keys(components: Iterable[dict]) -> Iterator[str]:
+    """component_keys를 컴포넌트 하나씩 소비하며 yield (스트리밍용)"""
+    seen: Dict[Tuple[str, str], int] = {}
+    for component in components:
+        base = (component.get("section", ""), component.get("component", ""))
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        yield f"{base[0]}\x1f{base[1]}\x1f{occurrence}"
+
+
+def _generation_options(
+    id_prefix: str,
+    project_info: dict,
+    include_exceptions: bool,
+    include_shortcuts: bool,
+    include_conditions: bool
+) -> dict:
+    """TC 내용에 영향을 주는 생성 옵션 (달라지면 전체 재생성)"""
+    return {
+        "id_prefix": id_prefix,
+        "project_info": project_info,
+        "include_exceptions": include_exceptions,
+        "include_shortcuts": include_shortcuts,
+        "include_conditions": include_conditions,
+    }
+
+
+def _id_number(test_case_id: str, id_prefix: str) -> Optional[int]:
+    """"IT_OP_012" → 12 (접두사가 다르면 None)"""
+    match = re.fullmatch(re.escape(id_prefix) + r"_(\d+)", test_case_id)
+    return int(match.group(1)) if match else None
+
+
+def load_previous_index(previous_tc_data: dict, options: dict) -> Optional[dict]:
+    """이전 tc_data에서 재사용 가능한 인덱스 로드
+
+    Returns:
+        {"components": {key: {"fingerprint", "test_case_ids"}}, "testcases": {id: dict}, "next_number"}
+        인덱스가 없거나 생성 옵션이 다르면 None
+    """
+    index = previous_tc_data.get(INDEX_KEY)
+    if not index or index.get("version") != INDEX_VERSION:
+        return None
+    if index.get("options") != options:
+        return None
+
+    id_prefix = options["id_prefix"]
+    testcases = {tc["test_case_id"]: tc for tc in previous_tc_data.get("testcases", [])}
+
+    max_number = 0
+    for test_case_id in testcases:
+        number = _id_number(test_case_id, id_prefix)
+        if number is not None:
+            max_number = max(max_number, number)
+    # 삭제된 컴포넌트의 ID도 재사용하지 않도록 인덱스 기준으로 최대값 계산
+    max_number = max(max_number, index.get("last_number", 0))
+
+    return {
+        "components": {entry["key"]: entry for entry in index.get("components", [])},
+        "testcases": testcases,
+        "next_number": max_number + 1,
+    }
+
+
+def generate_testcases_incremental(
+    extracted_data: dict,
+    previous_tc_data: dict = None,
+    id_prefix: str = "IT_OO",
+    include_exceptions: bool = False,
+    include_shortcuts: bool = True,
+    include_conditions: bool = True,
+    workers: int = 1
+) -> Tuple[List[dict], dict, Dict[str, int]]:
+    """이전 결과를 재사용하여 테스트케이스 생성
+
+    previous_tc_data가 없거나 재사용할 수 없으면 generate_testcases와
+    동일한 결과(1번부터 순차 ID)를 만듭니다.
+
+    Args:
+        extracted_data: 추출된 PPTX 데이터
+        previous_tc_data: 이전 실행의 tc_data (component_index 포함)
+        id_prefix: 테스트케이스 ID 접두사
+        include_exceptions: 예외 테스트케이스 포함 여부
+        include_shortcuts: 단축키 테스트케이스 포함 여부
+        include_conditions: 조건별 TC 분리 포함 여부
+        workers: 추가/변경 컴포넌트 TC 생성 프로세스 수 (1이면 직렬)
+
+    Returns:
+        (testcases 딕셔너리 목록, 새 component_index, 통계)
+        통계: {"reused", "changed", "added", "removed", "regenerated_components", "full_rebuild"}
+    """
+    project_info = extracted_data.get("project_info", {})
+    options = _generation_options(
+        id_prefix, project_info, include_exceptions, include_shortcuts, include_conditions
+    )
+
+    previous = load_previous_index(previous_tc_data, options) if previous_tc_data else None
+    previous_components = previous["components"] if previous else {}
+    previous_testcases = previous["testcases"] if previous else {}
+    next_number = previous["next_number"] if previous else 1
+
+    components = extracted_data.get("all_components", [])
+    keys = component_keys(components)
+
+    all_testcases: List[dict] = []
+    index_entries = []
+    stats = {
+        "reused": 0,
+        "changed": 0,
+        "added": 0,
+        "removed": 0,
+        "regenerated_components": 0,
+        "full_rebuild": previous is None,
+    }
+
+    # 1단계: 재사용 여부 판정, 추가/변경 컴포넌트만 모아서 TC 생성 (병렬 가능)
+    fingerprints = [component_fingerprint(component) for component in components]
+    pending = []
+    for position, (key, fingerprint) in enumerate(zip(keys, fingerprints)):
+        prev_entry = previous_components.get(key)
+        prev_ids = prev_entry["test_case_ids"] if prev_entry else []
+        reusable = (
+            prev_entry
+            and prev_entry["fingerprint"] == fingerprint
+            and all(tc_id in previous_testcases for tc_id in prev_ids)
+        )
+        if not reusable:
+            pending.append(position)
+
+    generated = dict(zip(pending, generate_component_testcase_lists(
+        [components[position] for position in pending],
+        id_prefix=id_prefix,
+        project_info=project_info,
+        include_exceptions=include_exceptions,
+        include_shortcuts=include_shortcuts,
+        include_conditions=include_conditions,
+        workers=workers
+    )))
+
+    # 2단계: 컴포넌트 순서대로 ID 부여 (새 번호는 직렬 생성과 같은 순서로 증가)
+    for position, (key, fingerprint) in enumerate(zip(keys, fingerprints)):
+        prev_entry = previous_components.get(key)
+        prev_ids = prev_entry["test_case_ids"] if prev_entry else []
+
+        # 변경 없음: 이전 TC 그대로 재사용 (ID가 모두 남아 있을 때만)
+        if position not in generated:
+            all_testcases.extend(previous_testcases[tc_id] for tc_id in prev_ids)
+            index_entries.append({"key": key, "fingerprint": fingerprint, "test_case_ids": prev_ids})
+            stats["reused"] += 1
+            continue
+
+        # 추가/변경: 해당 컴포넌트만 다시 생성한 TC
+        testcases: List[TestCase] = generated[position]
+
+        # ID 재배정: 이전 ID를 앞에서부터 재사용, 나머지는 새 번호
+        test_case_ids = []
+        for i, tc in enumerate(testcases):
+            if i < len(prev_ids):
+                tc.test_case_id = prev_ids[i]
+            else:
+                tc.test_case_id = generate_test_id(id_prefix, next_number)
+                next_number += 1
+            test_case_ids.append(tc.test_case_id)
+
+        all_testcases.extend(asdict(tc) for tc in testcases)
+        index_entries.append({"key": key, "fingerprint": fingerprint, "test_case_ids": test_case_ids})
+        stats["changed" if prev_entry else "added"] += 1
+        stats["regenerated_components"] += 1
+
+    stats["removed"] = len(set(previous_components) - set(keys))
+
+    index = {
+        "version": INDEX_VERSION,
+        "options": options,
+        "last_number": next_number - 1,
+        "components": index_entries,
+    }
+    return all_testcases, index, stats
+
+
+def iter_testcases_indexed(
+    components: Iterable[dict],
+    index: dict,
+    id_prefix: str = "IT_OO",
+    project_info: dict = None,
+    include_exceptions: bool = False,
+    include_shortcuts: bool = True,
+    include_conditions: bool = True
+) -> Iterator[dict]:
+    """전체 생성 결과를 TC 딕셔너리로 하나씩 yield하면서 component_index 구성 (스트리밍)
+
+    generate_testcases_incremental(previous_tc_data=None)과 같은 TC와 인덱스를 만들지만
+    TC 목록을 모아 두지 않으므로 메모리에는 컴포넌트 하나분의 TC만 남습니다.
+    index는 전달한 딕셔너리를 채우며, 이터레이터를 끝까지 소비해야 완성됩니다.
+    """
+    if project_info is None:
+        project_info = {}
+
+    index.clear()
+    index.update({
+        "version": INDEX_VERSION,
+        "options": _generation_options(
+            id_prefix, project_info, include_exceptions, include_shortcuts, include_conditions
+        ),
+        "last_number": 0,
+        "components": [],
+    })
+
+    # 지문/키/TC 생성이 같은 컴포넌트를 차례로 소비 (tee 버퍼는 최대 1개)
+    for_fingerprint, for_key, for_generate = tee(components, 3)
+    testcase_lists = iter_testcases(
+        for_generate,
+        id_prefix=id_prefix,
+        project_info=project_info,
+        include_exceptions=include_exceptions,
+        include_shortcuts=include_shortcuts,
+        include_conditions=include_conditions
+    )
+
+    for component, key, testcases in zip(for_fingerprint, iter_component_keys(for_key), testcase_lists):
+        test_case_ids = [tc.test_case_id for tc in testcases]
+        index["components"].append({
+            "key": key,
+            "fingerprint": component_fingerprint(component),
+            "test_case_ids": test_case_ids,
+        })
+        index["last_number"] += len(test_case_ids)
+        yield from iter_testcase_dicts(testcases)
+
+
+# tc_data.json 스트리밍 기록용 인코더 (TC마다 json.dumps가 인코더를 새로 만들지 않도록 재사용)
+_TC_DATA_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dumps_nested(value: Any, level: int = 1) -> str:
+    """json.dump(indent=2) 출력 안에 level 단계 들여쓰기로 들어갈 JSON 문자열"""
+    return _TC_DATA_ENCODER.encode(value).replace("\n", "\n" + "  " * level)
+
+
+def stream_tc_data(path: Path, project_info: dict, testcases: Iterable[dict], index: dict) -> Iterator[dict]:
+    """TC 딕셔너리를 tc_data.json에 한 건씩 기록하면서 그대로 넘겨줌
+
+    다음 단계(Excel 작성 등)가 소비하는 만큼 파일에 기록되므로 TC 목록을 모아 두지 않습니다.
+    TC를 모두 소비하면 total_testcases와 index(INDEX_KEY)를 기록하고 임시 파일을 path로 교체합니다.
+    중간에 실패하면 기존 path 파일은 그대로 남습니다.
+    (json.dump(indent=2)와 같은 형식, 단 total_testcases는 testcases 뒤에 기록)
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    total = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write('{\n  "project_info": ' + _dumps_nested(project_info) + ',\n  "testcases": [')
+            for tc in testcases:
+                f.write((",\n    " if total else "\n    ") + _dumps_nested(tc, 2))
+                total += 1
+                yield tc
+            f.write("\n  ],\n" if total else "],\n")
+            f.write(f'  "total_testcases": {total},\n  "{INDEX_KEY}": {_dumps_nested(index)}\n}}')
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
+def load_tc_data(path: Path) -> Dict[str, Any]:
+    """이전 tc_data.json 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
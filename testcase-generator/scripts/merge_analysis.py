@@ -23,7 +23,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 
 def normalize_component_name(name: str) -> str:
@@ -51,12 +51,65 @@ def normalize_component_name(name: str) -> str:
     return normalized
 
 
+# 타입 매칭 보너스 키워드 (컴포넌트 description에서 검색)
+TYPE_KEYWORDS = {
+    "button": ["button", "btn", "버튼", "클릭"],
+    "input": ["input", "field", "입력", "필드", "text"],
+    "list": ["list", "table", "grid", "목록", "테이블"],
+    "popup": ["popup", "modal", "dialog", "팝업", "모달"],
+    "label": ["label", "text", "레이블", "텍스트"],
+    "icon": ["icon", "아이콘"],
+}
+
+# 매칭으로 인정하는 최소 점수
+MIN_MATCH_SCORE = 0.5
+
+
+def _first_word(normalized: str) -> str:
+    """정규화된 이름의 첫 단어 (없으면 빈 문자열)"""
+    words = normalized.split()
+    return words[0] if words else ""
+
+
+def _element_keys(visual_element: dict) -> Tuple[str, List[str]]:
+    """시각적 요소의 (정규화된 이름, 타입 보너스 키워드)"""
+    element_name = visual_element.get("label", "") or visual_element.get("name", "")
+    element_type = visual_element.get("type", "")
+    keywords = TYPE_KEYWORDS.get(element_type.lower(), []) if element_type else []
+    return normalize_component_name(element_name), keywords
+
+
+def _match_score(normalized_element: str, keywords: List[str], normalized_comp: str, comp_desc: str) -> float:
+    """시각적 요소 ↔ 컴포넌트 매칭 점수 (이름 점수 + 타입 보너스)"""
+    score = 0.0
+
+    # 이름 매칭
+    if normalized_element and normalized_comp:
+        # 완전 일치
+        if normalized_element == normalized_comp:
+            score = 1.0
+        # 포함 관계
+        elif normalized_element in normalized_comp or normalized_comp in normalized_element:
+            score = 0.7
+        # 부분 일치 (첫 단어)
+        elif _first_word(normalized_element) and _first_word(normalized_element) == _first_word(normalized_comp):
+            score = 0.5
+
+    # 타입 매칭 보너스
+    if any(kw in comp_desc for kw in keywords):
+        score += 0.2
+
+    return score
+
+
 def find_matching_component(
     visual_element: dict,
     components: List[dict]
 ) -> Tuple[Optional[dict], float]:
     """시각적 요소와 매칭되는 컴포넌트 찾기
 
+    모든 컴포넌트를 순회합니다. 요소가 많으면 ComponentMatcher를 사용하세요.
+
     Args:
         visual_element: 이미지 분석에서 추출한 UI 요소
         components: 텍스트에서 추출한 컴포넌트 목록
@@ -64,51 +117,121 @@ def find_matching_component(
     Returns:
         (매칭된 컴포넌트, 신뢰도 점수)
     """
-    element_name = visual_element.get("label", "") or visual_element.get("name", "")
-    element_type = visual_element.get("type", "")
-    normalized_element = normalize_component_name(element_name)
+    normalized_element, keywords = _element_keys(visual_element)
 
     best_match = None
     best_score = 0.0
 
     for component in components:
-        comp_name = component.get("component", "")
-        normalized_comp = normalize_component_name(comp_name)
-
-        score = 0.0
-
-        # 이름 매칭
-        if normalized_element and normalized_comp:
-            # 완전 일치
-            if normalized_element == normalized_comp:
-                score = 1.0
-            # 포함 관계
-            elif normalized_element in normalized_comp or normalized_comp in normalized_element:
-                score = 0.7
-            # 부분 일치 (첫 단어)
-            elif normalized_element.split()[0] == normalized_comp.split()[0] if normalized_element.split() and normalized_comp.split() else False:
-                score = 0.5
-
-        # 타입 매칭 보너스
+        normalized_comp = normalize_component_name(component.get("component", ""))
         comp_desc = component.get("description", "").lower()
-        if element_type:
-            type_keywords = {
-                "button": ["button", "btn", "버튼", "클릭"],
-                "input": ["input", "field", "입력", "필드", "text"],
-                "list": ["list", "table", "grid", "목록", "테이블"],
-                "popup": ["popup", "modal", "dialog", "팝업", "모달"],
-                "label": ["label", "text", "레이블", "텍스트"],
-                "icon": ["icon", "아이콘"],
-            }
-            keywords = type_keywords.get(element_type.lower(), [])
-            if any(kw in comp_desc for kw in keywords):
-                score += 0.2
+        score = _match_score(normalized_element, keywords, normalized_comp, comp_desc)
 
         if score > best_score:
             best_score = score
             best_match = component
 
-    return (best_match, best_score) if best_score >= 0.5 else (None, 0.0)
+    return (best_match, best_score) if best_score >= MIN_MATCH_SCORE else (None, 0.0)
+
+
+class ComponentMatcher:
+    """컴포넌트 이름 인덱스 (find_matching_component와 같은 결과를 후보만 비교해 계산)
+
+    이름 점수가 0인 컴포넌트는 타입 보너스(0.2)만으로 최소 점수에 도달할 수 없으므로,
+    이름이 완전 일치/포함/첫 단어 일치하는 후보만 인덱스에서 꺼내 점수를 계산합니다.
+    - 완전 일치, 요소 ⊇ 컴포넌트: 정규화 이름 → 위치 해시 맵 (요소 이름의 부분 문자열로 조회)
+    - 요소 ⊆ 컴포넌트: 길이 GRAM_SIZE 이하 부분 문자열 → 위치 목록 (가장 짧은 목록만 `in`으로 확인)
+    - 첫 단어 일치: 첫 단어 → 위치 버킷
+
+    슬라이드 번호는 기존 매칭에서도 조건이 아니므로 후보를 슬라이드로 좁히지 않습니다.
+    동점이면 목록에서 앞선 컴포넌트를 선택합니다 (순회 방식과 동일).
+    """
+
+    # 부분 문자열 인덱스에 넣는 최대 길이
+    GRAM_SIZE = 3
+
+    def __init__(self, components: List[dict]):
+        self._names: List[str] = []
+        self._descriptions: List[str] = []
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_first_word: Dict[str, List[int]] = {}
+        self._grams: Dict[str, List[int]] = {}
+
+        for component in components:
+            self._index(component)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _index(self, component: dict):
+        position = len(self._names)
+        normalized = normalize_component_name(component.get("component", ""))
+        self._names.append(normalized)
+        self._descriptions.append(component.get("description", "").lower())
+        if not normalized:
+            return
+
+        self._by_name.setdefault(normalized, []).append(position)
+        first_word = _first_word(normalized)
+        if first_word:
+            self._by_first_word.setdefault(first_word, []).append(position)
+        grams = {
+            normalized[start:start + size]
+            for size in range(1, self.GRAM_SIZE + 1)
+            for start in range(len(normalized) - size + 1)
+        }
+        for gram in grams:
+            self._grams.setdefault(gram, []).append(position)
+
+    def add(self, component: dict) -> int:
+        """목록 끝에 추가된 컴포넌트를 인덱싱하고 위치 반환"""
+        self._index(component)
+        return len(self._names) - 1
+
+    def _candidates(self, normalized_element: str) -> Set[int]:
+        candidates: Set[int] = set()
+
+        # 완전 일치 + 컴포넌트 이름이 요소 이름에 포함
+        length = len(normalized_element)
+        for start in range(length):
+            for end in range(start + 1, length + 1):
+                positions = self._by_name.get(normalized_element[start:end])
+                if positions:
+                    candidates.update(positions)
+
+        # 요소 이름이 컴포넌트 이름에 포함 (요소의 모든 gram을 가진 컴포넌트 중에서 확인)
+        if length <= self.GRAM_SIZE:
+            candidates.update(self._grams.get(normalized_element, ()))
+        else:
+            postings = min(
+                (self._grams.get(normalized_element[start:start + self.GRAM_SIZE], ())
+                 for start in range(length - self.GRAM_SIZE + 1)),
+                key=len,
+            )
+            candidates.update(p for p in postings if normalized_element in self._names[p])
+
+        # 첫 단어 일치
+        first_word = _first_word(normalized_element)
+        if first_word:
+            candidates.update(self._by_first_word.get(first_word, ()))
+
+        return candidates
+
+    def match(self, visual_element: dict) -> Tuple[Optional[int], float]:
+        """매칭되는 컴포넌트 위치와 신뢰도 점수 (없으면 (None, 0.0))"""
+        normalized_element, keywords = _element_keys(visual_element)
+        if not normalized_element:
+            return None, 0.0
+
+        best_position = None
+        best_score = 0.0
+        for position in sorted(self._candidates(normalized_element)):
+            score = _match_score(normalized_element, keywords, self._names[position], self._descriptions[position])
+            if score > best_score:
+                best_score = score
+                best_position = position
+
+        return (best_position, best_score) if best_score >= MIN_MATCH_SCORE else (None, 0.0)
 
 
 def merge_visual_info(component: dict, visual_element: dict) -> dict:
@@ -243,6 +366,9 @@ def merge_image_analysis(
         "unmatched_visual": 0
     }
 
+    # 컴포넌트 이름 인덱스 (visual_info 병합은 이름/description을 바꾸지 않으므로 추가 시에만 갱신)
+    matcher = ComponentMatcher(components)
+
     # 이미지별 분석 결과 처리
     for image_result in image_analysis.get("images", []):
         slide_number = image_result.get("slide_number", 0)
@@ -250,18 +376,18 @@ def merge_image_analysis(
 
         for element in elements:
             # 기존 컴포넌트와 매칭 시도
-            match, score = find_matching_component(element, components)
+            idx, score = matcher.match(element)
 
-            if match:
+            if idx is not None:
                 # 매칭 성공: 시각 정보 병합
-                idx = components.index(match)
-                components[idx] = merge_visual_info(match, element)
+                components[idx] = merge_visual_info(components[idx], element)
                 stats["matched"] += 1
                 stats["updated"] += 1
             elif add_new_elements:
                 # 매칭 실패: 새 컴포넌트로 추가
                 new_component = create_component_from_visual(element, slide_number)
                 components.append(new_component)
+                matcher.add(new_component)
                 stats["added"] += 1
             else:
                 stats["unmatched_visual"] += 1
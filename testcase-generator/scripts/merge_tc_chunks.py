@@ -8,22 +8,44 @@
 - TC ID 순차 재할당
 - 프로젝트 정보 병합
 - 크로스 레퍼런스 정규화
+
+병합은 청크 단위 스트리밍으로 수행합니다.
+- 청크 파일을 하나씩 로드해 청크 안에서만 정렬한 뒤 임시 JSON Lines 파일로 내려둠
+- 정렬 키 (페이지, 청크 번호, 순번)로 청크들을 k-way 병합하면서 TC ID를 할당하고 바로 기록
+전체 TC를 한꺼번에 메모리에 올리거나 전역 정렬하지 않습니다.
+
+--watch 모드는 청크 에이전트가 실행 중일 때 미리 띄워 두고, tc_chunk_*.json이 도착할 때마다
+검증/정규화/청크 내 정렬을 끝내 두었다가 마지막 청크가 도착하면 바로 병합 결과를 기록합니다.
+
+병합한 청크의 실제 소요 시간은 output/.stats/에 기록되어 다음 청크 계획에 쓰입니다 (timing_store.py).
 """
 
+import heapq
 import json
+import os
 import sys
 import re
 import glob
+import sqlite3
+import tempfile
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 # 중앙 설정에서 가져오기
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 try:
-    from config import DEFAULT_TC_PREFIX
+    from config import DEFAULT_TC_PREFIX, MERGE_WATCH_POLL_MS, MERGE_WATCH_TIMEOUT_SEC
 except ImportError:
     # config.py를 찾을 수 없는 경우 기본값 사용
     DEFAULT_TC_PREFIX = "IT_XX"
+    MERGE_WATCH_POLL_MS = 200
+    MERGE_WATCH_TIMEOUT_SEC = 3600
+
+CHUNK_FILE_PATTERN = "tc_chunk_*.json"
+
+from regex_trie import trie_pattern
+from timing_store import ensure_dispatch_mark, record_chunk_timings
 
 
 def extract_page_number(reference: str) -> int:
@@ -44,34 +66,11 @@ def extract_page_number(reference: str) -> int:
     return 999999
 
 
-def load_chunk_files(output_dir: Path) -> List[Dict[str, Any]]:
-    """tc_chunk_*.json 파일들 로드"""
-    chunks = []
-    pattern = str(output_dir / "tc_chunk_*.json")
-    chunk_files = sorted(glob.glob(pattern))
-
-    for chunk_file in chunk_files:
-        with open(chunk_file, "r", encoding="utf-8") as f:
-            chunk_data = json.load(f)
-            chunks.append({
-                "file": chunk_file,
-                "data": chunk_data
-            })
-        print(f"  로드: {Path(chunk_file).name}")
-
-    return chunks
-
-
-def merge_project_info(chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """프로젝트 정보 병합 (첫 번째 청크 기준, 나머지는 보완)"""
-    merged_info = {}
-
-    for chunk in chunks:
-        chunk_info = chunk["data"].get("project_info", {})
-        for key, value in chunk_info.items():
-            if key not in merged_info or not merged_info[key]:
-                merged_info[key] = value
-
+def update_project_info(merged_info: Dict[str, Any], chunk_info: Dict[str, Any]) -> Dict[str, Any]:
+    """청크 하나의 프로젝트 정보로 병합 결과 보완 (비어 있는 키만 채움)"""
+    for key, value in chunk_info.items():
+        if key not in merged_info or not merged_info[key]:
+            merged_info[key] = value
     return merged_info
 
 
@@ -91,96 +90,223 @@ def normalize_field_names(tc: Dict[str, Any]) -> Dict[str, Any]:
     return tc
 
 
-def collect_all_testcases(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """모든 청크에서 테스트케이스 수집"""
-    all_testcases = []
+def chunk_testcases(chunk_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """청크 데이터의 TC 목록 (testcases 또는 test_cases 키 모두 지원)"""
+    testcases = chunk_data.get("testcases", [])
+    if not testcases:
+        testcases = chunk_data.get("test_cases", [])
+    return testcases
 
-    for chunk in chunks:
-        # testcases 또는 test_cases 키 모두 지원
-        testcases = chunk["data"].get("testcases", [])
-        if not testcases:
-            testcases = chunk["data"].get("test_cases", [])
-        chunk_id = chunk["data"].get("chunk_id", 0)
 
-        for tc in testcases:
-            # 필드명 정규화
-            tc = normalize_field_names(tc)
-            # 원본 청크 정보 추가 (디버깅용)
-            tc["_source_chunk"] = chunk_id
-            all_testcases.append(tc)
+_CHUNK_ID_PATTERN = re.compile(r'CHUNK(\d+)_(\d+)')
 
-    return all_testcases
 
+def testcase_sort_key(tc: Dict[str, Any]) -> Tuple[int, int, int]:
+    """병합 정렬 키 (페이지 번호, 청크 번호, 청크 내 순번)"""
+    page_num = extract_page_number(tc.get("reference", ""))
+    # 같은 페이지 내에서는 원래 순서 유지
+    original_id = tc.get("test_case_id", "")
+    # CHUNK1_001 → (1, 1), CHUNK2_015 → (2, 15)
+    chunk_match = _CHUNK_ID_PATTERN.search(original_id)
+    if chunk_match:
+        return (page_num, int(chunk_match.group(1)), int(chunk_match.group(2)))
+    return (page_num, 0, 0)
 
-def sort_testcases_by_page(testcases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """페이지 번호 기준 정렬"""
-    def sort_key(tc):
-        page_num = extract_page_number(tc.get("reference", ""))
-        # 같은 페이지 내에서는 원래 순서 유지
-        original_id = tc.get("test_case_id", "")
-        # CHUNK1_001 → (1, 1), CHUNK2_015 → (2, 15)
-        chunk_match = re.search(r'CHUNK(\d+)_(\d+)', original_id)
-        if chunk_match:
-            return (page_num, int(chunk_match.group(1)), int(chunk_match.group(2)))
-        return (page_num, 0, 0)
 
-    return sorted(testcases, key=sort_key)
+def compile_id_pattern(ids) -> Optional["re.Pattern"]:
+    """ID 집합을 트라이 정규식 하나로 컴파일 (ID가 없으면 None)
 
+    ID 수만큼 분기를 나열하는 대신 공통 접두사(CHUNK1_0 등)를 묶으므로
+    텍스트 한 위치에서 ID 길이만큼만 비교합니다.
+    """
+    trie: dict = {}
+    for tc_id in ids:
+        node = trie
+        for ch in tc_id:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return re.compile(trie_pattern(trie)) if trie else None
 
-def reassign_tc_ids(testcases: List[Dict[str, Any]], prefix: str = DEFAULT_TC_PREFIX) -> List[Dict[str, Any]]:
-    """TC ID 순차 재할당"""
-    for idx, tc in enumerate(testcases, start=1):
-        # 원래 ID 백업
-        tc["_original_id"] = tc.get("test_case_id", "")
-        # 새 ID 할당
-        tc["test_case_id"] = f"{prefix}_{idx:03d}"
 
-    return testcases
+def detect_prefix(tc_id: str) -> Optional[str]:
+    """TC ID에서 접두사 추출 (IT_OP_001 → IT_OP, 없으면 None)"""
+    match = re.match(r'(IT_[A-Z]+)_', tc_id)
+    return match.group(1) if match else None
 
 
-def normalize_cross_references(testcases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """크로스 레퍼런스 정규화 (청크 ID → 실제 TC ID 매핑)"""
-    # ID 매핑 테이블 생성
-    id_mapping = {}
-    for tc in testcases:
-        original_id = tc.get("_original_id", "")
-        new_id = tc.get("test_case_id", "")
-        if original_id:
-            id_mapping[original_id] = new_id
-
-    # 레퍼런스 내 ID 치환 (필요 시)
-    for tc in testcases:
-        reference = tc.get("reference", "")
-        # 청크 ID가 레퍼런스에 포함된 경우 치환
-        for old_id, new_id in id_mapping.items():
-            if old_id in reference:
-                reference = reference.replace(old_id, new_id)
-        tc["reference"] = reference
+# ===== 스트리밍 병합 =====
 
-    return testcases
+# tc_data.json 기록용 (json.dump(indent=2)와 같은 형식) / 임시 파일 한 줄(TC 1건) 기록용
+_TC_DATA_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+_SPILL_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
+SortKey = Tuple[int, int, int]
 
-def clean_internal_fields(testcases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """내부 사용 필드 제거"""
-    for tc in testcases:
-        tc.pop("_source_chunk", None)
-        tc.pop("_original_id", None)
-    return testcases
 
+def _dumps_nested(value: Any, level: int = 1) -> str:
+    """json.dump(indent=2) 출력 안에 level 단계 들여쓰기로 들어갈 JSON 문자열"""
+    return _TC_DATA_ENCODER.encode(value).replace("\n", "\n" + "  " * level)
+
+
+def _entry_sort_key(entry: Tuple[SortKey, Any]) -> SortKey:
+    return entry[0]
+
+
+class ChunkSpill:
+    """청크 안에서만 정렬해 임시 JSON Lines 파일로 내려둔 청크
+
+    TC 본문은 파일에 두고, 메모리에는 TC 순서대로 (정렬 키, 원래 TC ID)와
+    프로젝트 정보, 접두사 추출용 첫 TC ID만 남깁니다.
+    """
+
+    __slots__ = ("name", "path", "keys", "project_info", "first_tc_id")
+
+    def __init__(self, name: str, chunk_data: Dict[str, Any], spill_dir: Path):
+        testcases = chunk_testcases(chunk_data)
+        self.name = name
+        self.path = Path(spill_dir) / (Path(name).stem + ".jsonl")
+        self.project_info = chunk_data.get("project_info", {})
+        self.first_tc_id = testcases[0].get("test_case_id", "") if testcases else None
+
+        # 필드명 정규화 후 청크 내 정렬 (대부분 이미 페이지 순이라 안정 정렬이 거의 선형)
+        entries = [(testcase_sort_key(tc), normalize_field_names(tc)) for tc in testcases]
+        entries.sort(key=_entry_sort_key)
+
+        with open(self.path, "w", encoding="utf-8") as f:
+            for _, tc in entries:
+                f.write(_SPILL_ENCODER.encode(tc) + "\n")
+        self.keys: List[Tuple[SortKey, str]] = [(key, tc.get("test_case_id", "")) for key, tc in entries]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Tuple[SortKey, Dict[str, Any]]]:
+        """(정렬 키, TC)를 정렬 순서대로 순회 (임시 파일에서 한 줄씩 읽음)"""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for (key, _), line in zip(self.keys, f):
+                yield key, json.loads(line)
+
+
+class ChunkMerger:
+    """청크별 임시 파일과 병합 상태
+
+    add()로 청크를 받을 때마다 청크 안에서만 정렬해 내려두고, write()에서 청크들을
+    (페이지, 청크 번호, 순번) 순으로 k-way 병합하면서 TC ID 할당/크로스 레퍼런스 정규화를 거쳐
+    바로 기록합니다. 같은 이름의 청크를 다시 추가하면 이전 내용을 대체합니다.
+
+    청크 순서(프로젝트 정보 보완, 같은 키끼리의 순서, 접두사 추출)는 추가 순서와 무관하게
+    파일명 순이므로, 결과는 모든 청크를 한꺼번에 로드해 전역 정렬하던 방식과 같습니다.
+    """
+
+    def __init__(self, spill_dir: Path):
+        self.spill_dir = Path(spill_dir)
+        self._spills: Dict[str, ChunkSpill] = {}
+
+    def __len__(self) -> int:
+        return len(self._spills)
 
-def detect_prefix_from_chunks(chunks: List[Dict[str, Any]]) -> str:
-    """청크에서 TC ID 접두사 추출"""
-    for chunk in chunks:
-        testcases = chunk["data"].get("testcases", [])
-        if not testcases:
-            testcases = chunk["data"].get("test_cases", [])
-        if testcases:
-            tc_id = testcases[0].get("test_case_id", "")
-            # IT_OP_001 → IT_OP
-            match = re.match(r'(IT_[A-Z]+)_', tc_id)
-            if match:
-                return match.group(1)
-    return DEFAULT_TC_PREFIX
+    def __contains__(self, name: str) -> bool:
+        return name in self._spills
+
+    def add(self, name: str, chunk_data: Dict[str, Any]) -> ChunkSpill:
+        spill = ChunkSpill(name, chunk_data, self.spill_dir)
+        self._spills[name] = spill
+        return spill
+
+    def add_file(self, chunk_file: Path) -> ChunkSpill:
+        with open(chunk_file, "r", encoding="utf-8") as f:
+            chunk_data = json.load(f)
+        return self.add(Path(chunk_file).name, chunk_data)
+
+    @property
+    def spills(self) -> List[ChunkSpill]:
+        """파일명 순 청크 목록"""
+        return [self._spills[name] for name in sorted(self._spills)]
+
+    @property
+    def total_testcases(self) -> int:
+        return sum(len(spill) for spill in self._spills.values())
+
+    def project_info(self) -> Dict[str, Any]:
+        """프로젝트 정보 병합 (청크 순서대로, 비어 있는 키만 채움)"""
+        merged_info = {}
+        for spill in self.spills:
+            update_project_info(merged_info, spill.project_info)
+        return merged_info
+
+    def detect_prefix(self) -> str:
+        """TC ID 접두사 추출 (TC가 있는 첫 청크의 첫 TC ID 기준, 없으면 기본 접두사)"""
+        for spill in self.spills:
+            if spill.first_tc_id is not None:
+                prefix = detect_prefix(spill.first_tc_id)
+                if prefix:
+                    return prefix
+        return DEFAULT_TC_PREFIX
+
+    def id_mapping(self, prefix: str) -> Dict[str, str]:
+        """원래 ID → 새 TC ID 매핑 (TC 본문 없이 정렬 키만 병합)"""
+        mapping = {}
+        merged = heapq.merge(*(spill.keys for spill in self.spills), key=_entry_sort_key)
+        for idx, (_, original_id) in enumerate(merged, start=1):
+            if original_id:
+                mapping[original_id] = f"{prefix}_{idx:03d}"
+        return mapping
+
+    def iter_testcases(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """병합 순서대로 TC 생성 (TC ID 재할당, 크로스 레퍼런스 정규화, 내부 필드 없음)
+
+        크로스 레퍼런스는 뒤쪽 TC를 가리킬 수도 있으므로 ID 매핑을 먼저 만든 뒤 TC 본문을 병합합니다.
+        """
+        id_mapping = self.id_mapping(prefix)
+        pattern = compile_id_pattern(id_mapping)
+        replace = lambda match: id_mapping[match.group()]
+
+        merged = heapq.merge(*self.spills, key=_entry_sort_key)
+        for idx, (_, tc) in enumerate(merged, start=1):
+            tc["test_case_id"] = f"{prefix}_{idx:03d}"
+            reference = tc.get("reference", "")
+            if pattern is not None and reference:
+                reference = pattern.sub(replace, reference)
+            tc["reference"] = reference
+            yield tc
+
+    def write(self, output_file: Path, prefix: Optional[str] = None) -> int:
+        """병합 결과를 tc_data.json 형식으로 스트리밍 기록하고 TC 수 반환
+
+        임시 파일에 기록한 뒤 교체하므로 중간에 실패해도 기존 파일은 그대로 남습니다.
+        """
+        if not prefix:
+            prefix = self.detect_prefix()
+        output_file = Path(output_file)
+        tmp_path = output_file.with_name(output_file.name + ".tmp")
+        count = 0
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(
+                    '{\n  "project_info": ' + _dumps_nested(self.project_info())
+                    + f',\n  "total_testcases": {self.total_testcases}'
+                    + f',\n  "merged_from_chunks": {len(self)},\n  "testcases": ['
+                )
+                for tc in self.iter_testcases(prefix):
+                    f.write((",\n    " if count else "\n    ") + _dumps_nested(tc, 2))
+                    count += 1
+                f.write("\n  ]\n}" if count else "]\n}")
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, output_file)
+        return count
+
+
+def record_merged_timings(output_dir: Path, merger: ChunkMerger):
+    """병합한 청크들의 소요 시간 기록 (기록 실패는 병합 결과에 영향 없음)"""
+    try:
+        recorded = record_chunk_timings(output_dir, {spill.name: len(spill) for spill in merger.spills})
+    except (sqlite3.Error, OSError) as e:
+        print(f"경고: 청크 실행 시간 기록 실패 ({e})")
+        return
+    if recorded:
+        print(f"청크 실행 시간 기록: {recorded}개 청크 (.stats/)")
 
 
 def merge_tc_chunks(
@@ -188,76 +314,187 @@ def merge_tc_chunks(
     prefix: Optional[str] = None,
     output_file: Optional[Path] = None
 ) -> Dict[str, Any]:
-    """TC 청크 병합 메인 함수"""
+    """TC 청크 병합 메인 함수
+
+    결과 TC는 output_file로만 스트리밍 기록합니다.
+
+    Returns:
+        요약 정보 {project_info, total_testcases, merged_from_chunks, output_file}
+        (청크 파일이 없으면 빈 dict). 예전과 달리 병합된 TC 목록("testcases")은
+        반환하지 않으므로 TC가 필요하면 output_file을 읽어야 합니다.
+    """
     print("=" * 60)
     print("  TC 청크 병합")
     print("=" * 60)
 
-    # 청크 파일 로드
+    # 청크 파일 로드 → 청크별 정렬 후 임시 파일로 내려둠
     print("\n청크 파일 로딩...")
-    chunks = load_chunk_files(output_dir)
+    chunk_files = sorted(glob.glob(str(output_dir / CHUNK_FILE_PATTERN)))
 
-    if not chunks:
+    if not chunk_files:
         print("Error: tc_chunk_*.json 파일을 찾을 수 없습니다.")
         return {}
 
-    print(f"  총 {len(chunks)}개 청크 로드 완료")
-
-    # 접두사 결정
-    if not prefix:
-        prefix = detect_prefix_from_chunks(chunks)
-    print(f"\nTC ID 접두사: {prefix}")
-
-    # 프로젝트 정보 병합
-    print("\n프로젝트 정보 병합...")
-    project_info = merge_project_info(chunks)
+    if output_file is None:
+        output_file = output_dir / "tc_data.json"
 
-    # 테스트케이스 수집
-    print("테스트케이스 수집...")
-    all_testcases = collect_all_testcases(chunks)
-    print(f"  총 {len(all_testcases)}개 TC 수집")
+    with tempfile.TemporaryDirectory(prefix=".tc_merge_", dir=output_dir) as spill_dir:
+        merger = ChunkMerger(Path(spill_dir))
+        for chunk_file in chunk_files:
+            merger.add_file(Path(chunk_file))
+            print(f"  로드: {Path(chunk_file).name}")
 
-    # 페이지 순서로 정렬
-    print("페이지 순서로 정렬...")
-    sorted_testcases = sort_testcases_by_page(all_testcases)
+        print(f"  총 {len(merger)}개 청크 로드 완료")
+        print(f"  총 {merger.total_testcases}개 TC 수집")
 
-    # TC ID 재할당
-    print("TC ID 재할당...")
-    reassigned_testcases = reassign_tc_ids(sorted_testcases, prefix)
+        # 접두사 결정
+        if not prefix:
+            prefix = merger.detect_prefix()
+        print(f"\nTC ID 접두사: {prefix}")
 
-    # 크로스 레퍼런스 정규화
-    print("크로스 레퍼런스 정규화...")
-    normalized_testcases = normalize_cross_references(reassigned_testcases)
+        # 페이지 순 k-way 병합 + TC ID 재할당 + 크로스 레퍼런스 정규화 → 바로 기록
+        print("페이지 순서로 병합 (TC ID 재할당, 크로스 레퍼런스 정규화)...")
+        total = merger.write(output_file, prefix)
+        project_info = merger.project_info()
+        record_merged_timings(output_dir, merger)
 
-    # 내부 필드 정리
-    final_testcases = clean_internal_fields(normalized_testcases)
+    print("\n" + "-" * 60)
+    print(f"병합 완료: {total}개 TC")
+    print(f"출력 파일: {output_file}")
+    print("=" * 60)
 
-    # 결과 생성
-    result = {
+    return {
         "project_info": project_info,
-        "total_testcases": len(final_testcases),
-        "merged_from_chunks": len(chunks),
-        "testcases": final_testcases
+        "total_testcases": total,
+        "merged_from_chunks": len(chunk_files),
+        "output_file": str(output_file),
     }
 
-    # 저장
+
+# ===== 감시 모드 =====
+
+def validate_chunk_data(chunk_data: Any) -> Optional[str]:
+    """청크 데이터 구조 검사 (문제 없으면 None, 있으면 오류 메시지)"""
+    if not isinstance(chunk_data, dict):
+        return "최상위가 JSON 객체가 아님"
+    testcases = chunk_testcases(chunk_data)
+    if not isinstance(testcases, list):
+        return "testcases가 목록이 아님"
+    for idx, tc in enumerate(testcases, start=1):
+        if not isinstance(tc, dict):
+            return f"{idx}번째 TC가 JSON 객체가 아님"
+    return None
+
+
+def expected_chunk_count(output_dir: Path) -> Optional[int]:
+    """chunk_plan.json의 total_chunks (없으면 None)"""
+    plan_path = output_dir / "chunk_plan.json"
+    if not plan_path.exists():
+        return None
+    with open(plan_path, "r", encoding="utf-8") as f:
+        return json.load(f).get("total_chunks")
+
+
+def watch_tc_chunks(
+    output_dir: Path,
+    expected_chunks: int,
+    prefix: Optional[str] = None,
+    output_file: Optional[Path] = None,
+    poll_interval: float = MERGE_WATCH_POLL_MS / 1000,
+    timeout: float = MERGE_WATCH_TIMEOUT_SEC
+) -> Dict[str, Any]:
+    """tc_chunk_*.json을 감시하며 도착한 청크부터 병합 준비, 청크가 모두 모이면 병합 결과 기록
+
+    파일 크기/수정 시각이 바뀔 때마다 다시 읽으며, JSON이 아직 완성되지 않은 파일(기록 중)은
+    다음 확인 때 다시 시도합니다. 이미 반영한 청크가 다시 기록되면 새 내용으로 대체합니다.
+    결과는 merge_tc_chunks와 같으며, timeout(초, 0이면 제한 없음) 안에 청크가 모두 모이지 않으면
+    아무것도 기록하지 않고 빈 딕셔너리를 반환합니다.
+    """
+    print("=" * 60)
+    print("  TC 청크 병합 (감시 모드)")
+    print("=" * 60)
+    print(f"\n청크 {expected_chunks}개 대기 중... ({output_dir / CHUNK_FILE_PATTERN})")
+
     if output_file is None:
         output_file = output_dir / "tc_data.json"
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    # 디스패치 시각이 기록되지 않았으면 감시 시작 시각을 대신 사용 (청크 소요 시간 기록용)
+    try:
+        ensure_dispatch_mark(output_dir)
+    except OSError as e:
+        print(f"경고: 디스패치 시각 기록 실패 ({e})")
+
+    # 파일명 → 마지막으로 읽은 (크기, 수정 시각)
+    seen: Dict[str, Tuple[int, int]] = {}
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+
+    with tempfile.TemporaryDirectory(prefix=".tc_merge_", dir=output_dir) as spill_dir:
+        merger = ChunkMerger(Path(spill_dir))
+
+        while len(merger) < expected_chunks:
+            for chunk_file in sorted(glob.glob(str(output_dir / CHUNK_FILE_PATTERN))):
+                chunk_path = Path(chunk_file)
+                try:
+                    stat = chunk_path.stat()
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns)
+                if seen.get(chunk_path.name) == signature:
+                    continue
+                seen[chunk_path.name] = signature
+
+                try:
+                    with open(chunk_path, "r", encoding="utf-8") as f:
+                        chunk_data = json.load(f)
+                except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                    # 에이전트가 아직 기록 중 → 파일이 바뀌면 다시 시도
+                    continue
+
+                error = validate_chunk_data(chunk_data)
+                if error:
+                    print(f"  경고: {chunk_path.name} 건너뜀 ({error})")
+                    continue
+
+                start = time.perf_counter()
+                spill = merger.add(chunk_path.name, chunk_data)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"  [{len(merger)}/{expected_chunks}] {chunk_path.name}: {len(spill)}개 TC ({elapsed_ms:.0f}ms)")
+
+            if len(merger) >= expected_chunks:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                print(f"Error: 제한 시간 안에 청크가 모두 도착하지 않았습니다 ({len(merger)}/{expected_chunks})")
+                return {}
+            time.sleep(poll_interval)
+
+        # 마지막 청크 도착 → k-way 병합 + 기록만 남음
+        start = time.perf_counter()
+        if not prefix:
+            prefix = merger.detect_prefix()
+        total = merger.write(output_file, prefix)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        project_info = merger.project_info()
+        merged_from = len(merger)
+        record_merged_timings(output_dir, merger)
 
     print("\n" + "-" * 60)
-    print(f"병합 완료: {len(final_testcases)}개 TC")
+    print(f"병합 완료: {total}개 TC (TC ID 접두사: {prefix}, 마지막 청크 도착 후 {elapsed_ms:.0f}ms)")
     print(f"출력 파일: {output_file}")
     print("=" * 60)
 
-    return result
+    return {
+        "project_info": project_info,
+        "total_testcases": total,
+        "merged_from_chunks": merged_from,
+        "output_file": str(output_file),
+    }
 
 
 def main():
+    usage = ("Usage: python merge_tc_chunks.py <output_dir> [--prefix IT_XX] [--output <path>]"
+             " [--watch [--expect N] [--timeout SEC]]")
     if len(sys.argv) < 2:
-        print("Usage: python merge_tc_chunks.py <output_dir> [--prefix IT_XX] [--output <path>]")
+        print(usage)
         sys.exit(1)
 
     output_dir = Path(sys.argv[1])
@@ -265,6 +502,9 @@ def main():
     # 옵션 파싱
     prefix = None
     output_file = None
+    watch = False
+    expected_chunks = None
+    timeout = MERGE_WATCH_TIMEOUT_SEC
 
     args = sys.argv[2:]
     i = 0
@@ -275,6 +515,15 @@ def main():
         elif args[i] == "--output" and i + 1 < len(args):
             output_file = Path(args[i + 1])
             i += 2
+        elif args[i] == "--watch":
+            watch = True
+            i += 1
+        elif args[i] == "--expect" and i + 1 < len(args):
+            expected_chunks = int(args[i + 1])
+            i += 2
+        elif args[i] == "--timeout" and i + 1 < len(args):
+            timeout = float(args[i + 1])
+            i += 2
         else:
             i += 1
 
@@ -282,6 +531,19 @@ def main():
         print(f"Error: Directory not found: {output_dir}")
         sys.exit(1)
 
+    if watch:
+        # 대기할 청크 수: --expect 또는 chunk_plan.json의 total_chunks
+        if expected_chunks is None:
+            expected_chunks = expected_chunk_count(output_dir)
+        if not expected_chunks:
+            print("Error: 대기할 청크 수를 알 수 없습니다 (--expect N 또는 chunk_plan.json 필요)")
+            print(usage)
+            sys.exit(1)
+        result = watch_tc_chunks(output_dir, expected_chunks, prefix, output_file, timeout=timeout)
+        if not result:
+            sys.exit(1)
+        return result
+
     # 병합 실행
     result = merge_tc_chunks(output_dir, prefix, output_file)
 
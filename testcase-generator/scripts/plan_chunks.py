@@ -7,12 +7,22 @@ PPTX 데이터를 청크로 분할하는 계획 생성 스크립트
 - 섹션 기반 그룹핑
 - 15페이지 초과 섹션 분할
 - 컴포넌트 80개 초과 시 추가 분할
+
+balanced 분할 (기본)은 슬라이드별 예상 소요 시간(SlideCostModel)을 구해
+문서 순서를 유지한 채 병렬 에이전트 전체 소요 시간(makespan)이 가장 짧아지도록 청크를 나눕니다.
+페이지/컴포넌트 한도는 그대로 상한으로 지키며, 청크 경계는 가능하면 섹션 경계에 맞춥니다.
+
+output/.stats/에 청크 실행 시간 기록(timing_store.py)이 충분히 쌓이면 비용 모델 계수를 기록으로 추정하고,
+정적 페이지/컴포넌트 한도 대신 청크당 목표 소요 시간(CHUNK_TARGET_SEC)으로 청크 크기를 정합니다.
 """
 
+import heapq
 import json
 import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 # 중앙 설정에서 가져오기
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -22,6 +32,14 @@ try:
         MAX_COMPONENTS_PER_CHUNK,
         MAX_PARALLEL_AGENTS,
         MIN_CHUNKS,
+        CHUNK_PLANNER,
+        CHUNK_COST_PER_SLIDE_SEC,
+        CHUNK_COST_PER_COMPONENT_SEC,
+        CHUNK_COST_PER_1K_CHARS_SEC,
+        CHUNK_COST_PER_IMAGE_SEC,
+        CHUNK_COST_PER_CHUNK_SEC,
+        CHUNK_TARGET_SEC,
+        TIMING_MAX_ERROR_PCT,
     )
 except ImportError:
     # config.py를 찾을 수 없는 경우 기본값 사용
@@ -29,6 +47,18 @@ except ImportError:
     MAX_COMPONENTS_PER_CHUNK = 80
     MAX_PARALLEL_AGENTS = 10
     MIN_CHUNKS = 3
+    CHUNK_PLANNER = "balanced"
+    CHUNK_COST_PER_SLIDE_SEC = 15
+    CHUNK_COST_PER_COMPONENT_SEC = 4
+    CHUNK_COST_PER_1K_CHARS_SEC = 10
+    CHUNK_COST_PER_IMAGE_SEC = 8
+    CHUNK_COST_PER_CHUNK_SEC = 60
+    CHUNK_TARGET_SEC = 900
+    TIMING_MAX_ERROR_PCT = 50
+
+from timing_store import FEATURE_KEYS, load_cost_coefficients
+
+PLANNERS = ("balanced", "greedy")
 
 
 def load_pptx_data(pptx_data_path: Path) -> Dict[str, Any]:
@@ -37,6 +67,19 @@ def load_pptx_data(pptx_data_path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
+def load_image_counts(manifest_path: Path) -> Dict[int, int]:
+    """image_manifest.json에서 슬라이드별 이미지 수 집계 (파일이 없으면 빈 딕셔너리)"""
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    counts: Dict[int, int] = {}
+    for image in manifest.get("images", []):
+        slide_number = image.get("slide_number", 0)
+        counts[slide_number] = counts.get(slide_number, 0) + 1
+    return counts
+
+
 def get_section_for_slide(slide: Dict[str, Any]) -> str:
     """슬라이드의 섹션 제목 추출"""
     section = slide.get("section_title", "").strip()
@@ -138,23 +181,44 @@ def split_section_into_chunks(section: Dict[str, Any], max_pages: int, max_compo
     return chunks
 
 
-def create_chunk_plan(data: Dict[str, Any], max_pages: int = MAX_PAGES_PER_CHUNK, min_chunks: int = MIN_CHUNKS) -> Dict[str, Any]:
-    """청크 분할 계획 생성"""
-    # 섹션별 그룹화
-    sections = group_slides_by_section(data)
-
-    # 각 섹션을 필요 시 분할
-    all_chunks = []
-    for section in sections:
-        chunks = split_section_into_chunks(section, max_pages, MAX_COMPONENTS_PER_CHUNK)
-        all_chunks.extend(chunks)
-
-    # 청크 병합 (작은 청크들을 합쳐서 효율성 향상)
-    merged_chunks = merge_small_chunks(all_chunks, max_pages, MAX_COMPONENTS_PER_CHUNK)
+def create_chunk_plan(
+    data: Dict[str, Any],
+    max_pages: int = MAX_PAGES_PER_CHUNK,
+    min_chunks: int = MIN_CHUNKS,
+    planner: str = CHUNK_PLANNER,
+    image_counts: Optional[Dict[int, int]] = None,
+    cost_model: Optional["SlideCostModel"] = None,
+    parallel_agents: int = MAX_PARALLEL_AGENTS,
+    max_components: Optional[int] = MAX_COMPONENTS_PER_CHUNK,
+    target_cost: Optional[float] = CHUNK_TARGET_SEC
+) -> Dict[str, Any]:
+    """청크 분할 계획 생성
+
+    planner: "balanced" (예상 비용 기준 균형 분할) 또는 "greedy" (기존 한도 순차 분할)
+    image_counts: 슬라이드 번호별 이미지 수 (load_image_counts, 비용 추정용)
+    max_pages / max_components: 청크당 한도 (balanced에서만 None = 제한 없음)
+    target_cost: 청크당 목표 소요 시간(초) - balanced에서 예상 비용이 넘지 않도록 분할 (0/None = 사용 안 함)
+    두 방식 모두 청크별 예상 비용/특징, 예상 makespan, 불균형 비율(최대/평균 청크 비용)을 기록합니다.
+    """
+    if planner not in PLANNERS:
+        raise ValueError(f"지원하지 않는 청크 분할 방식: {planner} (사용 가능: {', '.join(PLANNERS)})")
+    if cost_model is None:
+        cost_model = SlideCostModel()
+    if image_counts is None:
+        image_counts = {}
+
+    if planner == "balanced":
+        merged_chunks = plan_balanced_chunks(
+            data.get("slides", []), cost_model, image_counts,
+            max_pages, max_components, min_chunks, parallel_agents, target_cost
+        )
+    else:
+        # 기존 방식은 한도가 필수
+        max_pages = max_pages or MAX_PAGES_PER_CHUNK
+        max_components = max_components or MAX_COMPONENTS_PER_CHUNK
+        merged_chunks = plan_greedy_chunks(data, max_pages, max_components, min_chunks)
 
-    # 최소 청크 수 강제 분할 (항상 병렬 처리를 위해)
-    if min_chunks > 1:
-        merged_chunks = force_split_to_min_chunks(merged_chunks, min_chunks)
+    chunk_costs = [cost_model.chunk_cost(chunk["slides"], image_counts) for chunk in merged_chunks]
 
     # 최종 청크 계획 생성
     chunk_plan = {
@@ -162,12 +226,18 @@ def create_chunk_plan(data: Dict[str, Any], max_pages: int = MAX_PAGES_PER_CHUNK
         "total_slides": data.get("total_slides", 0),
         "total_chunks": len(merged_chunks),
         "max_pages_per_chunk": max_pages,
-        "max_components_per_chunk": MAX_COMPONENTS_PER_CHUNK,
+        "max_components_per_chunk": max_components,
+        "planner": planner,
+        "target_chunk_sec": (target_cost or None) if planner == "balanced" else None,
+        "parallel_agents": parallel_agents,
+        "cost_model": asdict(cost_model),
+        "predicted_makespan_sec": round(lpt_makespan(chunk_costs, parallel_agents), 1),
+        "imbalance_ratio": round(imbalance_ratio(chunk_costs), 2),
         "project_info": data.get("project_info", {}),
         "chunks": []
     }
 
-    for idx, chunk in enumerate(merged_chunks, start=1):
+    for idx, (chunk, cost) in enumerate(zip(merged_chunks, chunk_costs), start=1):
         slide_numbers = [s.get("slide_number", 0) for s in chunk["slides"]]
         component_count = count_components_in_slides(chunk["slides"])
 
@@ -177,13 +247,41 @@ def create_chunk_plan(data: Dict[str, Any], max_pages: int = MAX_PAGES_PER_CHUNK
             "slides": slide_numbers,
             "slide_range": [min(slide_numbers), max(slide_numbers)] if slide_numbers else [0, 0],
             "page_count": len(slide_numbers),
-            "component_count": component_count
+            "component_count": component_count,
+            "predicted_cost_sec": round(cost, 1),
+            "features": chunk_features(chunk["slides"], image_counts)
         }
         chunk_plan["chunks"].append(chunk_info)
 
     return chunk_plan
 
 
+def plan_greedy_chunks(
+    data: Dict[str, Any],
+    max_pages: int,
+    max_components: int,
+    min_chunks: int
+) -> List[Dict[str, Any]]:
+    """기존 방식 분할 (섹션별 그룹화 → 한도 초과 섹션 분할 → 작은 청크 병합 → 최소 청크 수 분할)"""
+    # 섹션별 그룹화
+    sections = group_slides_by_section(data)
+
+    # 각 섹션을 필요 시 분할
+    all_chunks = []
+    for section in sections:
+        chunks = split_section_into_chunks(section, max_pages, max_components)
+        all_chunks.extend(chunks)
+
+    # 청크 병합 (작은 청크들을 합쳐서 효율성 향상)
+    merged_chunks = merge_small_chunks(all_chunks, max_pages, max_components)
+
+    # 최소 청크 수 강제 분할 (항상 병렬 처리를 위해)
+    if min_chunks > 1:
+        merged_chunks = force_split_to_min_chunks(merged_chunks, min_chunks)
+
+    return merged_chunks
+
+
 def merge_small_chunks(chunks: List[Dict[str, Any]], max_pages: int, max_components: int) -> List[Dict[str, Any]]:
     """작은 청크들을 병합하여 효율성 향상"""
     if not chunks:
@@ -249,6 +347,282 @@ def force_split_to_min_chunks(chunks: List[Dict[str, Any]], min_chunks: int) ->
     return chunks
 
 
+# ===== 비용 기반 균형 분할 =====
+
+# 청크 경계를 섹션 경계로 옮길 때 허용하는 최대 청크 비용 증가 비율 (균형 분할 결과 대비)
+SECTION_BOUNDARY_SLACK = 0.15
+
+# 최대 청크 비용 이분 탐색 종료 정밀도 (초)
+BOTTLENECK_TOLERANCE_SEC = 0.5
+
+
+def slide_features(slide: Dict[str, Any], image_count: int = 0) -> Tuple[int, int, int, int]:
+    """비용 추정용 슬라이드 특징 (슬라이드 수 1, 컴포넌트 수, 컴포넌트명+설명 글자 수, 이미지 수)"""
+    components = slide.get("components", [])
+    chars = sum(len(c.get("component") or "") + len(c.get("description") or "") for c in components)
+    return (1, len(components), chars, image_count)
+
+
+def chunk_features(slides: List[Dict[str, Any]], image_counts: Dict[int, int]) -> Dict[str, int]:
+    """청크 특징 합계 (timing_store 기록용, FEATURE_KEYS 순서)"""
+    totals = [0, 0, 0, 0]
+    for slide in slides:
+        features = slide_features(slide, image_counts.get(slide.get("slide_number", 0), 0))
+        totals = [total + value for total, value in zip(totals, features)]
+    return dict(zip(FEATURE_KEYS, totals))
+
+
+@dataclass
+class SlideCostModel:
+    """슬라이드/청크 예상 소요 시간(초) 모델
+
+    슬라이드 비용 = per_slide + per_component × 컴포넌트 수 + per_1k_chars × 글자 수 / 1000
+                    + per_image × 이미지 수
+    청크 비용 = 슬라이드 비용 합 + per_chunk (에이전트 시작, tc_plan 읽기 등 청크마다 드는 고정 비용)
+    """
+
+    per_slide: float = CHUNK_COST_PER_SLIDE_SEC
+    per_component: float = CHUNK_COST_PER_COMPONENT_SEC
+    per_1k_chars: float = CHUNK_COST_PER_1K_CHARS_SEC
+    per_image: float = CHUNK_COST_PER_IMAGE_SEC
+    per_chunk: float = CHUNK_COST_PER_CHUNK_SEC
+
+    def features_cost(self, features: Sequence[float]) -> float:
+        """slide_features 형식 특징(또는 그 합)의 비용 (per_chunk 제외)"""
+        slides, components, chars, images = features
+        return (self.per_slide * slides + self.per_component * components
+                + self.per_1k_chars * chars / 1000 + self.per_image * images)
+
+    def slide_cost(self, slide: Dict[str, Any], image_count: int = 0) -> float:
+        return self.features_cost(slide_features(slide, image_count))
+
+    def chunk_cost(self, slides: List[Dict[str, Any]], image_counts: Dict[int, int]) -> float:
+        return self.per_chunk + sum(
+            self.slide_cost(slide, image_counts.get(slide.get("slide_number", 0), 0)) for slide in slides
+        )
+
+
+def lpt_makespan(chunk_costs: Sequence[float], parallel_agents: int) -> float:
+    """청크를 비용이 큰 순서로 가장 먼저 끝나는 에이전트에 배정(LPT)했을 때의 전체 소요 시간"""
+    if not chunk_costs:
+        return 0.0
+    loads = [0.0] * max(1, min(parallel_agents, len(chunk_costs)))
+    for cost in sorted(chunk_costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+def imbalance_ratio(chunk_costs: Sequence[float]) -> float:
+    """최대 청크 비용 / 평균 청크 비용 (1.0이면 완전 균형)"""
+    if not chunk_costs:
+        return 1.0
+    mean = sum(chunk_costs) / len(chunk_costs)
+    return max(chunk_costs) / mean if mean else 1.0
+
+
+def _prefix_sums(values: Sequence[float]) -> List[float]:
+    sums = [0]
+    for value in values:
+        sums.append(sums[-1] + value)
+    return sums
+
+
+class _ChunkCutter:
+    """슬라이드 순서를 유지한 청크 경계 계산 (누적 합 + 이분 탐색)
+
+    경계 목록 bounds는 [0, ..., n] 형식이며 청크 i는 slides[bounds[i]:bounds[i + 1]]입니다.
+    """
+
+    def __init__(self, slide_costs: Sequence[float], component_counts: Sequence[int],
+                 section_starts: Sequence[int], max_pages: Optional[int], max_components: Optional[int]):
+        self.n = len(slide_costs)
+        self.cost = _prefix_sums(slide_costs)
+        self.components = _prefix_sums(component_counts)
+        self.section_starts = list(section_starts)
+        # 한도 없음(None)은 문서 전체 크기로 대체
+        self.max_pages = max_pages or self.n
+        self.max_components = max_components or self.components[-1]
+
+    def chunk_cost(self, start: int, end: int) -> float:
+        return self.cost[end] - self.cost[start]
+
+    def fits(self, start: int, end: int, limit: float) -> bool:
+        """청크 [start, end)가 비용 한도와 페이지/컴포넌트 한도를 지키는지 (한 슬라이드는 항상 허용)"""
+        if end - start == 1:
+            return True
+        return (
+            self.chunk_cost(start, end) <= limit
+            and end - start <= self.max_pages
+            and self.components[end] - self.components[start] <= self.max_components
+        )
+
+    def greedy_bounds(self, limit: float) -> List[int]:
+        """앞에서부터 한도까지 채운 경계 (limit에서 가능한 최소 청크 수)"""
+        bounds = [0]
+        start = 0
+        while start < self.n:
+            end = min(
+                bisect_right(self.cost, self.cost[start] + limit) - 1,
+                bisect_right(self.components, self.components[start] + self.max_components) - 1,
+                start + self.max_pages,
+            )
+            start = max(end, start + 1)
+            bounds.append(start)
+        return bounds
+
+    def balanced_bounds(self, max_chunks: int) -> Tuple[List[int], float]:
+        """청크 수 max_chunks 이하에서 최대 청크 비용이 최소인 경계와 그 최대 비용"""
+        low = 0.0
+        high = self.cost[-1]
+        while high - low > BOTTLENECK_TOLERANCE_SEC:
+            middle = (low + high) / 2
+            if len(self.greedy_bounds(middle)) - 1 <= max_chunks:
+                high = middle
+            else:
+                low = middle
+        bounds = self.greedy_bounds(high)
+        return bounds, max(self.chunk_cost(a, b) for a, b in zip(bounds, bounds[1:]))
+
+    def snap_to_sections(self, bounds: List[int], limit: float) -> List[int]:
+        """섹션 중간의 경계를 한도 안에서 가장 가까운 섹션 경계로 이동"""
+        bounds = list(bounds)
+        for j in range(1, len(bounds) - 1):
+            start, cut, end = bounds[j - 1], bounds[j], bounds[j + 1]
+            lo = bisect_right(self.section_starts, start)
+            hi = bisect_left(self.section_starts, end)
+            candidates = sorted(self.section_starts[lo:hi], key=lambda b: abs(b - cut))
+            if not candidates or candidates[0] == cut:
+                continue
+            for boundary in candidates:
+                if self.fits(start, boundary, limit) and self.fits(boundary, end, limit):
+                    bounds[j] = boundary
+                    break
+        return bounds
+
+    def split_to_min_chunks(self, bounds: List[int], min_chunks: int) -> List[int]:
+        """청크 수가 min_chunks보다 적으면 비용이 가장 큰 청크를 비용 중간 지점에서 분할"""
+        bounds = list(bounds)
+        while len(bounds) - 1 < min_chunks:
+            splittable = [j for j in range(len(bounds) - 1) if bounds[j + 1] - bounds[j] >= 2]
+            if not splittable:
+                break
+            j = max(splittable, key=lambda j: self.chunk_cost(bounds[j], bounds[j + 1]))
+            start, end = bounds[j], bounds[j + 1]
+            half = self.cost[start] + self.chunk_cost(start, end) / 2
+            mid = min(max(bisect_left(self.cost, half, start + 1, end), start + 1), end - 1)
+            bounds.insert(j + 1, mid)
+        return bounds
+
+
+def _chunk_section_labels(titles: Sequence[str], bounds: Sequence[int]) -> List[str]:
+    """청크별 섹션명 (여러 섹션이면 " + "로 연결, 한 섹션이 여러 청크로 나뉘면 "(Part N)")"""
+    chunk_titles = []
+    for start, end in zip(bounds, bounds[1:]):
+        distinct = []
+        for title in titles[start:end]:
+            if not distinct or distinct[-1] != title:
+                distinct.append(title)
+        chunk_titles.append(distinct)
+
+    # 섹션 하나만 담은 청크 중 같은 섹션이 다른 청크에도 걸쳐 있으면 Part 번호 부여
+    spans: Dict[str, int] = {}
+    for distinct in chunk_titles:
+        for title in distinct:
+            spans[title] = spans.get(title, 0) + 1
+
+    labels = []
+    parts: Dict[str, int] = {}
+    for distinct in chunk_titles:
+        if len(distinct) == 1 and spans[distinct[0]] > 1:
+            title = distinct[0]
+            parts[title] = parts.get(title, 0) + 1
+            labels.append(f"{title} (Part {parts[title]})")
+        else:
+            for title in distinct:
+                parts[title] = parts.get(title, 0) + 1
+            labels.append(" + ".join(distinct))
+    return labels
+
+
+def plan_balanced_chunks(
+    slides: List[Dict[str, Any]],
+    cost_model: SlideCostModel,
+    image_counts: Dict[int, int],
+    max_pages: Optional[int],
+    max_components: Optional[int],
+    min_chunks: int,
+    parallel_agents: int,
+    target_cost: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """예상 비용 기준 균형 분할 (문서 순서 유지, 청크 = 연속한 슬라이드)
+
+    0. 청크 수 후보는 한도(페이지/컴포넌트, 목표 소요 시간)를 지킬 수 있는 최소 청크 수부터
+    1. 청크 수 후보마다 최대 청크 비용이 최소가 되는 경계를 이분 탐색으로 구함
+    2. 청크 고정 비용(per_chunk)을 더해 병렬 에이전트 수 기준 LPT makespan 계산
+    3. 경계를 청크 비용이 SECTION_BOUNDARY_SLACK 이상 늘지 않는 범위에서 섹션 경계로 이동한 안도 후보에 추가
+    4. 기존 방식(plan_greedy_chunks) 분할도 목표 소요 시간을 지키면 후보에 추가
+    5. 후보 중 makespan이 가장 짧은 분할 선택
+       (같으면 섹션 경계 이동안 → 이동 전 경계 → 기존 방식 순, 청크 수는 적은 쪽)
+    """
+    if not slides:
+        return []
+
+    slide_costs = [
+        cost_model.slide_cost(slide, image_counts.get(slide.get("slide_number", 0), 0)) for slide in slides
+    ]
+    titles = [get_section_for_slide(slide) for slide in slides]
+    section_starts = [i for i in range(1, len(slides)) if titles[i] != titles[i - 1]]
+    cutter = _ChunkCutter(
+        slide_costs,
+        [len(slide.get("components", [])) for slide in slides],
+        section_starts,
+        max_pages,
+        max_components,
+    )
+
+    # 청크 수 후보: 한도만으로 필요한 최소 청크 수(또는 min_chunks)부터 에이전트 수의 2배 범위
+    # 목표 소요 시간이 있으면 청크 비용(고정 비용 제외)이 목표 - per_chunk 이하가 되는 청크 수 이상
+    limit = cutter.cost[-1]
+    if target_cost and target_cost > cost_model.per_chunk:
+        limit = min(limit, target_cost - cost_model.per_chunk)
+    required = len(cutter.greedy_bounds(limit)) - 1
+    first = min(max(required, min_chunks, 1), len(slides))
+    last = min(len(slides), first + 2 * max(parallel_agents, 1))
+
+    def makespan_of(bounds: List[int]) -> float:
+        costs = [cutter.chunk_cost(a, b) + cost_model.per_chunk for a, b in zip(bounds, bounds[1:])]
+        return lpt_makespan(costs, parallel_agents)
+
+    candidates = []
+    for max_chunks in range(first, last + 1):
+        bounds, bottleneck = cutter.balanced_bounds(max_chunks)
+        bounds = cutter.split_to_min_chunks(bounds, min_chunks)
+        candidates.append(cutter.snap_to_sections(bounds, bottleneck * (1 + SECTION_BOUNDARY_SLACK)))
+        candidates.append(bounds)
+
+    # 기존 방식 분할 (한도 None은 기존 방식 기본 한도로 대체되므로 항상 더 엄격한 한도를 지킴)
+    greedy_bounds = [0]
+    for chunk in plan_greedy_chunks(
+        {"slides": slides}, max_pages or MAX_PAGES_PER_CHUNK, max_components or MAX_COMPONENTS_PER_CHUNK, min_chunks
+    ):
+        greedy_bounds.append(greedy_bounds[-1] + len(chunk["slides"]))
+    if all(cutter.fits(a, b, limit) for a, b in zip(greedy_bounds, greedy_bounds[1:])):
+        candidates.append(greedy_bounds)
+
+    best = None
+    for bounds in candidates:
+        makespan = makespan_of(bounds)
+        if best is None or makespan < best[0] - 1e-9:
+            best = (makespan, bounds)
+    _, bounds = best
+
+    labels = _chunk_section_labels(titles, bounds)
+    return [
+        {"section": label, "slides": slides[start:end]}
+        for label, start, end in zip(labels, bounds, bounds[1:])
+    ]
+
+
 def save_chunk_plan(chunk_plan: Dict[str, Any], output_path: Path):
     """청크 계획 저장"""
     with open(output_path, "w", encoding="utf-8") as f:
@@ -262,7 +636,17 @@ def print_chunk_summary(chunk_plan: Dict[str, Any]):
     print("=" * 60)
     print(f"총 슬라이드: {chunk_plan['total_slides']}페이지")
     print(f"총 청크: {chunk_plan['total_chunks']}개")
-    print(f"청크당 최대 페이지: {chunk_plan['max_pages_per_chunk']}페이지")
+    if chunk_plan["max_pages_per_chunk"]:
+        print(f"청크당 최대 페이지: {chunk_plan['max_pages_per_chunk']}페이지")
+    else:
+        print("청크당 최대 페이지: 제한 없음 (목표 소요 시간 기준)")
+    if "predicted_makespan_sec" in chunk_plan:
+        print(f"분할 방식: {chunk_plan['planner']} (에이전트 {chunk_plan['parallel_agents']}개)")
+        source = chunk_plan.get("cost_model_source", "default")
+        target = chunk_plan.get("target_chunk_sec")
+        print(f"비용 모델: {source}" + (f", 청크당 목표 {target:.0f}초" if target else ""))
+        print(f"예상 소요: {chunk_plan['predicted_makespan_sec']:.0f}초, "
+              f"불균형: {chunk_plan['imbalance_ratio']:.2f} (최대/평균 청크 비용)")
     print("-" * 60)
 
     for chunk in chunk_plan["chunks"]:
@@ -270,13 +654,16 @@ def print_chunk_summary(chunk_plan: Dict[str, Any]):
         print(f"  섹션: {chunk['section']}")
         print(f"  슬라이드: {chunk['slide_range'][0]}P ~ {chunk['slide_range'][1]}P ({chunk['page_count']}페이지)")
         print(f"  컴포넌트: {chunk['component_count']}개")
+        if "predicted_cost_sec" in chunk:
+            print(f"  예상 비용: {chunk['predicted_cost_sec']:.0f}초")
 
     print("=" * 60)
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python plan_chunks.py <pptx_data.json> [--max-pages N] [--min-chunks N] [--output <path>]")
+        print("Usage: python plan_chunks.py <pptx_data.json> [--max-pages N] [--min-chunks N] [--output <path>]"
+              " [--planner balanced|greedy] [--manifest <image_manifest.json>]")
         sys.exit(1)
 
     pptx_data_path = Path(sys.argv[1])
@@ -285,6 +672,8 @@ def main():
     max_pages = MAX_PAGES_PER_CHUNK
     min_chunks = MIN_CHUNKS
     output_path = pptx_data_path.parent / "chunk_plan.json"
+    planner = CHUNK_PLANNER
+    manifest_path = pptx_data_path.parent / "image_manifest.json"
 
     args = sys.argv[2:]
     i = 0
@@ -298,6 +687,12 @@ def main():
         elif args[i] == "--output" and i + 1 < len(args):
             output_path = Path(args[i + 1])
             i += 2
+        elif args[i] == "--planner" and i + 1 < len(args):
+            planner = args[i + 1]
+            i += 2
+        elif args[i] == "--manifest" and i + 1 < len(args):
+            manifest_path = Path(args[i + 1])
+            i += 2
         else:
             i += 1
 
@@ -308,8 +703,31 @@ def main():
     # pptx_data.json 로드
     data = load_pptx_data(pptx_data_path)
 
-    # 청크 계획 생성
-    chunk_plan = create_chunk_plan(data, max_pages, min_chunks)
+    # 비용 모델: 실행 시간 기록(output/.stats/)이 충분하고 기록 대비 오차가 한도 미만이면 기록으로 추정한 계수 사용
+    # (페이지/컴포넌트 한도는 비용 모델과 무관하게 항상 적용되는 안전 한도)
+    cost_model = SlideCostModel()
+    cost_model_source = "default"
+    fitted = load_cost_coefficients(pptx_data_path.parent, asdict(cost_model))
+    if fitted and fitted["error_ratio"] * 100 >= TIMING_MAX_ERROR_PCT:
+        cost_model_source = (
+            f"default (기록 {fitted['runs']}건 추정 오차 {fitted['error_ratio']:.0%}, "
+            f"한도 {TIMING_MAX_ERROR_PCT}% 이상)"
+        )
+        fitted = None
+    if fitted:
+        cost_model = SlideCostModel(**fitted["coefficients"])
+        cost_model_source = f"history ({fitted['runs']}건, 기록 대비 평균 오차 {fitted['error_ratio']:.0%})"
+
+    # 청크 계획 생성 (이미지 수는 image_manifest.json이 있을 때만 비용에 반영)
+    try:
+        chunk_plan = create_chunk_plan(
+            data, max_pages, min_chunks, planner, load_image_counts(manifest_path),
+            cost_model
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    chunk_plan["cost_model_source"] = cost_model_source
 
     # 저장
     save_chunk_plan(chunk_plan, output_path)
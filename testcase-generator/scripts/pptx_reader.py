@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+python-pptx 객체 모델 없이 PPTX(zip)를 직접 읽는 스트리밍 리더
+
+python-pptx는 슬라이드마다 전체 lxml 객체 그래프를 만들기 때문에
+대용량 화면정의서(300+ 슬라이드)에서 대부분의 시간이 객체 생성에 소모됩니다.
+이 모듈은 zip을 한 번만 열고 슬라이드 XML을 iterparse로 순회하면서
+최상위 shape 단위로 필요한 정보만 뽑아낸 뒤 즉시 메모리에서 해제합니다.
+
+python-pptx와 동일한 규칙을 따릅니다:
+- 슬라이드 순서: presentation.xml의 sldIdLst 순서
+- shape 순회: p:spTree의 최상위 shape만 (그룹 내부 shape 제외)
+- 텍스트: 문단은 "\\n", 줄바꿈(a:br)은 "\\v"로 연결
+- 테이블: a:tbl의 a:tr / a:tc 순서 그대로
+"""
+
+import io
+import posixpath
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+
+# OOXML 네임스페이스
+NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+# 추출 엔진: fast (zip + iterparse 스트리밍), pptx (python-pptx 기준 구현)
+ENGINES = ("fast", "pptx")
+DEFAULT_ENGINE = "fast"
+
+PRESENTATION_PART = "ppt/presentation.xml"
+TABLE_GRAPHIC_DATA_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+EMU_PER_INCH = 914400
+
+
+def qn(tag: str) -> str:
+    """"p:sp" 형식의 태그를 Clark 표기법("{ns}sp")으로 변환"""
+    prefix, local = tag.split(":")
+    return f"{{{NAMESPACES[prefix]}}}{local}"
+
+
+# python-pptx SlideShapes가 shape로 취급하는 태그 (spTree 직계 자식만)
+SHAPE_TAGS = {
+    qn("p:sp"): "sp",
+    qn("p:grpSp"): "grpSp",
+    qn("p:graphicFrame"): "graphicFrame",
+    qn("p:cxnSp"): "cxnSp",
+    qn("p:pic"): "pic",
+    qn("p:contentPart"): "contentPart",
+}
+
+_SP_TREE = qn("p:spTree")
+_TX_BODY = qn("p:txBody")
+_A_P = qn("a:p")
+_A_R = qn("a:r")
+_A_BR = qn("a:br")
+_A_FLD = qn("a:fld")
+_A_T = qn("a:t")
+_A_TBL = qn("a:tbl")
+_A_TR = qn("a:tr")
+_A_TC = qn("a:tc")
+_A_TX_BODY = qn("a:txBody")
+_R_ID = qn("r:id")
+_R_EMBED = qn("r:embed")
+
+
+def _make_parser_kwargs() -> dict:
+    """python-pptx의 oxml 파서와 동일한 파싱 옵션"""
+    return {"remove_blank_text": True, "resolve_entities": False}
+
+
+def open_package(pptx_path) -> zipfile.ZipFile:
+    """PPTX 패키지(zip) 열기"""
+    return zipfile.ZipFile(str(pptx_path), "r")
+
+
+def _rels_part_name(part_name: str) -> str:
+    """파트 이름에 대응하는 .rels 파트 이름 (ppt/slides/slide1.xml → ppt/slides/_rels/slide1.xml.rels)"""
+    directory, filename = posixpath.split(part_name)
+    return posixpath.join(directory, "_rels", f"{filename}.rels")
+
+
+def _resolve_target(source_part: str, target: str) -> str:
+    """관계 Target을 패키지 내부 절대 파트 이름으로 변환"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    base_dir = posixpath.dirname(source_part)
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def read_relationships(zf: zipfile.ZipFile, part_name: str) -> Dict[str, str]:
+    """파트의 관계 목록 로드 (rId → 파트 이름, 외부 링크 제외)"""
+    rels_name = _rels_part_name(part_name)
+    try:
+        data = zf.read(rels_name)
+    except KeyError:
+        return {}
+
+    rels = {}
+    root = etree.fromstring(data)
+    for rel in root.iter(f"{{{NAMESPACES['pr']}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        rels[rel.get("Id")] = _resolve_target(part_name, rel.get("Target", ""))
+    return rels
+
+
+def list_slide_parts(zf: zipfile.ZipFile) -> List[str]:
+    """presentation.xml의 sldIdLst 순서대로 슬라이드 파트 이름 반환"""
+    rels = read_relationships(zf, PRESENTATION_PART)
+    root = etree.fromstring(zf.read(PRESENTATION_PART))
+
+    slide_parts = []
+    sld_id_lst = root.find(qn("p:sldIdLst"))
+    if sld_id_lst is None:
+        return slide_parts
+
+    for sld_id in sld_id_lst.iterchildren(qn("p:sldId")):
+        part_name = rels.get(sld_id.get(_R_ID))
+        if part_name:
+            slide_parts.append(part_name)
+    return slide_parts
+
+
+def _paragraph_text(p_elm) -> str:
+    """a:p 문단 텍스트 (a:r, a:fld 텍스트 + a:br은 수직탭)"""
+    parts = []
+    for child in p_elm.iterchildren(_A_R, _A_BR, _A_FLD):
+        if child.tag == _A_BR:
+            parts.append("\v")
+        else:
+            t = child.find(_A_T)
+            parts.append((t.text or "") if t is not None else "")
+    return "".join(parts)
+
+
+def _tx_body_text(tx_body) -> str:
+    """txBody 텍스트 (문단을 줄바꿈으로 연결)"""
+    if tx_body is None:
+        return ""
+    return "\n".join(_paragraph_text(p) for p in tx_body.iterchildren(_A_P))
+
+
+def _table_rows(graphic_frame) -> Optional[List[List[str]]]:
+    """graphicFrame이 테이블이면 행/셀 텍스트 목록, 아니면 None"""
+    graphic_data = graphic_frame.find(f"{qn('a:graphic')}/{qn('a:graphicData')}")
+    if graphic_data is None or graphic_data.get("uri") != TABLE_GRAPHIC_DATA_URI:
+        return None
+
+    tbl = graphic_data.find(_A_TBL)
+    if tbl is None:
+        return None
+
+    rows = []
+    for tr in tbl.iterchildren(_A_TR):
+        rows.append([_tx_body_text(tc.find(_A_TX_BODY)) for tc in tr.iterchildren(_A_TC)])
+    return rows
+
+
+def _shape_xfrm(shape_elm) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """shape의 위치/크기 (EMU): (left, top, width, height), 없으면 None"""
+    xfrm = shape_elm.find(f"{qn('p:spPr')}/{qn('a:xfrm')}")
+    if xfrm is None:
+        return (None, None, None, None)
+    off = xfrm.find(qn("a:off"))
+    ext = xfrm.find(qn("a:ext"))
+    left = int(off.get("x")) if off is not None else None
+    top = int(off.get("y")) if off is not None else None
+    width = int(ext.get("cx")) if ext is not None else None
+    height = int(ext.get("cy")) if ext is not None else None
+    return (left, top, width, height)
+
+
+def _build_shape_record(kind: str, shape_elm) -> dict:
+    """최상위 shape 요소에서 필요한 정보만 추출"""
+    record = {"kind": kind, "text": None, "table": None}
+
+    if kind == "sp":
+        # python-pptx Shape.text: txBody가 없으면 빈 문자열
+        record["text"] = _tx_body_text(shape_elm.find(_TX_BODY))
+    elif kind == "graphicFrame":
+        record["table"] = _table_rows(shape_elm)
+    elif kind == "pic":
+        nv_pr = shape_elm.find(f"{qn('p:nvPicPr')}/{qn('p:nvPr')}")
+        record["is_placeholder"] = nv_pr is not None and nv_pr.find(qn("p:ph")) is not None
+        record["is_movie"] = nv_pr is not None and nv_pr.find(qn("a:videoFile")) is not None
+        blip = shape_elm.find(f"{qn('p:blipFill')}/{qn('a:blip')}")
+        record["embed"] = blip.get(_R_EMBED) if blip is not None else None
+        record["xfrm"] = _shape_xfrm(shape_elm)
+
+    return record
+
+
+def iter_slide_shapes(source) -> Iterator[dict]:
+    """슬라이드 XML에서 최상위 shape 레코드를 문서 순서대로 생성
+
+    iterparse로 읽으며 처리가 끝난 shape 요소는 바로 해제하므로
+    메모리 사용량은 가장 큰 shape 하나 크기로 제한됩니다.
+
+    Args:
+        source: 슬라이드 XML (bytes 또는 파일 객체)
+
+    Yields:
+        {"kind", "text", "table", ...} 형식의 shape 레코드
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    # shape 태그만 C 레벨에서 필터링 (나머지 요소는 Python으로 올라오지 않음)
+    context = etree.iterparse(
+        source, events=("end",), tag=tuple(SHAPE_TAGS), **_make_parser_kwargs()
+    )
+    for _, elem in context:
+        kind = SHAPE_TAGS[elem.tag]
+        parent = elem.getparent()
+        if parent is None or parent.tag != _SP_TREE:
+            continue
+
+        yield _build_shape_record(kind, elem)
+
+        # 처리 완료된 shape 해제 (형제 요소 포함)
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+    del context
+
+
+def read_slide_content(source) -> Tuple[List[List[List[str]]], List[str]]:
+    """슬라이드 XML에서 테이블과 텍스트 목록 추출
+
+    extract_pptx.extract_slide_info가 python-pptx로 수집하는 것과
+    동일한 (tables, text_content) 쌍을 반환합니다.
+    """
+    tables = []
+    text_content = []
+
+    for record in iter_slide_shapes(source):
+        if record["table"] is not None:
+            tables.append([[cell.strip() for cell in row] for row in record["table"]])
+
+        text = record["text"].strip() if record["text"] else ""
+        if text:
+            text_content.append(text)
+
+    return tables, text_content
+
+
+def iter_slide_pictures(zf: zipfile.ZipFile, slide_part: str) -> Iterator[dict]:
+    """슬라이드의 최상위 그림(p:pic) 정보 생성
+
+    python-pptx의 MSO_SHAPE_TYPE.PICTURE와 동일하게
+    플레이스홀더 그림과 동영상은 제외합니다.
+
+    Yields:
+        {"part_name", "blob", "left", "top", "width", "height"} (EMU 단위, 없으면 None)
+        이미지 파트가 없으면 part_name/blob이 None
+    """
+    rels = None
+    with zf.open(slide_part) as f:
+        for record in iter_slide_shapes(f):
+            if record["kind"] != "pic" or record["is_placeholder"] or record["is_movie"]:
+                continue
+            if rels is None:
+                rels = read_relationships(zf, slide_part)
+
+            part_name = rels.get(record["embed"]) if record["embed"] else None
+            blob = zf.read(part_name) if part_name and part_name in zf.NameToInfo else None
+            left, top, width, height = record["xfrm"]
+            yield {
+                "part_name": part_name if blob is not None else None,
+                "blob": blob,
+                "left": left,
+                "top": top,
+                "width": width,
+                "height": height,
+            }
+
+
+def emu_to_inches(value: Optional[int]) -> float:
+    """EMU → 인치 (값이 없으면 0)"""
+    if value is None:
+        return 0
+    return value / EMU_PER_INCH
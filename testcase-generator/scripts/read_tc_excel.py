@@ -7,13 +7,14 @@
 - 동적 헤더 행 감지 (1~30행 스캔)
 - 유연한 컬럼 매핑 (컬럼명 유사어 지원)
 - 기존 Reference 보존 / 덮어쓰기 모드 지원
+- 대용량 파일용 스트리밍 모드 (--streaming: read_only 로드 + JSON Lines 출력)
 """
 
 import json
 import sys
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 from openpyxl import load_workbook
 
@@ -110,11 +111,55 @@ def find_column_mapping(sheet, header_row: int) -> Dict[str, int]:
     return column_map
 
 
+class _HeaderRows:
+    """스트리밍 모드에서 상단 행 값만 담아 sheet.cell(...).value 형식으로 조회"""
+
+    class _Value:
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            self.value = value
+
+    def __init__(self, rows: List[tuple]):
+        self._rows = rows
+
+    def cell(self, row: int, column: int):
+        values = self._rows[row - 1] if row - 1 < len(self._rows) else ()
+        return self._Value(values[column - 1] if column - 1 < len(values) else None)
+
+
+def _build_tc_record(
+    row_idx: int,
+    tc_id_str: str,
+    get_value,
+    column_map: Dict[str, int],
+    overwrite: bool,
+) -> Dict[str, Any]:
+    """행 값으로 TC 레코드 생성 (get_value: 컬럼 번호 → 셀 값)"""
+    tc = {
+        "row_index": row_idx,
+        "test_case_id": tc_id_str,
+    }
+
+    for field_name, col_idx in column_map.items():
+        if field_name == "test_case_id":
+            continue
+        cell_value = get_value(col_idx)
+        tc[field_name] = str(cell_value).strip() if cell_value else ""
+
+    # Reference 매핑 필요 여부 판단
+    current_ref = tc.get("reference", "")
+    tc["current_reference"] = current_ref
+    tc["needs_mapping"] = overwrite or not current_ref
+    return tc
+
+
 def read_tc_excel(
     excel_path: Path,
     sheet_name: Optional[str] = None,
     overwrite: bool = False,
     output_path: Optional[Path] = None,
+    streaming: bool = False,
 ) -> Dict[str, Any]:
     """TC Excel 파일 읽기
 
@@ -123,10 +168,14 @@ def read_tc_excel(
         sheet_name: 시트명 (None이면 활성 시트)
         overwrite: True면 기존 Reference도 재매핑 대상으로 포함
         output_path: 출력 JSON 경로
+        streaming: True면 read_only로 읽으며 JSON Lines로 바로 기록 (메모리 일정)
 
     Returns:
-        tc_input 딕셔너리
+        tc_input 딕셔너리 (스트리밍 모드는 testcases 제외)
     """
+    if streaming:
+        return read_tc_excel_streaming(excel_path, sheet_name, overwrite, output_path)
+
     print("=" * 60)
     print("  TC Excel 읽기")
     print("=" * 60)
@@ -184,34 +233,17 @@ def read_tc_excel(
             continue
 
         total_count += 1
-        row_idx = tc_id_cell.row
 
         # 각 필드 읽기
-        tc = {
-            "row_index": row_idx,
-            "test_case_id": tc_id_str,
-        }
-
-        for field_name, col_idx in column_map.items():
-            if field_name == "test_case_id":
-                continue
-            cell = row[col_idx - 1] if col_idx - 1 < len(row) else None
-            cell_value = cell.value if cell else None
-            tc[field_name] = str(cell_value).strip() if cell_value else ""
-
-        # Reference 매핑 필요 여부 판단
-        current_ref = tc.get("reference", "")
-        tc["current_reference"] = current_ref
-
-        if overwrite:
-            tc["needs_mapping"] = True
+        tc = _build_tc_record(
+            tc_id_cell.row,
+            tc_id_str,
+            lambda col_idx: row[col_idx - 1].value if col_idx - 1 < len(row) else None,
+            column_map,
+            overwrite,
+        )
+        if tc["needs_mapping"]:
             needs_mapping_count += 1
-        else:
-            if not current_ref:
-                tc["needs_mapping"] = True
-                needs_mapping_count += 1
-            else:
-                tc["needs_mapping"] = False
 
         testcases.append(tc)
 
@@ -244,6 +276,137 @@ def read_tc_excel(
     return result
 
 
+def read_tc_excel_streaming(
+    excel_path: Path,
+    sheet_name: Optional[str] = None,
+    overwrite: bool = False,
+    output_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """TC Excel 파일을 스트리밍으로 읽어 JSON Lines로 기록
+
+    read_only + values_only로 행을 하나씩 읽고 바로 파일에 쓰므로
+    최대 메모리 사용량이 시트 크기와 무관합니다.
+
+    출력 형식 (tc_input.jsonl):
+        1행: {"source_file", "header_row", "column_mapping", "overwrite_mode"}
+        2행~: TC 레코드 (tc_input.json의 testcases 항목과 동일)
+
+    Returns:
+        tc_input 요약 딕셔너리 (testcases 제외, total_tcs / tcs_needing_mapping 포함)
+    """
+    print("=" * 60)
+    print("  TC Excel 읽기 (스트리밍)")
+    print("=" * 60)
+
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+
+    if sheet_name and sheet_name in wb.sheetnames:
+        sheet = wb[sheet_name]
+    else:
+        sheet = wb.active
+    print(f"시트: {sheet.title}")
+
+    # 헤더 행 감지 (상단 30행만 읽음)
+    top_rows = _HeaderRows(list(sheet.iter_rows(min_row=1, max_row=30, max_col=49, values_only=True)))
+    header_row = find_header_row(top_rows)
+    if header_row is None:
+        print("Error: 헤더 행을 찾을 수 없습니다.")
+        print("  'Test Case ID', 'TC ID', '테스트케이스' 등의 키워드가 포함된 행이 필요합니다.")
+        print("  1~30행 범위에서 검색했으나 발견되지 않았습니다.")
+        wb.close()
+        sys.exit(1)
+
+    print(f"헤더 행: {header_row}")
+
+    # 컬럼 매핑
+    column_map = find_column_mapping(top_rows, header_row)
+    print(f"컬럼 매핑: {column_map}")
+
+    if "test_case_id" not in column_map:
+        print("Error: 'Test Case ID' 컬럼을 찾을 수 없습니다.")
+        wb.close()
+        sys.exit(1)
+
+    if output_path is None:
+        output_path = OUTPUT_DIR / "tc_input.jsonl"
+
+    meta = {
+        "source_file": str(excel_path.resolve()),
+        "header_row": header_row,
+        "column_mapping": column_map,
+        "overwrite_mode": overwrite,
+    }
+
+    # 데이터 읽기 (빈 행도 순서대로 나오므로 행 번호는 시작 행 + 순번)
+    data_start_row = header_row + 1
+    tc_id_col = column_map["test_case_id"]
+    max_col_needed = max(column_map.values())
+    total_count = 0
+    needs_mapping_count = 0
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(meta, ensure_ascii=False) + "\n")
+
+        rows = sheet.iter_rows(min_row=data_start_row, max_col=max_col_needed, values_only=True)
+        for row_idx, values in enumerate(rows, start=data_start_row):
+            tc_id_value = values[tc_id_col - 1] if tc_id_col - 1 < len(values) else None
+            if not tc_id_value:
+                continue
+            tc_id_str = str(tc_id_value).strip()
+            if not tc_id_str:
+                continue
+
+            tc = _build_tc_record(
+                row_idx,
+                tc_id_str,
+                lambda col_idx: values[col_idx - 1] if col_idx - 1 < len(values) else None,
+                column_map,
+                overwrite,
+            )
+            total_count += 1
+            if tc["needs_mapping"]:
+                needs_mapping_count += 1
+
+            f.write(json.dumps(tc, ensure_ascii=False) + "\n")
+
+    wb.close()
+
+    print(f"\n총 TC 수: {total_count}")
+    print(f"매핑 필요: {needs_mapping_count}")
+    print(f"출력 파일: {output_path}")
+    print("=" * 60)
+
+    return dict(meta, total_tcs=total_count, tcs_needing_mapping=needs_mapping_count)
+
+
+def iter_tc_input(input_path: Path) -> Iterator[Dict[str, Any]]:
+    """tc_input을 메타데이터 1건, 이후 TC 1건씩 순서대로 반환 (.json 또는 스트리밍 모드의 JSON Lines)
+
+    JSON Lines는 한 줄씩 읽으므로 TC 전체를 메모리에 올리지 않습니다.
+    .json(단일 객체)은 파일 전체를 파싱한 뒤 testcases를 뺀 메타데이터와 TC를 같은 순서로 반환합니다.
+    """
+    with open(input_path, "r", encoding="utf-8") as f:
+        # JSON Lines: 첫 줄이 메타데이터 한 건으로 끝남
+        try:
+            meta = json.loads(f.readline())
+        except ValueError:
+            f.seek(0)
+            meta = json.load(f)
+
+        if "testcases" in meta:
+            meta = dict(meta)
+            testcases = meta.pop("testcases")
+            yield meta
+            yield from testcases
+            return
+
+        yield meta
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python read_tc_excel.py <TC.xlsx> [options]")
@@ -252,6 +415,7 @@ def main():
         print("  --output <path>   출력 JSON 경로 (기본: output/tc_input.json)")
         print("  --overwrite       기존 Reference도 재매핑 대상으로 포함")
         print("  --sheet <name>    시트명 지정")
+        print("  --streaming       대용량 파일용 스트리밍 모드 (JSON Lines 출력, 기본: output/tc_input.jsonl)")
         sys.exit(1)
 
     excel_path = Path(sys.argv[1])
@@ -260,6 +424,7 @@ def main():
     output_path = None
     overwrite = False
     sheet_name = None
+    streaming = False
 
     args = sys.argv[2:]
     i = 0
@@ -273,6 +438,9 @@ def main():
         elif args[i] == "--sheet" and i + 1 < len(args):
             sheet_name = args[i + 1]
             i += 2
+        elif args[i] == "--streaming":
+            streaming = True
+            i += 1
         else:
             i += 1
 
@@ -280,7 +448,7 @@ def main():
         print(f"Error: File not found: {excel_path}")
         sys.exit(1)
 
-    read_tc_excel(excel_path, sheet_name, overwrite, output_path)
+    read_tc_excel(excel_path, sheet_name, overwrite, output_path, streaming)
 
 
 if __name__ == "__main__":
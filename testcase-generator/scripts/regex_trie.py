@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+트라이 → 정규식 변환
+
+문자열 집합을 문자 단위 트라이({문자: 자식 노드}, 문자열 끝은 "" 키)로 만들어 두고
+하나의 정규식으로 바꿉니다. 문자열 수만큼 분기를 나열하는 대신 공통 접두사를 묶으므로
+텍스트 한 위치에서 문자열 길이만큼만 비교합니다.
+(generate_testcase.py 키워드 매칭, merge_tc_chunks.py 크로스 레퍼런스 치환에서 사용)
+
+사용 예:
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    pattern = re.compile(trie_pattern(trie))
+"""
+
+import re
+
+
+def trie_pattern(node: dict) -> str:
+    """트라이를 정규식으로 변환 (같은 위치에서는 가장 긴 문자열이 일치하도록 자식 우선)"""
+    branches = [re.escape(ch) + trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    if all(len(branch) == 1 for branch in branches):
+        body = branches[0] if len(branches) == 1 else "[" + "".join(branches) + "]"
+    else:
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return f"(?:{body})?"
+    return body
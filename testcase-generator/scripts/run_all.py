@@ -9,6 +9,9 @@ PPTX 화면정의서에서 테스트케이스 Excel 파일을 한 번에 생성
     py run_all.py "화면정의서.pptx" --output "출력폴더" --prefix "IT_OP"
     py run_all.py "화면정의서.pptx" --with-analysis "output/image_analysis.json"
     py run_all.py "화면정의서.pptx" --cleanup
+    py run_all.py "화면정의서.pptx" --incremental "출력폴더/화면정의서_tc_data.json"
+    py run_all.py "화면정의서.pptx" --workers 4
+    py run_all.py "화면정의서.pptx" --stream
 """
 
 import argparse
@@ -20,8 +23,15 @@ from pathlib import Path
 from datetime import datetime
 
 # 같은 디렉토리의 모듈 import
-from extract_pptx import extract_pptx
-from generate_testcase import generate_testcases, testcases_to_dict
+from extract_pptx import extract_pptx, iter_all_components, stream_pptx
+from extraction_cache import open_cache
+from incremental_tc import (
+    generate_testcases_incremental,
+    iter_testcases_indexed,
+    load_tc_data,
+    stream_tc_data,
+    INDEX_KEY,
+)
 from write_excel import create_new_testcase_excel
 
 
@@ -46,12 +56,20 @@ def print_summary(result: dict):
     print("-" * 60)
     print(f"  입력 파일      : {result['input_file']}")
     print(f"  출력 파일      : {result['output_file']}")
+    if result.get('tc_data_file'):
+        print(f"  TC 데이터      : {result['tc_data_file']}")
     print(f"  총 슬라이드 수 : {result['total_slides']}")
     print(f"  추출된 컴포넌트: {result['total_components']}")
     print(f"  생성된 TC 수   : {result['total_testcases']}")
     print(f"  TC ID 접두사   : {result['prefix']}")
     if result.get('used_image_analysis'):
         print(f"  이미지 분석    : 적용됨")
+    if result.get('incremental'):
+        inc = result['incremental']
+        print(f"  증분 재생성    : 유지 {inc['reused']} / 변경 {inc['changed']} / "
+              f"추가 {inc['added']} / 삭제 {inc['removed']} (컴포넌트)")
+    if result.get('cache_summary'):
+        print(f"  슬라이드 캐시  : {result['cache_summary']}")
     print(f"  처리 시간      : {result['elapsed_time']:.2f}초")
     print("-" * 60)
     print()
@@ -101,6 +119,43 @@ def merge_image_analysis_data(extracted_data: dict, analysis_path: str) -> dict:
     return merge_image_analysis(extracted_data, image_analysis)
 
 
+def run_stream_pipeline(
+    pptx_path: Path,
+    output_path: Path,
+    tc_data_path: Path,
+    prefix: str,
+    include_exceptions: bool,
+    cache=None
+) -> dict:
+    """추출 → TC 생성 → tc_data.json/Excel 기록을 슬라이드 단위로 흘려보내는 스트리밍 실행
+
+    각 단계가 제너레이터로 연결되어 있어 메모리에는 처리 중인 슬라이드(컴포넌트)의
+    데이터만 남고, 첫 TC부터 바로 tc_data.json과 Excel 임시 시트에 기록됩니다.
+    Excel의 Total TC는 TC 수를 미리 알 수 없으므로 수식으로 기록됩니다.
+
+    Returns:
+        {"total_slides", "total_components", "total_testcases"}
+    """
+    counts = {"total_slides": 0, "total_components": 0}
+    project_info, slides = stream_pptx(pptx_path, cache=cache)
+
+    component_index = {}
+    testcases = iter_testcases_indexed(
+        iter_all_components(slides, counts),
+        component_index,
+        id_prefix=prefix,
+        project_info=project_info,
+        include_exceptions=include_exceptions
+    )
+    testcases = stream_tc_data(tc_data_path, project_info, testcases, component_index)
+
+    create_new_testcase_excel({"project_info": project_info, "testcases": testcases}, output_path)
+
+    # 인덱스는 TC를 모두 소비한 뒤 완성되며 last_number가 생성된 TC 수
+    counts["total_testcases"] = component_index["last_number"]
+    return counts
+
+
 def run_all(
     pptx_path: str,
     output_dir: str = None,
@@ -108,7 +163,11 @@ def run_all(
     keep_temp: bool = False,
     include_exceptions: bool = False,
     analysis_path: str = None,
-    cleanup_images: bool = False
+    cleanup_images: bool = False,
+    use_cache: bool = True,
+    incremental_path: str = None,
+    workers: int = 1,
+    stream: bool = False
 ) -> dict:
     """
     전체 프로세스 실행
@@ -121,6 +180,11 @@ def run_all(
         include_exceptions: 예외 테스트케이스 포함 여부
         analysis_path: 이미지 분석 결과 JSON 파일 경로 (선택)
         cleanup_images: TC 생성 후 추출된 이미지 삭제 여부
+        use_cache: 슬라이드 추출 캐시(출력폴더/.cache/) 사용 여부
+        incremental_path: 이전 실행의 tc_data.json 경로 (지정 시 변경된 컴포넌트만 재생성)
+        workers: TC 생성 프로세스 수 (1이면 직렬, 결과는 동일)
+        stream: 슬라이드 단위 스트리밍 실행 (메모리 사용량이 슬라이드 하나분으로 제한,
+                incremental_path/analysis_path/workers와 함께 사용 불가)
 
     Returns:
         실행 결과 딕셔너리
@@ -136,6 +200,9 @@ def run_all(
     if not pptx_path.suffix.lower() == ".pptx":
         raise ValueError(f"PPTX 파일이 아닙니다: {pptx_path}")
 
+    if stream and (incremental_path or analysis_path or workers > 1):
+        raise ValueError("--stream 옵션은 --incremental, --with-analysis, --workers와 함께 사용할 수 없습니다.")
+
     # 출력 폴더 설정
     if output_dir:
         output_dir = Path(output_dir).resolve()
@@ -148,6 +215,8 @@ def run_all(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_filename = f"{pptx_path.stem}_TestCases_{timestamp}.xlsx"
     output_path = output_dir / output_filename
+    # 증분 재생성 기준이 되는 TC 데이터 (실행마다 갱신)
+    tc_data_path = output_dir / f"{pptx_path.stem}_tc_data.json"
 
     # 임시 폴더 생성
     temp_dir = Path(tempfile.mkdtemp(prefix="tc_generator_"))
@@ -156,59 +225,108 @@ def run_all(
     using_analysis = analysis_path and Path(analysis_path).exists()
 
     try:
-        print(f"[1/3] PPTX 파일 분석 중...")
-        print(f"      입력: {pptx_path}")
+        if stream:
+            print(f"[1/1] PPTX 분석 -> 테스트케이스 생성 -> Excel 작성 (스트리밍)...")
+            print(f"      입력: {pptx_path}")
+            print(f"      출력: {output_path}")
+            print(f"      접두사: {prefix}")
+            if include_exceptions:
+                print(f"      예외 TC: 포함")
+
+            cache = open_cache(output_dir) if use_cache else None
+            counts = run_stream_pipeline(
+                pptx_path,
+                output_path,
+                tc_data_path,
+                prefix=prefix,
+                include_exceptions=include_exceptions,
+                cache=cache
+            )
+            if cache:
+                cache.evict()
+
+            total_slides = counts["total_slides"]
+            total_components = counts["total_components"]
+            total_testcases = counts["total_testcases"]
+            print(f"      -> {total_slides}개 슬라이드, {total_components}개 컴포넌트, "
+                  f"{total_testcases}개 테스트케이스 기록 완료!")
+        else:
+            print(f"[1/3] PPTX 파일 분석 중...")
+            print(f"      입력: {pptx_path}")
 
-        # Step 1: PPTX 추출
-        extracted_data = extract_pptx(pptx_path)
+            # Step 1: PPTX 추출 (내용이 바뀌지 않은 슬라이드는 캐시 사용)
+            cache = open_cache(output_dir) if use_cache else None
+            extracted_data = extract_pptx(pptx_path, cache=cache)
+            if cache:
+                cache.evict()
 
-        total_slides = extracted_data.get("total_slides", 0)
-        all_components = extracted_data.get("all_components", [])
-        total_components = len(all_components)
+            total_slides = extracted_data.get("total_slides", 0)
+            all_components = extracted_data.get("all_components", [])
+            total_components = len(all_components)
 
-        print(f"      -> {total_slides}개 슬라이드에서 {total_components}개 컴포넌트 추출")
+            print(f"      -> {total_slides}개 슬라이드에서 {total_components}개 컴포넌트 추출")
 
-        if total_components == 0:
-            print("      [경고] 추출된 컴포넌트가 없습니다.")
-            print("             PPTX 파일에 컴포넌트 테이블이 있는지 확인하세요.")
+            if total_components == 0:
+                print("      [경고] 추출된 컴포넌트가 없습니다.")
+                print("             PPTX 파일에 컴포넌트 테이블이 있는지 확인하세요.")
+
+            # 이미지 분석 결과 병합 (있는 경우)
+            if using_analysis:
+                print()
+                print(f"[이미지 분석] 분석 결과 병합 중...")
+                print(f"              분석 파일: {analysis_path}")
+                extracted_data = merge_image_analysis_data(extracted_data, analysis_path)
+                print(f"              -> 시각 정보 병합 완료")
 
-        # 이미지 분석 결과 병합 (있는 경우)
-        if using_analysis:
             print()
-            print(f"[이미지 분석] 분석 결과 병합 중...")
-            print(f"              분석 파일: {analysis_path}")
-            extracted_data = merge_image_analysis_data(extracted_data, analysis_path)
-            print(f"              -> 시각 정보 병합 완료")
-
-        print()
-        print(f"[2/3] 테스트케이스 생성 중...")
-        print(f"      접두사: {prefix}")
-        if include_exceptions:
-            print(f"      예외 TC: 포함")
-        if using_analysis:
-            print(f"      이미지 분석: 반영됨")
-
-        # Step 2: 테스트케이스 생성 (개선된 버전)
-        testcases = generate_testcases(extracted_data, id_prefix=prefix, include_exceptions=include_exceptions)
-        total_testcases = len(testcases)
-
-        print(f"      -> {total_testcases}개 테스트케이스 생성")
-
-        # 테스트케이스 데이터 구성
-        testcases_data = {
-            "project_info": extracted_data.get("project_info", {}),
-            "total_testcases": total_testcases,
-            "testcases": testcases_to_dict(testcases)
-        }
+            print(f"[2/3] 테스트케이스 생성 중...")
+            print(f"      접두사: {prefix}")
+            if include_exceptions:
+                print(f"      예외 TC: 포함")
+            if using_analysis:
+                print(f"      이미지 분석: 반영됨")
+
+            # Step 2: 테스트케이스 생성 (증분 모드면 변경된 컴포넌트만 재생성)
+            previous_tc_data = None
+            if incremental_path:
+                previous_tc_data = load_tc_data(Path(incremental_path))
+                print(f"      증분 기준: {incremental_path}")
+
+            testcases, component_index, incremental_stats = generate_testcases_incremental(
+                extracted_data,
+                previous_tc_data,
+                id_prefix=prefix,
+                include_exceptions=include_exceptions,
+                workers=workers
+            )
+            total_testcases = len(testcases)
+
+            if incremental_path:
+                if incremental_stats["full_rebuild"]:
+                    print(f"      [경고] 이전 결과를 재사용할 수 없어 전체 재생성합니다 (옵션/형식 불일치).")
+                print(f"      -> 컴포넌트 {incremental_stats['regenerated_components']}개 재생성, "
+                      f"{incremental_stats['reused']}개 재사용")
+            print(f"      -> {total_testcases}개 테스트케이스 생성")
+
+            # 테스트케이스 데이터 구성
+            testcases_data = {
+                "project_info": extracted_data.get("project_info", {}),
+                "total_testcases": total_testcases,
+                "testcases": testcases,
+                INDEX_KEY: component_index
+            }
+
+            with open(tc_data_path, "w", encoding="utf-8") as f:
+                json.dump(testcases_data, f, ensure_ascii=False, indent=2)
 
-        print()
-        print(f"[3/3] Excel 파일 생성 중...")
-        print(f"      출력: {output_path}")
+            print()
+            print(f"[3/3] Excel 파일 생성 중...")
+            print(f"      출력: {output_path}")
 
-        # Step 3: Excel 작성
-        create_new_testcase_excel(testcases_data, output_path)
+            # Step 3: Excel 작성
+            create_new_testcase_excel(testcases_data, output_path)
 
-        print(f"      -> 완료!")
+            print(f"      -> 완료!")
 
         # 이미지 정리 (옵션)
         if cleanup_images:
@@ -232,7 +350,10 @@ def run_all(
             "total_testcases": total_testcases,
             "prefix": prefix,
             "elapsed_time": elapsed_time,
-            "used_image_analysis": using_analysis
+            "used_image_analysis": using_analysis,
+            "cache_summary": cache.summary() if cache else None,
+            "tc_data_file": str(tc_data_path),
+            "incremental": incremental_stats if incremental_path else None
         }
 
         return result
@@ -265,6 +386,9 @@ def main():
   py run_all.py "화면정의서.pptx" --output "결과폴더" --prefix "IT_OP"
   py run_all.py "화면정의서.pptx" --with-analysis "output/image_analysis.json"
   py run_all.py "화면정의서.pptx" --with-analysis "output/image_analysis.json" --cleanup
+  py run_all.py "화면정의서.pptx" --incremental "결과폴더/화면정의서_tc_data.json"
+  py run_all.py "화면정의서.pptx" --workers 4
+  py run_all.py "화면정의서.pptx" --stream
 
 이미지 분석 워크플로우:
   1. py extract_images.py "화면정의서.pptx" --output "output"
@@ -322,6 +446,32 @@ def main():
         help="TC 생성 후 추출된 이미지 자동 삭제"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="슬라이드 추출 캐시 사용 안 함 (출력폴더/.cache/)"
+    )
+
+    parser.add_argument(
+        "--incremental", "-i",
+        dest="incremental_path",
+        default=None,
+        help="이전 실행의 tc_data.json 경로 (변경된 컴포넌트만 TC 재생성, 기존 TC ID 유지)"
+    )
+
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="TC 생성 프로세스 수 (기본값: 1, 컴포넌트가 많을 때 사용, 결과는 직렬과 동일)"
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="슬라이드 단위 스트리밍 실행 (대용량 화면정의서용, 메모리 일정, Total TC는 수식으로 기록)"
+    )
+
     args = parser.parse_args()
 
     if not args.quiet:
@@ -335,7 +485,11 @@ def main():
             keep_temp=args.keep_temp,
             include_exceptions=args.include_exceptions,
             analysis_path=args.analysis_path,
-            cleanup_images=args.cleanup
+            cleanup_images=args.cleanup,
+            use_cache=not args.no_cache,
+            incremental_path=args.incremental_path,
+            workers=args.workers,
+            stream=args.stream
         )
 
         if result["success"]:
@@ -4,15 +4,29 @@
 테스트 설계 기법 지원 모듈
 
 지원 기법:
-- 2-wise (Pairwise) 조합 테스트
+- 2-wise (Pairwise) / t-way (3-wise, 4-wise) 조합 테스트 (IPOG)
 - 동등분할 (Equivalence Partitioning)
 - 조합 테스트 (Combinatorial Testing)
 """
 
-from typing import List, Dict, Tuple, Any
+import random
+import sys
+from pathlib import Path
+from typing import List, Dict, Tuple, Any, Optional, Union, Iterable, Iterator
 from itertools import combinations, product
 from dataclasses import dataclass
 
+# 중앙 설정에서 가져오기
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    from config import COMBINATION_BUDGET
+except ImportError:
+    COMBINATION_BUDGET = 10000
+
+
+# 전체 조합 수가 한도를 넘을 때 동작
+OVERFLOW_MODES = ("error", "sample")
+
 
 @dataclass
 class TestCondition:
@@ -34,71 +48,487 @@ class TestCombination:
     description: str = ""
 
 
-def generate_pairwise_combinations(conditions: List[TestCondition]) -> List[TestCombination]:
+@dataclass
+class ForbiddenCombination:
+    """금지 조합 제약 (한 테스트에 함께 나올 수 없는 조건값)"""
+    values: Dict[str, str]  # {조건명: 값} (예: {"버튼 상태": "비활성", "동작": "클릭"})
+
+
+@dataclass
+class ImplicationRule:
+    """조건부 제약 (if_values가 모두 성립하면 then_condition 값은 then_values 중 하나)"""
+    if_values: Dict[str, str]   # {조건명: 값} (예: {"로그인": "비로그인"})
+    then_condition: str         # 제한되는 조건명 (예: "메뉴")
+    then_values: List[str]      # 허용 값 목록 (예: ["홈", "로그인"])
+
+
+Constraint = Union[ForbiddenCombination, ImplicationRule]
+
+
+def generate_pairwise_combinations(
+    conditions: List[TestCondition],
+    constraints: List[Constraint] = None
+) -> List[TestCombination]:
     """2-wise (Pairwise) 조합 테스트 생성
 
     모든 조건 쌍의 값 조합이 최소 1번 이상 나타나도록 테스트 조합 생성.
     전체 조합보다 훨씬 적은 수로 높은 결함 발견율 달성.
+    IPOG(In-Parameter-Order) 방식이라 조건이 20개 이상이어도 전체 조합을 탐색하지 않습니다.
 
     Args:
         conditions: 테스트 조건 목록
+        constraints: 금지 조합/조건부 제약 목록 (위반하는 조합은 생성하지 않고,
+            제약상 나올 수 없는 값 쌍은 커버 대상에서 제외)
 
     Returns:
         2-wise 조합된 테스트케이스 목록
     """
-    if len(conditions) < 2:
-        # 조건이 2개 미만이면 전체 조합 반환
-        return _all_combinations(conditions)
+    return _tway_combinations(conditions, 2, "Pairwise 조합", constraints)
+
+
+def generate_tway_combinations(
+    conditions: List[TestCondition],
+    strength: int = 3,
+    constraints: List[Constraint] = None
+) -> List[TestCombination]:
+    """t-way 조합 테스트 생성 (3-wise, 4-wise 등)
+
+    임의의 조건 t개를 골랐을 때 그 값 조합이 모두 최소 1번 이상 나타나도록 테스트 조합 생성.
+    strength=2는 generate_pairwise_combinations와 같습니다.
+    조건 수가 strength 이하이면 전체 조합과 같습니다.
+
+    Args:
+        conditions: 테스트 조건 목록
+        strength: 커버할 조건 조합 크기 t (1 이상)
+        constraints: 금지 조합/조건부 제약 목록 (generate_pairwise_combinations 참고)
+
+    Returns:
+        t-way 조합된 테스트케이스 목록
+
+    Raises:
+        ValueError: strength가 1 미만이거나 제약에 없는 조건명/값이 있는 경우
+    """
+    if strength < 1:
+        raise ValueError(f"strength는 1 이상이어야 합니다: {strength}")
+    return _tway_combinations(conditions, strength, f"{strength}-wise 조합", constraints)
+
 
+def _tway_combinations(
+    conditions: List[TestCondition],
+    strength: int,
+    description: str,
+    constraints: List[Constraint] = None
+) -> List[TestCombination]:
+    """내부 헬퍼: t-way 조합 생성 후 TestCombination 변환"""
+    if len(conditions) <= strength:
+        # 조건이 strength개 이하이면 전체 조합 반환
+        return _all_combinations(conditions, constraints)
+
+    sizes = [len(cond.values) for cond in conditions]
+    if not all(sizes):
+        return []
+
+    checker = _compile_constraints(conditions, constraints)
     result = []
-    covered_pairs = set()
-
-    # 모든 조건 쌍에 대해 커버해야 할 값 쌍 계산
-    uncovered_pairs = []
-    for i, cond1 in enumerate(conditions):
-        for j, cond2 in enumerate(conditions):
-            if i < j:
-                for v1 in cond1.values:
-                    for v2 in cond2.values:
-                        uncovered_pairs.append((i, j, v1, v2))
-
-    # Greedy 알고리즘으로 조합 생성
-    while uncovered_pairs:
-        best_combo = None
-        best_coverage = 0
-
-        # 모든 가능한 조합 중 가장 많은 쌍을 커버하는 것 선택
-        all_values = [cond.values for cond in conditions]
-        for combo in product(*all_values):
-            coverage = 0
-            for i, j, v1, v2 in uncovered_pairs:
-                if combo[i] == v1 and combo[j] == v2:
-                    coverage += 1
-
-            if coverage > best_coverage:
-                best_coverage = coverage
-                best_combo = combo
-
-        if best_combo is None:
-            break
-
-        # 선택된 조합 추가
-        combo_dict = {cond.name: best_combo[i] for i, cond in enumerate(conditions)}
+    for row in _tway_rows(sizes, strength, checker):
+        combo_dict = {cond.name: cond.values[row[i]] for i, cond in enumerate(conditions)}
         result.append(TestCombination(
             conditions=combo_dict,
             test_type="normal",
-            description="Pairwise 조합"
+            description=description
         ))
 
-        # 커버된 쌍 제거
-        uncovered_pairs = [
-            (i, j, v1, v2) for (i, j, v1, v2) in uncovered_pairs
-            if not (best_combo[i] == v1 and best_combo[j] == v2)
-        ]
-
     return result
 
 
+def _tway_rows(sizes: List[int], strength: int, checker: "_ConstraintChecker" = None) -> List[List[int]]:
+    """내부 헬퍼: 값 인덱스 행 목록으로 t-way 조합 생성
+
+    IPOG는 동점 처리에 따라 결과 크기가 달라지므로, 값 선호 순서를 바꾼
+    실행(조건별 최대 값 개수만큼) 중 가장 작은 결과를 사용합니다.
+    """
+    best_rows = None
+    for shift in range(max(sizes)):
+        rows = _ipog(sizes, strength, shift, checker)
+        if best_rows is None or len(rows) < len(best_rows):
+            best_rows = rows
+
+    # 미지정(None) 값 채우기 (커버리지에 영향 없음)
+    if checker:
+        return [checker.complete(row, row_idx) for row_idx, row in enumerate(best_rows)]
+    return [
+        [(row_idx % sizes[i]) if value is None else value for i, value in enumerate(row)]
+        for row_idx, row in enumerate(best_rows)
+    ]
+
+
+def _ipog(
+    sizes: List[int],
+    strength: int,
+    shift: int = 0,
+    checker: "_ConstraintChecker" = None
+) -> List[List[Optional[int]]]:
+    """내부 헬퍼: IPOG t-way 생성 (값은 인덱스, 미지정 값은 None)
+
+    값 개수가 많은 조건부터 하나씩 추가합니다.
+    - 수평 확장: 기존 행마다 새 조건의 값 중 미커버 조합을 가장 많이 커버하는 값 선택
+    - 수직 확장: 남은 조합은 미지정 칸으로 맞출 수 있는 행에 채우거나 새 행 추가
+
+    커버리지 표는 새 조건을 추가하는 동안만 유지합니다. 이전 조건 t-1개 묶음마다 비트셋 하나
+    (비트 번호 = 묶음 값의 혼합 기수 인덱스 * 새 조건 값 개수 + 새 조건 값)를 두므로,
+    메모리는 C(조건 수, t-1) * (값 개수)^t 비트 이내입니다.
+
+    제약이 있으면 모든 행이 항상 제약을 만족하는 완전한 행으로 채워질 수 있게 유지합니다.
+    값을 넣기 전에 checker로 확인하므로 위반 행은 만들어지지 않고,
+    어떤 행으로도 채울 수 없는 조합은 수직 확장에서 커버 대상에서 제외됩니다.
+
+    Args:
+        sizes: 조건별 값 개수 (조건 수 > strength)
+        strength: t
+        shift: 수평 확장 시 행마다 값 선호 순서를 회전하는 폭 (동점 처리용)
+        checker: 제약 검사기 (없으면 제약 없음)
+    """
+    n = len(sizes)
+    order = sorted(range(n), key=lambda i: -sizes[i])
+
+    # 첫 t개 조건은 전체 조합
+    rows = []
+    for values in product(*[range(sizes[p]) for p in order[:strength]]):
+        row = [None] * n
+        for p, value in zip(order[:strength], values):
+            row[p] = value
+        if checker and not checker.feasible(row):
+            continue
+        rows.append(row)
+
+    for position in range(strength, n):
+        k = order[position]
+        size_k = sizes[k]
+        value_mask = (1 << size_k) - 1
+
+        # 이전 조건 t-1개 묶음별 (조건들, 혼합 기수 승수)
+        groups = []
+        for group in combinations(order[:position], strength - 1):
+            multipliers = []
+            table_size = 1
+            for p in reversed(group):
+                multipliers.append(table_size)
+                table_size *= sizes[p]
+            multipliers.reverse()
+            groups.append((group, multipliers, table_size))
+        uncovered = [(1 << (table_size * size_k)) - 1 for _, _, table_size in groups]
+
+        def group_offsets(row):
+            """행에서 값이 모두 지정된 묶음의 (묶음 번호, 비트 오프셋)"""
+            offsets = []
+            for g, (group, multipliers, _) in enumerate(groups):
+                base = 0
+                for p, multiplier in zip(group, multipliers):
+                    a = row[p]
+                    if a is None:
+                        break
+                    base += a * multiplier
+                else:
+                    offsets.append((g, base * size_k))
+            return offsets
+
+        # 수평 확장
+        for row_idx, row in enumerate(rows):
+            offsets = group_offsets(row)
+            gains = [0] * size_k
+            for g, offset in offsets:
+                bits = (uncovered[g] >> offset) & value_mask
+                while bits:
+                    low = bits & -bits
+                    gains[low.bit_length() - 1] += 1
+                    bits ^= low
+
+            best_value = None
+            best_gain = 0
+            for step in range(size_k):
+                value = (step + row_idx * shift) % size_k
+                if gains[value] > best_gain:
+                    best_gain = gains[value]
+                    best_value = value
+
+            if checker and best_value is not None:
+                # 제약을 만족하는 값 중 커버 수가 가장 많은 값
+                best_value = None
+                ranked = sorted(range(size_k), key=lambda v: (-gains[v], (v - row_idx * shift) % size_k))
+                for value in ranked:
+                    if not gains[value]:
+                        break
+                    if checker.fits(row, [(k, value)]):
+                        best_value = value
+                        break
+
+            # 새로 커버하는 조합이 없으면 수직 확장용으로 비워 둠
+            if best_value is None:
+                continue
+            row[k] = best_value
+            for g, offset in offsets:
+                uncovered[g] &= ~(1 << (offset + best_value))
+
+        # 수직 확장
+        for g, (group, multipliers, _) in enumerate(groups):
+            while uncovered[g]:
+                bit = (uncovered[g] & -uncovered[g]).bit_length() - 1
+                base, value = divmod(bit, size_k)
+                wanted = [(p, (base // multiplier) % sizes[p]) for p, multiplier in zip(group, multipliers)]
+
+                def fits(row, value_k):
+                    if row[k] != value_k or not all(row[p] is None or row[p] == a for p, a in wanted):
+                        return False
+                    return not checker or checker.fits(row, wanted + [(k, value)])
+
+                if checker and not checker.fits([None] * n, wanted + [(k, value)]):
+                    # 제약상 나올 수 없는 조합은 커버 대상에서 제외
+                    uncovered[g] &= ~(1 << bit)
+                    continue
+
+                target = next((row for row in rows if fits(row, value)), None)
+                if target is None:
+                    target = next((row for row in rows if fits(row, None)), None)
+                if target is None:
+                    target = [None] * n
+                    rows.append(target)
+
+                for p, a in wanted:
+                    target[p] = a
+                target[k] = value
+                for g2, offset in group_offsets(target):
+                    uncovered[g2] &= ~(1 << (offset + value))
+
+    return rows
+
+
+def _compile_constraints(
+    conditions: List[TestCondition],
+    constraints: List[Constraint] = None
+) -> Optional["_ConstraintChecker"]:
+    """내부 헬퍼: 제약을 값 인덱스 기반 금지 조합 목록으로 변환
+
+    ImplicationRule은 then_values에 없는 then_condition 값마다 금지 조합 하나로 풀어 씁니다.
+
+    Raises:
+        ValueError: 제약에 없는 조건명/값이 있는 경우
+    """
+    if not constraints:
+        return None
+
+    positions = {cond.name: i for i, cond in enumerate(conditions)}
+
+    def index_of(name: str, value: str) -> Tuple[int, int]:
+        if name not in positions:
+            raise ValueError(f"제약에 알 수 없는 조건이 있습니다: {name}")
+        values = conditions[positions[name]].values
+        if value not in values:
+            raise ValueError(f"제약에 알 수 없는 값이 있습니다: {name}={value}")
+        return positions[name], values.index(value)
+
+    forbidden = []
+    for constraint in constraints:
+        if isinstance(constraint, ForbiddenCombination):
+            forbidden.append(dict(index_of(name, value) for name, value in constraint.values.items()))
+        elif isinstance(constraint, ImplicationRule):
+            premise = dict(index_of(name, value) for name, value in constraint.if_values.items())
+            allowed = {index_of(constraint.then_condition, value) for value in constraint.then_values}
+            then_pos = positions.get(constraint.then_condition)
+            if then_pos is None:
+                raise ValueError(f"제약에 알 수 없는 조건이 있습니다: {constraint.then_condition}")
+            for value_idx in range(len(conditions[then_pos].values)):
+                if (then_pos, value_idx) in allowed:
+                    continue
+                if premise.get(then_pos, value_idx) != value_idx:
+                    continue  # 전제와 모순되는 조합은 원래 나올 수 없음
+                forbidden.append({**premise, then_pos: value_idx})
+        else:
+            raise ValueError(f"지원하지 않는 제약 형식입니다: {type(constraint).__name__}")
+
+    return _ConstraintChecker([len(cond.values) for cond in conditions], forbidden)
+
+
+class _ConstraintChecker:
+    """내부 헬퍼: 금지 조합 검사 + 미지정 값 채우기 (값 인덱스 기준)
+
+    금지 조합으로 서로 엮인 조건끼리 묶음(연결 요소)을 만들고, 묶음별로 따로 탐색합니다.
+    탐색은 남은 값이 가장 적은 조건부터 고르며, 값을 넣을 때마다 다른 조건의 남은 값을 줄이고
+    남은 값이 없는 조건이 생기면 바로 되돌아갑니다.
+    묶음별 채움 가능 여부는 지정된 값 상태를 키로 캐시합니다.
+    """
+
+    def __init__(self, sizes: List[int], forbidden: List[Dict[int, int]]):
+        self.sizes = sizes
+        # (조건, 값) → 그 값을 포함하는 금지 조합의 나머지 (조건, 값) 목록들
+        self._by_value: Dict[Tuple[int, int], List[List[Tuple[int, int]]]] = {}
+        for combo in forbidden:
+            for p, value in combo.items():
+                others = [(q, w) for q, w in combo.items() if q != p]
+                self._by_value.setdefault((p, value), []).append(others)
+
+        # 금지 조합으로 연결된 조건 묶음 (union-find)
+        parent = list(range(len(sizes)))
+
+        def find(p: int) -> int:
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+
+        for combo in forbidden:
+            members = list(combo)
+            for q in members[1:]:
+                parent[find(q)] = find(members[0])
+
+        groups: Dict[int, List[int]] = {}
+        for p, _ in sorted(self._by_value):
+            groups.setdefault(find(p), [])
+            if p not in groups[find(p)]:
+                groups[find(p)].append(p)
+        self._groups = list(groups.values())
+        self._constrained = {p for group in self._groups for p in group}
+        self._unconstrained = [p for p in range(len(sizes)) if p not in self._constrained]
+        self._feasible_cache: Dict[Tuple[int, Tuple], bool] = {}
+        self._count_cache: Dict[Tuple[int, Tuple], int] = {}
+
+    def is_constrained(self, p: int) -> bool:
+        """조건 p가 금지 조합에 나오면 True"""
+        return p in self._constrained
+
+    def allows(self, row: List[Optional[int]], p: int, value: int) -> bool:
+        """row[p] = value로 완성되는 금지 조합이 없으면 True"""
+        for others in self._by_value.get((p, value), ()):
+            if all(row[q] == w for q, w in others):
+                return False
+        return True
+
+    def _search(self, filled: List[Optional[int]], free: List[int], start: int) -> bool:
+        """free 조건을 제약을 만족하게 채움 (성공하면 filled에 기록)"""
+        domains = {}
+        for p in free:
+            domains[p] = {v for v in range(self.sizes[p]) if self.allows(filled, p, v)}
+            if not domains[p]:
+                return False
+        return self._assign(filled, free, domains, start)
+
+    def _assign(self, filled: List[Optional[int]], free: List[int], domains: Dict[int, set], start: int) -> bool:
+        """남은 값이 가장 적은 조건부터 값을 넣고, 금지 조합이 하나만 남은 조건의 값을 지움 (forward checking)"""
+        if not free:
+            return True
+
+        p = min(free, key=lambda q: len(domains[q]))
+        rest = [q for q in free if q != p]
+        size = self.sizes[p]
+        for value in [(step + start) % size for step in range(size)]:
+            if value not in domains[p]:
+                continue
+            filled[p] = value
+            removed = []
+            ok = True
+            for others in self._by_value.get((p, value), ()):
+                open_members = [(q, w) for q, w in others if filled[q] is None]
+                if len(open_members) != 1:
+                    continue
+                if not all(filled[q] == w for q, w in others if filled[q] is not None):
+                    continue
+                q, w = open_members[0]
+                if w in domains[q]:
+                    domains[q].discard(w)
+                    removed.append((q, w))
+                    if not domains[q]:
+                        ok = False
+                        break
+
+            if ok and self._assign(filled, rest, domains, start):
+                return True
+            for q, w in removed:
+                domains[q].add(w)
+
+        filled[p] = None
+        return False
+
+    def _consistent(self, row: List[Optional[int]]) -> bool:
+        """지정된 값끼리 금지 조합을 이루지 않으면 True"""
+        return all(
+            row[p] is None or self.allows(row, p, row[p])
+            for group in self._groups for p in group
+        )
+
+    def feasible(self, row: List[Optional[int]]) -> bool:
+        """미지정 값을 채워 제약을 만족하는 완전한 행을 만들 수 있으면 True"""
+        if not self._consistent(row):
+            return False
+        for g, group in enumerate(self._groups):
+            key = (g, tuple(row[p] for p in group))
+            cached = self._feasible_cache.get(key)
+            if cached is None:
+                free = [p for p in group if row[p] is None]
+                cached = self._search(list(row), free, 0)
+                self._feasible_cache[key] = cached
+            if not cached:
+                return False
+        return True
+
+    def fits(self, row: List[Optional[int]], assignments: List[Tuple[int, int]]) -> bool:
+        """row에 assignments를 넣어도 제약을 만족하는 완전한 행으로 채울 수 있으면 True"""
+        candidate = list(row)
+        for p, value in assignments:
+            if candidate[p] is not None and candidate[p] != value:
+                return False
+            candidate[p] = value
+        return self.feasible(candidate)
+
+    def complete(self, row: List[Optional[int]], start: int = 0) -> Optional[List[int]]:
+        """미지정 값을 채운 행 (제약을 만족하도록 채울 수 없으면 None)
+
+        금지 조합에 나오는 조건만 탐색하고, 나머지 조건은 (start % 값 개수)로 채웁니다.
+        """
+        if not self._consistent(row):
+            return None
+        filled = list(row)
+        for group in self._groups:
+            if not self._search(filled, [p for p in group if filled[p] is None], start):
+                return None
+        return [(start % self.sizes[p]) if value is None else value for p, value in enumerate(filled)]
+
+    def count(self, row: List[Optional[int]]) -> int:
+        """미지정 값을 채워 만들 수 있는 제약 만족 행의 수
+
+        금지 조합이 없는 조건은 값 개수를 곱하고, 묶음별 경우의 수는 지정된 값 상태를 키로 캐시합니다.
+        """
+        if not self._consistent(row):
+            return 0
+
+        total = 1
+        for p in self._unconstrained:
+            if row[p] is None:
+                total *= self.sizes[p]
+
+        for g, group in enumerate(self._groups):
+            key = (g, tuple(row[p] for p in group))
+            cached = self._count_cache.get(key)
+            if cached is None:
+                cached = self._count_group(list(row), [p for p in group if row[p] is None])
+                self._count_cache[key] = cached
+            total *= cached
+            if not total:
+                return 0
+        return total
+
+    def _count_group(self, filled: List[Optional[int]], free: List[int]) -> int:
+        """free 조건을 제약을 만족하게 채우는 경우의 수 (묶음 안에서만 열거)"""
+        if not free:
+            return 1
+        p = free[0]
+        total = 0
+        for value in range(self.sizes[p]):
+            if self.allows(filled, p, value):
+                filled[p] = value
+                total += self._count_group(filled, free[1:])
+        filled[p] = None
+        return total
+
+
 def generate_equivalence_partitions(
     condition_name: str,
     valid_values: List[str],
@@ -196,38 +626,174 @@ def generate_boundary_values(
     return result
 
 
-def generate_all_combinations(conditions: List[TestCondition]) -> List[TestCombination]:
+def generate_all_combinations(
+    conditions: List[TestCondition],
+    constraints: List[Constraint] = None,
+    max_combinations: int = COMBINATION_BUDGET,
+    on_overflow: str = "error"
+) -> List[TestCombination]:
     """전체 조합 테스트 생성 (모든 값 조합)
 
     주의: 조건/값이 많으면 조합 수가 폭발적으로 증가함.
-    조건 3개 이하, 값 4개 이하 권장.
+    조합 수가 max_combinations를 넘으면 목록을 만들기 전에 거부하거나 표본만 반환합니다.
+    큰 모델은 CombinationSpace로 필요한 만큼만 순회/슬라이스하세요.
 
     Args:
         conditions: 테스트 조건 목록
+        constraints: 금지 조합/조건부 제약 목록 (위반 조합은 탐색 중 가지치기)
+        max_combinations: 목록으로 만들 최대 조합 수 (기본: COMBINATION_BUDGET)
+        on_overflow: 초과 시 동작 ("error": ValueError, "sample": max_combinations개 균일 표본)
 
     Returns:
         전체 조합 테스트케이스 목록
+
+    Raises:
+        ValueError: 조합 수가 max_combinations를 넘고 on_overflow가 "error"인 경우
     """
-    return _all_combinations(conditions)
+    if on_overflow not in OVERFLOW_MODES:
+        raise ValueError(f"지원하지 않는 on_overflow입니다: {on_overflow} (사용 가능: {', '.join(OVERFLOW_MODES)})")
+
+    space = CombinationSpace(conditions, constraints)
+    if space.count > max_combinations:
+        if on_overflow == "sample":
+            return space.sample(max_combinations)
+        raise ValueError(
+            f"전체 조합 수({space.count:,})가 한도({max_combinations:,})를 넘습니다. "
+            f"Pairwise/t-way 조합이나 CombinationSpace 순회를 사용하세요."
+        )
+    return list(space)
+
+
+def _all_combinations(
+    conditions: List[TestCondition],
+    constraints: List[Constraint] = None
+) -> List[TestCombination]:
+    """내부 헬퍼: 전체 조합 생성"""
+    return list(CombinationSpace(conditions, constraints))
 
 
-def _all_combinations(conditions: List[TestCondition]) -> List[TestCombination]:
-    """내부 헬퍼: 전체 조합 생성"""
-    if not conditions:
-        return []
+class CombinationSpace:
+    """전체 조합 지연 생성기
 
-    result = []
-    all_values = [cond.values for cond in conditions]
+    조합 목록을 만들지 않고 조합 수만 먼저 계산합니다. 조합은 product 순서로 번호가 매겨지며
+    순회, 인덱스/슬라이스 조회, 표본 추출 시 필요한 조합만 TestCombination으로 만듭니다.
+    제약이 있으면 제약을 만족하는 조합만 세고 번호를 매깁니다.
 
-    for combo in product(*all_values):
-        combo_dict = {cond.name: combo[i] for i, cond in enumerate(conditions)}
-        result.append(TestCombination(
+    사용 예:
+        space = CombinationSpace(conditions)
+        print(space.count)                    # 정확한 조합 수
+        first_page = space[:100]              # 처음 100개
+        picked = space.sample(50, seed=1)     # 균일 표본 50개 (번호 순)
+        for combo in space: ...               # 하나씩 생성
+    """
+
+    def __init__(
+        self,
+        conditions: List[TestCondition],
+        constraints: List[Constraint] = None,
+        description: str = "전체 조합"
+    ):
+        self.conditions = conditions
+        self.description = description
+        self._sizes = [len(cond.values) for cond in conditions]
+        self._checker = _compile_constraints(conditions, constraints)
+
+        if not conditions:
+            self.count = 0
+        elif self._checker:
+            self.count = self._checker.count([None] * len(conditions))
+        else:
+            self.count = 1
+            for size in self._sizes:
+                self.count *= size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[TestCombination]:
+        if not self.count:
+            return
+        if self._checker:
+            rows = _valid_products(self._checker)
+        else:
+            rows = product(*[range(size) for size in self._sizes])
+        for row in rows:
+            yield self._combination(row)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TestCombination, List[TestCombination]]:
+        if isinstance(index, slice):
+            return [self._combination(self._row_at(i)) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"조합 번호 범위를 벗어났습니다: {index} (조합 수: {self.count})")
+        return self._combination(self._row_at(index))
+
+    def sample(self, k: int, seed: int = 0) -> List[TestCombination]:
+        """중복 없는 균일 표본 k개 (번호 순, 같은 seed면 같은 결과)"""
+        if k >= self.count:
+            return list(self)
+
+        rng = random.Random(seed)
+        if k * 2 > self.count:
+            picked = set(rng.sample(range(self.count), k))
+        else:
+            picked = set()
+            while len(picked) < k:
+                picked.add(rng.randrange(self.count))
+        return [self._combination(self._row_at(i)) for i in sorted(picked)]
+
+    def _combination(self, row) -> TestCombination:
+        combo_dict = {cond.name: cond.values[row[i]] for i, cond in enumerate(self.conditions)}
+        return TestCombination(
             conditions=combo_dict,
             test_type="normal",
-            description="전체 조합"
-        ))
-
-    return result
+            description=self.description
+        )
+
+    def _row_at(self, index: int) -> List[int]:
+        """index번째 조합의 값 인덱스 행"""
+        if not self._checker:
+            # 혼합 기수 변환 (마지막 조건이 가장 빨리 바뀜)
+            row = [0] * len(self._sizes)
+            for p in range(len(self._sizes) - 1, -1, -1):
+                index, row[p] = divmod(index, self._sizes[p])
+            return row
+
+        # 앞 조건부터 값마다 남은 경우의 수를 빼 가며 결정
+        row = [None] * len(self._sizes)
+        for p, size in enumerate(self._sizes):
+            if not self._checker.is_constrained(p):
+                # 금지 조합이 없는 조건은 값마다 경우의 수가 같음
+                row[p] = 0
+                value, index = divmod(index, self._checker.count(row))
+                row[p] = value
+                continue
+            for value in range(size):
+                row[p] = value
+                completions = self._checker.count(row)
+                if index < completions:
+                    break
+                index -= completions
+        return row
+
+
+def _valid_products(checker: _ConstraintChecker):
+    """내부 헬퍼: 제약을 만족하는 전체 조합을 product 순서로 생성 (위반 시 하위 조합 건너뜀)"""
+    sizes = checker.sizes
+    row = [None] * len(sizes)
+
+    def walk(p: int):
+        if p == len(sizes):
+            yield tuple(row)
+            return
+        for value in range(sizes[p]):
+            if checker.allows(row, p, value):
+                row[p] = value
+                yield from walk(p + 1)
+        row[p] = None
+
+    return walk(0)
 
 
 def generate_state_transition_tests(
@@ -260,7 +826,7 @@ def generate_state_transition_tests(
 
 
 def combinations_to_testcase_data(
-    combinations: List[TestCombination],
+    combinations: Iterable[TestCombination],
     base_title: str,
     base_precondition: str = "",
     base_step_prefix: str = ""
@@ -268,7 +834,7 @@ def combinations_to_testcase_data(
     """조합 결과를 테스트케이스 데이터 형식으로 변환
 
     Args:
-        combinations: 테스트 조합 목록
+        combinations: 테스트 조합 목록 (CombinationSpace 등 iterable 가능)
         base_title: 기본 Title
         base_precondition: 기본 Pre-condition
         base_step_prefix: Test Step 접두사
@@ -276,8 +842,20 @@ def combinations_to_testcase_data(
     Returns:
         테스트케이스 딕셔너리 목록
     """
-    testcases = []
+    return list(iter_testcase_data(combinations, base_title, base_precondition, base_step_prefix))
+
+
+def iter_testcase_data(
+    combinations: Iterable[TestCombination],
+    base_title: str,
+    base_precondition: str = "",
+    base_step_prefix: str = ""
+) -> Iterator[Dict]:
+    """조합 결과를 테스트케이스 데이터로 하나씩 변환 (목록을 만들지 않음)
 
+    인자는 combinations_to_testcase_data와 같습니다. CombinationSpace와 함께 쓰면
+    조합 생성부터 TC 기록까지 한 번에 한 건만 메모리에 둡니다.
+    """
     for i, combo in enumerate(combinations, 1):
         # 조건값을 Test Step으로 변환
         condition_steps = "\n".join([
@@ -293,7 +871,7 @@ def combinations_to_testcase_data(
         else:
             expected = "# 정상 동작"
 
-        tc_data = {
+        yield {
             "title": f"{base_title} - 조합 {i}",
             "pre_condition": base_precondition or combo.description,
             "test_step": f"{base_step_prefix}\n조건:\n{condition_steps}",
@@ -302,10 +880,6 @@ def combinations_to_testcase_data(
             "description": combo.description
         }
 
-        testcases.append(tc_data)
-
-    return testcases
-
 
 # ===== 사용 예시 =====
 
@@ -324,6 +898,42 @@ def example_pairwise():
         print(f"  {i}. {combo.conditions}")
 
 
+def example_tway():
+    """3-wise 사용 예시 (TC 데이터 변환 포함)"""
+    conditions = [
+        TestCondition("모달리티", ["CT", "MR", "CR", "US"]),
+        TestCondition("뷰 레이아웃", ["1x1", "1x2", "2x2"]),
+        TestCondition("윈도우 프리셋", ["Lung", "Bone", "Brain"]),
+        TestCondition("동기화", ["ON", "OFF"]),
+        TestCondition("주석 표시", ["ON", "OFF"]),
+    ]
+
+    combos = generate_tway_combinations(conditions, strength=3)
+    print(f"3-wise 결과: {len(combos)}개 조합 (전체 조합: {4*3*3*2*2}=144개)")
+
+    testcases = combinations_to_testcase_data(combos, "영상 옵션 조합", base_step_prefix="1. 옵션 설정")
+    print(f"  TC 변환: {len(testcases)}개 (예: {testcases[0]['title']})")
+
+
+def example_constraints():
+    """제약 조건 사용 예시 (금지 조합 + 조건부 규칙)"""
+    conditions = [
+        TestCondition("버튼 상태", ["활성", "비활성"]),
+        TestCondition("동작", ["클릭", "더블클릭", "마우스오버"]),
+        TestCondition("권한", ["관리자", "일반", "게스트"]),
+    ]
+    constraints = [
+        ForbiddenCombination({"버튼 상태": "비활성", "동작": "클릭"}),
+        ImplicationRule({"권한": "게스트"}, "버튼 상태", ["비활성"]),
+    ]
+
+    combos = generate_pairwise_combinations(conditions, constraints)
+    print(f"제약 Pairwise 결과: {len(combos)}개 조합")
+
+    for i, combo in enumerate(combos, 1):
+        print(f"  {i}. {combo.conditions}")
+
+
 def example_equivalence():
     """동등분할 사용 예시"""
     combos = generate_equivalence_partitions(
@@ -356,6 +966,14 @@ if __name__ == "__main__":
     example_pairwise()
     print()
 
+    print("=== 3-wise 예시 ===")
+    example_tway()
+    print()
+
+    print("=== 제약 조건 예시 ===")
+    example_constraints()
+    print()
+
     print("=== 동등분할 예시 ===")
     example_equivalence()
     print()
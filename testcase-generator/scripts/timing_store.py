@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+청크별 실제 소요 시간 기록 (SQLite)
+
+청크 에이전트가 실제로 걸린 시간을 청크 특징(슬라이드/컴포넌트/글자/이미지 수)과 함께 기록해 두고,
+plan_chunks.py가 기록으로부터 슬라이드 비용 모델(SlideCostModel) 계수를 추정하도록 합니다.
+
+저장 구조:
+    output/.stats/timing.sqlite3   청크 실행 기록 (chunk_runs 테이블)
+    output/.stats/dispatch.json    마지막 에이전트 디스패치 시각
+
+기록 방법:
+- Step 3 디스패치 직전에 `timing_store.py start`로 디스패치 시각 기록
+  (merge_tc_chunks.py --watch는 시작 시 유효한 디스패치 시각이 없으면 직접 기록)
+- merge_tc_chunks.py가 병합할 때 청크별 소요 시간 = tc_chunk 파일 수정 시각 - 디스패치 시각
+- 청크 특징은 chunk_plan.json의 청크별 features (plan_chunks.py가 기록)
+
+사용법:
+    python timing_store.py start <output_dir>   # 디스패치 시각 기록
+    python timing_store.py show <output_dir>    # 기록 요약 + 추정 계수
+"""
+
+import json
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# 중앙 설정에서 가져오기
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    from config import TIMING_STATS_ENABLED, TIMING_MIN_RUNS, TIMING_HISTORY_LIMIT
+except ImportError:
+    TIMING_STATS_ENABLED = True
+    TIMING_MIN_RUNS = 8
+    TIMING_HISTORY_LIMIT = 500
+
+
+# 출력 폴더 아래 기록 폴더/파일명
+STATS_DIR_NAME = ".stats"
+DB_FILE_NAME = "timing.sqlite3"
+DISPATCH_FILE_NAME = "dispatch.json"
+
+# 청크 특징 키 (chunk_plan.json features와 같은 순서)
+FEATURE_KEYS = ("slides", "components", "chars", "images")
+
+# 비용 계수 이름 (SlideCostModel 필드) - 고정 비용 + FEATURE_KEYS 순서
+COEFFICIENT_KEYS = ("per_chunk", "per_slide", "per_component", "per_1k_chars", "per_image")
+
+# 계수 추정 시 기존 계수(prior)의 비중 (평균적인 청크 몇 개 분량의 가상 기록으로 취급)
+PRIOR_WEIGHT_RUNS = 2.0
+
+_CHUNK_FILE_PATTERN = re.compile(r"tc_chunk_(\d+)\.json$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunk_runs (
+    run_key TEXT NOT NULL,
+    chunk_id INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    source_file TEXT NOT NULL DEFAULT '',
+    wall_sec REAL NOT NULL,
+    slides INTEGER NOT NULL,
+    components INTEGER NOT NULL,
+    chars INTEGER NOT NULL,
+    images INTEGER NOT NULL,
+    tc_count INTEGER NOT NULL,
+    PRIMARY KEY (run_key, chunk_id)
+)
+"""
+
+
+class TimingStore:
+    """청크 실행 기록 저장소
+
+    사용 예:
+        with TimingStore(output_dir / ".stats") as store:
+            store.record_chunk("1700000000.000", 1, wall_sec=420.0,
+                               features={"slides": 12, "components": 60, "chars": 5400, "images": 8},
+                               tc_count=48)
+            runs = store.recent_runs()
+    """
+
+    def __init__(self, stats_dir: Path):
+        self.stats_dir = Path(stats_dir)
+        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.stats_dir / DB_FILE_NAME))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._conn.close()
+
+    def record_chunk(
+        self,
+        run_key: str,
+        chunk_id: int,
+        wall_sec: float,
+        features: Dict[str, int],
+        tc_count: int,
+        source_file: str = ""
+    ):
+        """청크 1건 기록 (같은 실행/청크는 덮어씀 - 병합을 다시 실행해도 중복 없음)"""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunk_runs "
+                "(run_key, chunk_id, recorded_at, source_file, wall_sec, slides, components, chars, images, tc_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_key, chunk_id, time.time(), source_file, wall_sec,
+                 *(int(features.get(key, 0)) for key in FEATURE_KEYS), tc_count),
+            )
+
+    def recent_runs(self, limit: int = TIMING_HISTORY_LIMIT) -> List[Dict[str, Any]]:
+        """최근 기록부터 limit건"""
+        rows = self._conn.execute(
+            "SELECT * FROM chunk_runs ORDER BY recorded_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
+def open_timing_store(output_dir: Path, enabled: bool = TIMING_STATS_ENABLED) -> Optional[TimingStore]:
+    """출력 폴더 기준 기록 저장소 생성 (비활성화면 None)"""
+    if not enabled:
+        return None
+    return TimingStore(Path(output_dir) / STATS_DIR_NAME)
+
+
+# ===== 디스패치 시각 =====
+
+def mark_dispatch(output_dir: Path, started_at: Optional[float] = None) -> float:
+    """에이전트 디스패치 시각 기록"""
+    started_at = time.time() if started_at is None else started_at
+    stats_dir = Path(output_dir) / STATS_DIR_NAME
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    with open(stats_dir / DISPATCH_FILE_NAME, "w", encoding="utf-8") as f:
+        json.dump({"started_at": started_at}, f)
+    return started_at
+
+
+def dispatch_started_at(output_dir: Path) -> Optional[float]:
+    """유효한 디스패치 시각 (없거나 chunk_plan.json보다 오래되었으면 None)"""
+    output_dir = Path(output_dir)
+    try:
+        with open(output_dir / STATS_DIR_NAME / DISPATCH_FILE_NAME, "r", encoding="utf-8") as f:
+            started_at = float(json.load(f)["started_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    # 청크 계획을 다시 만든 뒤라면 이전 실행의 디스패치 시각
+    plan_path = output_dir / "chunk_plan.json"
+    if plan_path.exists() and plan_path.stat().st_mtime > started_at:
+        return None
+    return started_at
+
+
+def ensure_dispatch_mark(output_dir: Path) -> float:
+    """유효한 디스패치 시각이 없으면 지금 시각으로 기록"""
+    started_at = dispatch_started_at(output_dir)
+    if started_at is None:
+        started_at = mark_dispatch(output_dir)
+    return started_at
+
+
+# ===== 병합 시 기록 =====
+
+def record_chunk_timings(output_dir: Path, tc_counts: Dict[str, int]) -> int:
+    """병합한 청크 파일들의 소요 시간 기록
+
+    Args:
+        output_dir: 출력 폴더 (chunk_plan.json, .stats/ 위치)
+        tc_counts: 청크 파일명 → TC 수
+
+    Returns:
+        기록한 청크 수 (디스패치 시각/청크 계획이 없거나 기록이 꺼져 있으면 0)
+    """
+    output_dir = Path(output_dir)
+    started_at = dispatch_started_at(output_dir)
+    plan_path = output_dir / "chunk_plan.json"
+    if started_at is None or not plan_path.exists():
+        return 0
+
+    with open(plan_path, "r", encoding="utf-8") as f:
+        chunk_plan = json.load(f)
+    features_by_id = {
+        chunk["id"]: chunk["features"] for chunk in chunk_plan.get("chunks", []) if "features" in chunk
+    }
+
+    store = open_timing_store(output_dir)
+    if store is None:
+        return 0
+
+    # 청크 파일 수정 시각 = 에이전트 종료 시각 (디스패치 전에 남아 있던 이전 실행 파일은 제외)
+    finished = []
+    for name, tc_count in tc_counts.items():
+        match = _CHUNK_FILE_PATTERN.search(name)
+        if not match or int(match.group(1)) not in features_by_id:
+            continue
+        finished_at = (output_dir / name).stat().st_mtime
+        if finished_at >= started_at:
+            finished.append((finished_at, int(match.group(1)), tc_count))
+    finished.sort()
+
+    # 청크가 에이전트 수보다 많으면 먼저 끝난 에이전트 자리에서 다음 청크가 시작된 것으로 간주
+    parallel_agents = chunk_plan.get("parallel_agents") or len(finished) or 1
+    run_key = f"{started_at:.3f}"
+    with store:
+        for idx, (finished_at, chunk_id, tc_count) in enumerate(finished):
+            chunk_started_at = started_at if idx < parallel_agents else finished[idx - parallel_agents][0]
+            store.record_chunk(
+                run_key, chunk_id, finished_at - chunk_started_at, features_by_id[chunk_id], tc_count,
+                source_file=chunk_plan.get("source_file", ""),
+            )
+    return len(finished)
+
+
+# ===== 비용 계수 추정 =====
+
+def _design_row(run: Dict[str, Any]) -> List[float]:
+    """기록 1건 → 계수 순서(COEFFICIENT_KEYS)의 특징 벡터 (글자 수는 1000자 단위)"""
+    return [1.0, run["slides"], run["components"], run["chars"] / 1000, run["images"]]
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """정방 연립방정식 풀이 (부분 피벗 가우스 소거)"""
+    size = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(size)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        if abs(rows[col][col]) < 1e-12:
+            raise ValueError("계수 추정 실패: 특이 행렬")
+        for r in range(col + 1, size):
+            factor = rows[r][col] / rows[col][col]
+            for c in range(col, size + 1):
+                rows[r][c] -= factor * rows[col][c]
+    solution = [0.0] * size
+    for r in range(size - 1, -1, -1):
+        total = rows[r][size] - sum(rows[r][c] * solution[c] for c in range(r + 1, size))
+        solution[r] = total / rows[r][r]
+    return solution
+
+
+def fit_cost_coefficients(runs: Sequence[Dict[str, Any]], prior: Dict[str, float]) -> Dict[str, float]:
+    """기록으로 비용 계수 추정 (prior 방향 릿지 회귀, 음수 계수는 0)
+
+    소요 시간 ≈ per_chunk + per_slide × 슬라이드 + per_component × 컴포넌트
+                + per_1k_chars × 글자/1000 + per_image × 이미지
+    기록이 적거나 특징끼리 겹칠 때(슬라이드 수와 컴포넌트 수가 함께 늘어나는 등)는 prior 쪽에 머뭅니다.
+    """
+    size = len(COEFFICIENT_KEYS)
+    rows = [_design_row(run) for run in runs]
+    prior_vector = [float(prior[key]) for key in COEFFICIENT_KEYS]
+
+    # 정규 방정식 (XᵀX + Λ) w = Xᵀy + Λ w0, Λ_j = PRIOR_WEIGHT_RUNS × 평균(x_j²)
+    gram = [[sum(row[i] * row[j] for row in rows) for j in range(size)] for i in range(size)]
+    moment = [sum(row[i] * run["wall_sec"] for row, run in zip(rows, runs)) for i in range(size)]
+    for j in range(size):
+        weight = PRIOR_WEIGHT_RUNS * max(gram[j][j] / len(rows), 1e-6)
+        gram[j][j] += weight
+        moment[j] += weight * prior_vector[j]
+
+    solution = _solve(gram, moment)
+    return {key: max(0.0, round(value, 3)) for key, value in zip(COEFFICIENT_KEYS, solution)}
+
+
+def mean_abs_error_ratio(runs: Sequence[Dict[str, Any]], coefficients: Dict[str, float]) -> float:
+    """기록 대비 예측 오차 비율 평균 (|예측 - 실제| / 실제)"""
+    errors = []
+    for run in runs:
+        if run["wall_sec"] <= 0:
+            continue
+        predicted = sum(coefficients[key] * x for key, x in zip(COEFFICIENT_KEYS, _design_row(run)))
+        errors.append(abs(predicted - run["wall_sec"]) / run["wall_sec"])
+    return sum(errors) / len(errors) if errors else 0.0
+
+
+def load_cost_coefficients(
+    output_dir: Path,
+    prior: Dict[str, float],
+    min_runs: int = TIMING_MIN_RUNS
+) -> Optional[Dict[str, Any]]:
+    """기록으로 추정한 비용 계수 (기록이 min_runs건 미만이거나 기록이 꺼져 있으면 None)
+
+    Returns:
+        {"coefficients": {계수: 값}, "runs": 기록 수, "error_ratio": 기록 대비 평균 오차 비율}
+    """
+    stats_path = Path(output_dir) / STATS_DIR_NAME / DB_FILE_NAME
+    if not TIMING_STATS_ENABLED or not stats_path.exists():
+        return None
+    try:
+        with TimingStore(stats_path.parent) as store:
+            runs = store.recent_runs()
+    except sqlite3.Error:
+        # 손상된 기록 파일은 무시하고 기본 비용 모델 사용
+        return None
+    if len(runs) < min_runs:
+        return None
+    try:
+        coefficients = fit_cost_coefficients(runs, prior)
+    except ValueError:
+        return None
+    return {
+        "coefficients": coefficients,
+        "runs": len(runs),
+        "error_ratio": mean_abs_error_ratio(runs, coefficients),
+    }
+
+
+def print_timing_summary(output_dir: Path, prior: Dict[str, float]):
+    """기록 요약 + 추정 계수 출력"""
+    stats_path = Path(output_dir) / STATS_DIR_NAME / DB_FILE_NAME
+    print("=" * 60)
+    print("  청크 실행 시간 기록")
+    print("=" * 60)
+    if not stats_path.exists():
+        print("기록 없음")
+        print("=" * 60)
+        return
+
+    with TimingStore(stats_path.parent) as store:
+        runs = store.recent_runs()
+    print(f"기록: {len(runs)}건 (최근 {TIMING_HISTORY_LIMIT}건까지 사용, 추정 최소 {TIMING_MIN_RUNS}건)")
+    if runs:
+        walls = [run["wall_sec"] for run in runs]
+        print(f"청크 소요 시간: 평균 {sum(walls) / len(walls):.0f}초, 최대 {max(walls):.0f}초")
+    print("-" * 60)
+
+    fitted = load_cost_coefficients(output_dir, prior)
+    print(f"{'계수':<15} {'기본값':>8} {'추정값':>8}")
+    for key in COEFFICIENT_KEYS:
+        value = f"{fitted['coefficients'][key]:>8.2f}" if fitted else f"{'-':>8}"
+        print(f"{key:<15} {prior[key]:>8.2f} {value}")
+    if runs:
+        print("-" * 60)
+        print(f"기록 대비 평균 오차: 기본값 {mean_abs_error_ratio(runs, prior):.0%}", end="")
+        print(f", 추정값 {fitted['error_ratio']:.0%}" if fitted else "")
+    print("=" * 60)
+
+
+def main():
+    usage = "Usage: python timing_store.py <start|show> <output_dir>"
+    if len(sys.argv) < 3 or sys.argv[1] not in ("start", "show"):
+        print(usage)
+        sys.exit(1)
+
+    command = sys.argv[1]
+    output_dir = Path(sys.argv[2])
+    if not output_dir.exists():
+        print(f"Error: Directory not found: {output_dir}")
+        sys.exit(1)
+
+    if command == "start":
+        mark_dispatch(output_dir)
+        print(f"디스패치 시각 기록: {output_dir / STATS_DIR_NAME / DISPATCH_FILE_NAME}")
+    else:
+        # plan_chunks가 이 모듈을 사용하므로 실행 시점에 가져옴
+        from plan_chunks import SlideCostModel
+        print_timing_summary(output_dir, asdict(SlideCostModel()))
+
+
+if __name__ == "__main__":
+    main()
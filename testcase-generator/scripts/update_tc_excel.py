@@ -6,6 +6,9 @@ ref_mapping.json을 기반으로 TC Excel의 Reference 컬럼을 업데이트하
 - 원본 Excel 자동 백업
 - 낮은 confidence → 노란 배경 + 코멘트
 - --dry-run 모드 지원
+- 엔진 선택 (--engine)
+  - patch (기본): 시트 XML에서 Reference 셀만 수정, 나머지 파트는 그대로 복사 (xlsx_patch)
+  - classic: openpyxl로 전체 워크북을 읽고 다시 저장
 """
 
 import json
@@ -13,12 +16,14 @@ import sys
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
 from openpyxl.comments import Comment
 
+from xlsx_patch import SheetPatcher
+
 # 중앙 설정에서 가져오기
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 try:
@@ -28,6 +33,13 @@ except ImportError:
     REF_MAP_CONFIDENCE_THRESHOLD = 0.7
 
 
+# Excel 수정 엔진
+UPDATE_ENGINES = ("patch", "classic")
+DEFAULT_UPDATE_ENGINE = "patch"
+
+# 저신뢰 메모 작성자
+COMMENT_AUTHOR = "Reference Mapper"
+
 # 색상 정의
 YELLOW_FILL = PatternFill(
     start_color=EXCEL_COLORS["blank_field"],
@@ -90,12 +102,80 @@ def backup_excel(excel_path: Path) -> Path:
     return backup_path
 
 
+def collect_updates(
+    sheet,
+    data_start: int,
+    max_row: int,
+    tc_id_col: Optional[int],
+    row_mapping: Dict[int, Dict[str, Any]],
+    id_mapping: Dict[str, Dict[str, Any]],
+    confidence_threshold: float,
+) -> Tuple[List[Tuple[int, str, Optional[str]]], Dict[str, int]]:
+    """데이터 행별 Reference 업데이트 목록 생성
+
+    Returns:
+        ([(행 번호, Reference, 저신뢰 코멘트 또는 None)], 통계)
+    """
+    updates = []
+    stats = {
+        "updated": 0,
+        "skipped_no_mapping": 0,
+        "skipped_existing": 0,
+        "low_confidence": 0,
+    }
+
+    for row_idx in range(data_start, max_row + 1):
+        # TC ID 확인 (데이터 행인지 판별)
+        if tc_id_col:
+            tc_id_value = sheet.cell(row=row_idx, column=tc_id_col).value
+            if not tc_id_value:
+                continue
+            tc_id_str = str(tc_id_value).strip()
+        else:
+            tc_id_str = ""
+
+        # 매핑 찾기 (row_index 우선, 없으면 TC ID로)
+        mapping = row_mapping.get(row_idx)
+        if not mapping and tc_id_str:
+            mapping = id_mapping.get(tc_id_str)
+
+        if not mapping:
+            stats["skipped_no_mapping"] += 1
+            continue
+
+        reference = mapping.get("reference", "")
+        if not reference:
+            stats["skipped_no_mapping"] += 1
+            continue
+
+        confidence = mapping.get("confidence", 0)
+        reasoning = mapping.get("reasoning", "")
+
+        # needs_mapping 여부는 tc_input.json에서 이미 필터링됨
+        # 여기서는 매핑 결과가 있으면 업데이트
+        stats["updated"] += 1
+
+        # 낮은 confidence → 노란 배경 + 코멘트
+        comment_text = None
+        if confidence < confidence_threshold:
+            comment_text = (
+                f"[자동매핑] 신뢰도: {confidence:.0%}\n"
+                f"[근거] {reasoning}"
+            )
+            stats["low_confidence"] += 1
+
+        updates.append((row_idx, reference, comment_text))
+
+    return updates, stats
+
+
 def update_tc_excel(
     excel_path: Path,
     mapping_path: Path,
     output_path: Optional[Path] = None,
     dry_run: bool = False,
     confidence_threshold: float = REF_MAP_CONFIDENCE_THRESHOLD,
+    engine: str = DEFAULT_UPDATE_ENGINE,
 ) -> Dict[str, Any]:
     """TC Excel Reference 컬럼 업데이트
 
@@ -105,10 +185,14 @@ def update_tc_excel(
         output_path: 출력 경로 (None이면 원본 경로에 덮어쓰기)
         dry_run: True면 실제 저장 없이 결과만 출력
         confidence_threshold: 이 값 미만이면 노란 배경 + 코멘트
+        engine: "patch" (시트 XML 직접 수정) 또는 "classic" (openpyxl 전체 로드/저장)
 
     Returns:
         업데이트 통계
     """
+    if engine not in UPDATE_ENGINES:
+        raise ValueError(f"지원하지 않는 엔진입니다: {engine} (사용 가능: {', '.join(UPDATE_ENGINES)})")
+
     print("=" * 60)
     print("  TC Excel Reference 업데이트")
     print("=" * 60)
@@ -142,19 +226,24 @@ def update_tc_excel(
         backup_path = backup_excel(excel_path)
         print(f"백업: {backup_path}")
 
-    wb = load_workbook(excel_path)
-    sheet = wb.active
+    if engine == "patch":
+        sheet = SheetPatcher(excel_path)
+    else:
+        wb = load_workbook(excel_path)
+        sheet = wb.active
 
     # 헤더 찾기
     header_row = find_header_row(sheet)
     if header_row is None:
         print("Error: 헤더 행을 찾을 수 없습니다.")
-        wb.close()
+        if engine == "classic":
+            wb.close()
         sys.exit(1)
 
     ref_col = find_reference_column(sheet, header_row)
     tc_id_col = find_tc_id_column(sheet, header_row)
 
+    new_ref_header = None
     if ref_col is None:
         # Reference 컬럼이 없으면 마지막 데이터 컬럼 뒤에 새로 생성
         # 마지막 사용 컬럼 찾기
@@ -163,79 +252,47 @@ def update_tc_excel(
             if sheet.cell(row=header_row, column=col_idx).value:
                 last_col = col_idx
         ref_col = last_col + 1
-        sheet.cell(row=header_row, column=ref_col).value = "Reference"
+        new_ref_header = "Reference"
         print(f"  Reference 컬럼 없음 → 새로 생성 (컬럼 {ref_col})")
 
     print(f"헤더 행: {header_row}, Reference 컬럼: {ref_col}")
 
-    # 업데이트
-    data_start = header_row + 1
-    stats = {
-        "updated": 0,
-        "skipped_no_mapping": 0,
-        "skipped_existing": 0,
-        "low_confidence": 0,
-    }
-
-    for row_idx in range(data_start, sheet.max_row + 1):
-        # TC ID 확인 (데이터 행인지 판별)
-        if tc_id_col:
-            tc_id_value = sheet.cell(row=row_idx, column=tc_id_col).value
-            if not tc_id_value:
-                continue
-            tc_id_str = str(tc_id_value).strip()
-        else:
-            tc_id_str = ""
-
-        # 매핑 찾기 (row_index 우선, 없으면 TC ID로)
-        mapping = row_mapping.get(row_idx)
-        if not mapping and tc_id_str:
-            mapping = id_mapping.get(tc_id_str)
-
-        if not mapping:
-            stats["skipped_no_mapping"] += 1
-            continue
-
-        reference = mapping.get("reference", "")
-        if not reference:
-            stats["skipped_no_mapping"] += 1
-            continue
-
-        confidence = mapping.get("confidence", 0)
-        reasoning = mapping.get("reasoning", "")
-
-        # 기존 Reference 확인
-        current_ref = sheet.cell(row=row_idx, column=ref_col).value
-        if current_ref and str(current_ref).strip():
-            # needs_mapping 여부는 tc_input.json에서 이미 필터링됨
-            # 여기서는 매핑 결과가 있으면 업데이트
-            pass
-
-        # 셀 업데이트
-        cell = sheet.cell(row=row_idx, column=ref_col)
-        cell.value = reference
-        stats["updated"] += 1
-
-        # 낮은 confidence → 노란 배경 + 코멘트
-        if confidence < confidence_threshold:
-            cell.fill = YELLOW_FILL
-            comment_text = (
-                f"[자동매핑] 신뢰도: {confidence:.0%}\n"
-                f"[근거] {reasoning}"
-            )
-            cell.comment = Comment(text=comment_text, author="Reference Mapper")
-            stats["low_confidence"] += 1
+    # 업데이트 대상 수집
+    updates, stats = collect_updates(
+        sheet, header_row + 1, sheet.max_row, tc_id_col,
+        row_mapping, id_mapping, confidence_threshold,
+    )
+
+    # 반영 및 저장
+    save_path = output_path if output_path else excel_path
+    if engine == "patch":
+        if new_ref_header:
+            sheet.set_value(header_row, ref_col, new_ref_header)
+        for row_idx, reference, comment_text in updates:
+            sheet.set_value(row_idx, ref_col, reference)
+            if comment_text:
+                sheet.set_fill(row_idx, ref_col, EXCEL_COLORS["blank_field"])
+                sheet.set_comment(row_idx, ref_col, comment_text, COMMENT_AUTHOR)
+        if not dry_run:
+            sheet.save(save_path)
+    else:
+        if new_ref_header:
+            sheet.cell(row=header_row, column=ref_col).value = new_ref_header
+        for row_idx, reference, comment_text in updates:
+            cell = sheet.cell(row=row_idx, column=ref_col)
+            cell.value = reference
+            if comment_text:
+                cell.fill = YELLOW_FILL
+                cell.comment = Comment(text=comment_text, author=COMMENT_AUTHOR)
+        if not dry_run:
+            wb.save(save_path)
+        wb.close()
 
-    # 저장
     if not dry_run:
-        save_path = output_path if output_path else excel_path
-        wb.save(save_path)
         print(f"\n저장: {save_path}")
     else:
         print("\n[DRY RUN] 저장하지 않았습니다.")
 
-    wb.close()
-
     print(f"\n업데이트 결과:")
     print(f"  업데이트: {stats['updated']}건")
     print(f"  매핑 없음 (건너뜀): {stats['skipped_no_mapping']}건")
@@ -252,6 +309,7 @@ def main():
         print("Options:")
         print("  --output <path>   출력 Excel 경로 (기본: 원본 덮어쓰기)")
         print("  --dry-run         실제 저장 없이 결과만 출력")
+        print(f"  --engine <name>   수정 엔진 ({'/'.join(UPDATE_ENGINES)}, 기본: {DEFAULT_UPDATE_ENGINE})")
         sys.exit(1)
 
     excel_path = Path(sys.argv[1])
@@ -260,6 +318,7 @@ def main():
     # 옵션 파싱
     output_path = None
     dry_run = False
+    engine = DEFAULT_UPDATE_ENGINE
 
     args = sys.argv[3:]
     i = 0
@@ -270,6 +329,9 @@ def main():
         elif args[i] == "--dry-run":
             dry_run = True
             i += 1
+        elif args[i] == "--engine" and i + 1 < len(args):
+            engine = args[i + 1]
+            i += 2
         else:
             i += 1
 
@@ -281,7 +343,11 @@ def main():
         print(f"Error: File not found: {mapping_path}")
         sys.exit(1)
 
-    update_tc_excel(excel_path, mapping_path, output_path, dry_run)
+    if engine not in UPDATE_ENGINES:
+        print(f"Error: Unknown engine: {engine} (choose from: {', '.join(UPDATE_ENGINES)})")
+        sys.exit(1)
+
+    update_tc_excel(excel_path, mapping_path, output_path, dry_run, engine=engine)
 
 
 if __name__ == "__main__":
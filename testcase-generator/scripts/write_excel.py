@@ -5,6 +5,7 @@
 """
 
 import json
+import re
 import sys
 import shutil
 from pathlib import Path
@@ -13,6 +14,10 @@ from openpyxl import load_workbook, Workbook
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
 from openpyxl.comments import Comment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from xlsx_template import SheetTemplate
 
 # 중앙 설정에서 가져오기
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -68,6 +73,162 @@ DEFAULT_COLUMN_MAP = {
 # 테스트 결과 관련 컬럼 (1차, 2차, 3차...)
 RESULT_COLUMNS = ["result", "defect_severity", "comments", "issue_number", "tester"]
 
+# 새 Excel 생성 엔진: stream (write_only 스트리밍), classic (셀 단위 편집 모드)
+EXCEL_ENGINES = ("stream", "classic")
+DEFAULT_EXCEL_ENGINE = "stream"
+
+# 새 Excel 레이아웃 (행 번호)
+TITLE_ROW = 1
+SUMMARY_ROW = 3
+HEADER_ROW1 = 5
+HEADER_ROW2 = 6
+
+# Excel 시트 최대 행 (TC 수를 모를 때 Total TC 수식 범위)
+EXCEL_MAX_ROW = 1048576
+
+# 데이터 행 기본 컬럼 (No 다음 B열부터, 필드명, 제어문자 제거 여부)
+DATA_FIELDS = [
+    ("test_case_id", False),
+    ("depth1", False),
+    ("depth2", False),
+    ("depth3", False),
+    ("depth4", False),
+    ("title", False),
+    ("pre_condition", False),
+    ("test_step", True),
+    ("expected_result", True),
+    ("requirement_id", False),
+    ("reference", False),
+    ("importance", False),
+    ("writer", False),
+]
+
+# 공란 처리 대상 필드 (필드명, 컬럼 인덱스)
+BLANK_CHECK_FIELDS = [
+    ("pre_condition", 8),
+    ("test_step", 9),
+    ("expected_result", 10),
+]
+
+# 회차 하위 컬럼 너비 (없으면 10)
+ROUND_SUBCOLUMN_WIDTHS = {"Result": 8, "Severity": 10, "Comments": 20, "Issue #": 10}
+
+# XML에서 허용되지 않는 제어 문자 (탭 \x09, 줄바꿈 \x0A, 캐리지리턴 \x0D 제외)
+ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def safe_cell_value(value):
+    """openpyxl에서 불법 문자 제거 및 안전한 셀 값 생성
+
+    openpyxl은 XML에서 허용되지 않는 제어 문자를 거부함
+    - ASCII 0x00-0x08, 0x0B-0x0C, 0x0E-0x1F (탭, 줄바꿈 제외)
+    이러한 문자를 제거하여 안전하게 처리
+    """
+    if not value:
+        return value
+    return ILLEGAL_XML_CHARS.sub('', str(value))
+
+
+def _summary_cells(version, total_tc):
+    """상단 요약 행 (셀 참조, 값)
+
+    total_tc가 None이면 (스트리밍으로 TC 수를 미리 알 수 없을 때)
+    데이터 영역의 TC ID 개수를 세는 수식으로 기록합니다.
+    """
+    if total_tc is None:
+        total_cell = f"=COUNTA(B{HEADER_ROW2 + 1}:B{EXCEL_MAX_ROW})"
+        not_tested = "=D3-F3-H3"
+    else:
+        total_cell = total_tc
+        not_tested = f"={total_tc}-F3-H3"
+    return [
+        ("A3", "Version"), ("B3", version),
+        ("C3", "Total TC"), ("D3", total_cell),
+        ("E3", "Pass"), ("F3", "=COUNTIF(O:O,\"Pass\")+COUNTIF(T:T,\"Pass\")+COUNTIF(Y:Y,\"Pass\")"),
+        ("G3", "Fail"), ("H3", "=COUNTIF(O:O,\"Fail\")+COUNTIF(T:T,\"Fail\")+COUNTIF(Y:Y,\"Fail\")"),
+        ("I3", "N/T"), ("J3", not_tested),
+    ]
+
+
+def _new_workbook_styles() -> dict:
+    """새 Excel 레이아웃에서 쓰는 스타일 조합 (스타일 객체는 한 번만 만들어 셀끼리 공유)
+
+    Returns:
+        {"title", "summary", "summary_label", "header", "header_bottom",
+         "round_headers", "round_subheaders", "data", "blank"} → apply_style용 스타일 속성
+        (round_*는 회차별 목록)
+    """
+    def solid_fill(color_key):
+        color = EXCEL_COLORS[color_key]
+        return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    data_alignment = Alignment(vertical="top", wrap_text=True)
+    thin_border = Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin")
+    )
+    header_font = Font(bold=True, color="FFFFFF")
+    subheader_font = Font(bold=True, color="FFFFFF", size=9)
+    summary_fill = solid_fill("summary")
+    round_fills = [solid_fill(f"round{n}") for n in range(1, 4)]
+
+    return {
+        "title": dict(
+            font=Font(bold=True, size=16),
+            alignment=Alignment(horizontal="center", vertical="center"),
+        ),
+        "summary": dict(fill=summary_fill, border=thin_border),
+        "summary_label": dict(font=Font(bold=True), fill=summary_fill, border=thin_border),
+        "header": dict(font=header_font, fill=solid_fill("header"), alignment=header_alignment, border=thin_border),
+        # 병합된 헤더 하단 셀 (테두리만)
+        "header_bottom": dict(border=thin_border),
+        "round_headers": [
+            dict(font=header_font, fill=fill, alignment=header_alignment, border=thin_border)
+            for fill in round_fills
+        ],
+        "round_subheaders": [
+            dict(font=subheader_font, fill=fill, alignment=header_alignment, border=thin_border)
+            for fill in round_fills
+        ],
+        "data": dict(alignment=data_alignment, border=thin_border),
+        "blank": dict(fill=solid_fill("blank_field"), alignment=data_alignment, border=thin_border),
+    }
+
+
+def _build_data_validations(round_start_col, data_start_row, last_row, has_rows):
+    """Result/Severity 드롭다운 검증 생성 (중앙 설정에서 옵션 가져옴)"""
+    result_options_str = ",".join(RESULT_OPTIONS)
+    result_validation = DataValidation(
+        type="list",
+        formula1=f'"{result_options_str}"',
+        allow_blank=True
+    )
+    result_validation.error = "유효한 결과값을 선택하세요"
+    result_validation.errorTitle = "Invalid Result"
+
+    severity_options_str = ",".join(SEVERITY_OPTIONS)
+    severity_validation = DataValidation(
+        type="list",
+        formula1=f'"{severity_options_str}"',
+        allow_blank=True
+    )
+
+    # Result 컬럼에 validation 적용 (O, T, Y열 등)
+    for round_num in range(NUM_TEST_ROUNDS):
+        result_col = round_start_col + round_num * 5
+        severity_col = result_col + 1
+        result_col_letter = get_column_letter(result_col)
+        severity_col_letter = get_column_letter(severity_col)
+
+        if has_rows:
+            result_validation.add(f"{result_col_letter}{data_start_row}:{result_col_letter}{last_row}")
+            severity_validation.add(f"{severity_col_letter}{data_start_row}:{severity_col_letter}{last_row}")
+
+    return result_validation, severity_validation
+
 
 def find_header_row(sheet, max_rows=20):
     """헤더 행 찾기 (Test Case ID가 있는 행)"""
@@ -120,10 +281,11 @@ def find_column_mapping(sheet, header_row):
     return column_map
 
 
-def copy_cell_style(source_cell, target_cell):
-    """셀 스타일 복사"""
+def copied_style(source_cell) -> dict:
+    """셀 스타일 복사용 속성 (글꼴/정렬/테두리/채우기)"""
+    style = {}
     if source_cell.font:
-        target_cell.font = Font(
+        style["font"] = Font(
             name=source_cell.font.name,
             size=source_cell.font.size,
             bold=source_cell.font.bold,
@@ -131,33 +293,59 @@ def copy_cell_style(source_cell, target_cell):
             color=source_cell.font.color
         )
     if source_cell.alignment:
-        target_cell.alignment = Alignment(
+        style["alignment"] = Alignment(
             horizontal=source_cell.alignment.horizontal,
             vertical=source_cell.alignment.vertical,
             wrap_text=source_cell.alignment.wrap_text
         )
     if source_cell.border:
-        target_cell.border = Border(
+        style["border"] = Border(
             left=source_cell.border.left,
             right=source_cell.border.right,
             top=source_cell.border.top,
             bottom=source_cell.border.bottom
         )
     if source_cell.fill:
-        target_cell.fill = PatternFill(
+        style["fill"] = PatternFill(
             fill_type=source_cell.fill.fill_type,
             start_color=source_cell.fill.start_color,
             end_color=source_cell.fill.end_color
         )
+    return style
+
+
+def apply_style(cell, style: dict):
+    """스타일 속성(글꼴/정렬/테두리/채우기)을 셀에 지정 (같은 스타일 객체를 여러 셀에 지정해도 됨)"""
+    for attr, value in style.items():
+        setattr(cell, attr, value)
+
+
+def copy_cell_style(source_cell, target_cell):
+    """셀 스타일 복사"""
+    apply_style(target_cell, copied_style(source_cell))
 
 
 def write_testcases_to_template(
     testcases_data: dict,
     template_path: Path,
     output_path: Path,
-    sheet_name: str = None
+    sheet_name: str = None,
+    engine: str = DEFAULT_EXCEL_ENGINE
 ):
-    """테스트케이스를 템플릿에 작성"""
+    """테스트케이스를 템플릿에 작성
+
+    Args:
+        testcases_data: TC 데이터
+        template_path: 템플릿 xlsx 경로
+        output_path: 출력 xlsx 경로
+        sheet_name: 대상 시트 이름 (없으면 활성 시트)
+        engine: "stream" (시트 XML에 행 스트리밍, 기본) 또는 "classic" (load_workbook 편집 모드)
+    """
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"지원하지 않는 엔진입니다: {engine} (사용 가능: {', '.join(EXCEL_ENGINES)})")
+
+    if engine == "stream":
+        return _write_testcases_to_template_stream(testcases_data, template_path, output_path, sheet_name)
 
     # 템플릿 파일 복사
     shutil.copy(template_path, output_path)
@@ -189,6 +377,14 @@ def write_testcases_to_template(
 
     testcases = testcases_data.get("testcases", [])
 
+    # 컬럼별 스타일 객체를 첫 번째 데이터 행 기준으로 한 번만 생성 (기본 / 줄바꿈용)
+    column_styles = {}
+    for field, col_idx in column_map.items():
+        style = copied_style(sheet.cell(row=style_source_row, column=col_idx))
+        horizontal = style["alignment"].horizontal if style.get("alignment") else "left"
+        wrap_style = dict(style, alignment=Alignment(horizontal=horizontal, vertical="top", wrap_text=True))
+        column_styles[field] = (style, wrap_style)
+
     for idx, tc in enumerate(testcases):
         row_idx = data_start_row + idx
 
@@ -197,17 +393,9 @@ def write_testcases_to_template(
             cell = sheet.cell(row=row_idx, column=col_idx)
             cell.value = value
 
-            # 스타일 복사 (첫 번째 데이터 행의 스타일 기준)
-            style_cell = sheet.cell(row=style_source_row, column=col_idx)
-            copy_cell_style(style_cell, cell)
-
-            # 줄바꿈이 있는 필드는 wrap_text 활성화
-            if value and "\n" in str(value):
-                cell.alignment = Alignment(
-                    horizontal=cell.alignment.horizontal if cell.alignment else "left",
-                    vertical="top",
-                    wrap_text=True
-                )
+            # 줄바꿈이 있는 필드는 wrap_text 활성화 스타일
+            base_style, wrap_style = column_styles[field]
+            apply_style(cell, wrap_style if value and "\n" in str(value) else base_style)
 
     # 저장
     wb.save(output_path)
@@ -216,9 +404,220 @@ def write_testcases_to_template(
     return output_path
 
 
-def create_new_testcase_excel(testcases_data: dict, output_path: Path):
-    """템플릿 없이 새 Excel 파일 생성 (테스트 회차 포함)"""
-    from openpyxl.utils import get_column_letter
+def _write_testcases_to_template_stream(
+    testcases_data: dict,
+    template_path: Path,
+    output_path: Path,
+    sheet_name: str = None
+):
+    """템플릿 시트 XML을 한 번만 읽고 데이터 행을 새 xlsx에 스트리밍 기록
+
+    헤더 탐색/컬럼 매핑/스타일 기준 행 규칙은 classic과 같고,
+    셀 스타일은 기준 셀의 스타일 번호를 사용합니다.
+    표시 형식은 classic과 같이 기준 셀이 아닌 대상 셀의 원래 형식(새 셀은 General)을 유지합니다.
+    """
+    template = SheetTemplate(template_path, sheet_name)
+
+    # 헤더 행 찾기
+    header_row = find_header_row(template)
+    print(f"Header row found at: {header_row}")
+
+    # 컬럼 매핑 찾기
+    column_map = find_column_mapping(template, header_row)
+    print(f"Column mapping: {column_map}")
+
+    # 데이터 시작 행 (헤더 다음 행)
+    data_start_row = header_row + 1
+
+    # 기존 데이터 행에서 스타일 가져오기 (있는 경우)
+    style_source_row = data_start_row
+    if template.cell(row=style_source_row, column=1).value is None:
+        style_source_row = header_row  # 데이터가 없으면 헤더 스타일 사용
+
+    # 컬럼별 스타일 번호 (기준 셀 스타일 그대로)
+    column_styles = {
+        field: (col_idx, template.style_id(style_source_row, col_idx))
+        for field, col_idx in column_map.items()
+    }
+
+    testcases = testcases_data.get("testcases", [])
+
+    def iter_rows():
+        for row_idx, tc in enumerate(testcases, start=data_start_row):
+            values = {}
+            for field, (col_idx, style_id) in column_styles.items():
+                value = tc.get(field, "")
+                # 줄바꿈이 있는 필드는 wrap_text 활성화 스타일 (처음 필요할 때 한 번만 추가)
+                if value and "\n" in str(value):
+                    style_id = template.wrap_style_id(style_id)
+                # 표시 형식은 대상 셀 것 유지 (기준 셀의 텍스트 형식 등이 새 행에 번지지 않도록)
+                style_id = template.number_format_style_id(style_id, template.number_format_id(row_idx, col_idx))
+                values[col_idx] = (value, style_id)
+            yield values
+
+    template.write(output_path, data_start_row, iter_rows(), len(testcases))
+    print(f"Saved {len(testcases)} test cases to: {output_path}")
+
+    return output_path
+
+
+def create_new_testcase_excel(testcases_data: dict, output_path: Path, engine: str = DEFAULT_EXCEL_ENGINE):
+    """템플릿 없이 새 Excel 파일 생성 (테스트 회차 포함)
+
+    stream 엔진은 testcases가 제너레이터여도 한 건씩 소비하며 기록하고,
+    total_testcases가 없으면 Total TC를 수식으로 기록합니다.
+
+    Args:
+        testcases_data: TC 데이터 (project_info, total_testcases, testcases)
+        output_path: 출력 Excel 경로
+        engine: "stream" (write_only 스트리밍, 기본) 또는 "classic" (셀 단위 편집 모드)
+    """
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"지원하지 않는 엔진입니다: {engine} (사용 가능: {', '.join(EXCEL_ENGINES)})")
+
+    if engine == "classic":
+        testcases_data = {**testcases_data, "testcases": list(testcases_data.get("testcases", []))}
+        tc_count = _create_new_testcase_excel_classic(testcases_data, output_path)
+    else:
+        tc_count = _create_new_testcase_excel_stream(testcases_data, output_path)
+
+    print(f"Created new Excel file with {tc_count} test cases: {output_path}")
+    print(f"  - 1차/2차/3차 테스트 회차 컬럼 포함")
+    print(f"  - 상단 요약 영역 포함")
+
+    return output_path
+
+
+def _create_new_testcase_excel_stream(testcases_data: dict, output_path: Path):
+    """write_only 워크북으로 행을 순서대로 스트리밍 기록
+
+    classic 엔진과 같은 레이아웃을 만들지만 셀 객체를 시트에 쌓지 않고
+    append 즉시 XML로 기록하므로 TC 수와 관계없이 메모리가 일정합니다.
+    데이터 행은 컬럼별로 미리 스타일을 적용한 셀을 값만 바꿔 재사용합니다.
+    testcases는 이터러블이면 되므로 생성 중인 TC를 바로 흘려 넣을 수 있습니다.
+
+    Returns:
+        기록한 TC 수
+    """
+    wb = Workbook(write_only=True)
+    sheet = wb.create_sheet("Test Cases")
+
+    # 프로젝트 정보
+    project_info = testcases_data.get("project_info", {})
+    project_name = project_info.get("project_name", "Test Project")
+    version = project_info.get("version", "v1.0")
+    total_tc = testcases_data.get("total_testcases")
+    testcases = testcases_data.get("testcases", [])
+
+    # 스타일 조합별 스타일 객체 (셀끼리 공유)
+    styles = _new_workbook_styles()
+
+    def styled(value=None, style=None):
+        cell = WriteOnlyCell(sheet, value=value)
+        if style:
+            apply_style(cell, style)
+        return cell
+
+    num_base_cols = len(BASE_COLUMNS)
+    round_start_col = num_base_cols + 1  # O열부터
+    total_cols = num_base_cols + len(ROUND_SUBCOLUMNS) * NUM_TEST_ROUNDS
+    data_start_row = HEADER_ROW2 + 1  # 7행부터
+
+    # ===== 시트 속성 (첫 행 기록 전에 설정해야 반영됨) =====
+    for idx, (_, width) in enumerate(BASE_COLUMNS):
+        sheet.column_dimensions[get_column_letter(idx + 1)].width = width
+    for round_num in range(NUM_TEST_ROUNDS):
+        start_col = round_start_col + round_num * 5
+        for sub_idx, sub_header in enumerate(ROUND_SUBCOLUMNS):
+            col_letter = get_column_letter(start_col + sub_idx)
+            sheet.column_dimensions[col_letter].width = ROUND_SUBCOLUMN_WIDTHS.get(sub_header, 10)
+
+    sheet.row_dimensions[TITLE_ROW].height = 30
+    sheet.row_dimensions[HEADER_ROW1].height = 25
+    sheet.row_dimensions[HEADER_ROW2].height = 20
+    sheet.freeze_panes = f"A{data_start_row}"
+
+    # ===== 상단 요약 영역 (행 1~3) =====
+    sheet.append([styled(f"{project_name} - 테스트케이스", styles["title"])])
+    sheet.merged_cells.add(f"A{TITLE_ROW}:N{TITLE_ROW}")
+    sheet.append([])
+
+    summary_row = []
+    for cell_ref, value in _summary_cells(version, total_tc):
+        style = styles["summary_label"] if cell_ref[0] in "ACEGI" else styles["summary"]
+        summary_row.append(styled(value, style))
+    sheet.append(summary_row)
+    sheet.append([])
+
+    # ===== 헤더 행 (행 5~6) =====
+    header_row1 = []
+    header_row2 = []
+    for idx, (header_text, _) in enumerate(BASE_COLUMNS):
+        col_idx = idx + 1
+        header_row1.append(styled(header_text, styles["header"]))
+        # 병합된 하단 셀에도 테두리
+        header_row2.append(styled(style=styles["header_bottom"]))
+        sheet.merged_cells.add(f"{get_column_letter(col_idx)}{HEADER_ROW1}:{get_column_letter(col_idx)}{HEADER_ROW2}")
+
+    for round_num in range(1, NUM_TEST_ROUNDS + 1):
+        start_col = round_start_col + (round_num - 1) * 5
+
+        # 상위 헤더 (회차명) - 5개 컬럼 병합
+        header_row1.append(styled(f"{round_num}차 테스트", styles["round_headers"][round_num - 1]))
+        header_row1.extend([None] * (len(ROUND_SUBCOLUMNS) - 1))
+        sheet.merged_cells.add(
+            f"{get_column_letter(start_col)}{HEADER_ROW1}:{get_column_letter(start_col + 4)}{HEADER_ROW1}"
+        )
+
+        # 하위 헤더 (세부 항목)
+        for sub_header in ROUND_SUBCOLUMNS:
+            header_row2.append(styled(sub_header, styles["round_subheaders"][round_num - 1]))
+
+    sheet.append(header_row1)
+    sheet.append(header_row2)
+
+    # ===== 데이터 작성 =====
+    # append 시점에 바로 XML로 기록되므로 컬럼별 셀을 값만 바꿔 재사용
+    row_cells = [styled(style=styles["data"]) for _ in range(total_cols)]
+    blank_columns = {col_idx: field_name for field_name, col_idx in BLANK_CHECK_FIELDS}
+
+    tc_count = 0
+    for idx, tc in enumerate(testcases, start=1):
+        tc_count = idx
+        row_cells[0].value = idx
+        for col_offset, (field_name, sanitize) in enumerate(DATA_FIELDS, start=1):
+            value = tc.get(field_name, "")
+            row_cells[col_offset].value = safe_cell_value(value) if sanitize else value
+
+        # 공란 필드에 노란색 배경 + 코멘트 적용
+        row = row_cells
+        blank_reasons = tc.get("_blank_reasons")
+        if blank_reasons:
+            row = list(row_cells)
+            for col_idx, field_name in blank_columns.items():
+                if not tc.get(field_name, "") and field_name in blank_reasons:
+                    cell = styled(row_cells[col_idx - 1].value, styles["blank"])
+                    cell.comment = Comment(text=blank_reasons[field_name], author="TC Generator")
+                    row[col_idx - 1] = cell
+
+        sheet.append(row)
+
+    # 필터/검증 범위는 기록한 행 수로 계산 (auto_filter, data_validations는 저장 시 기록됨)
+    last_row = data_start_row + tc_count - 1 if tc_count else data_start_row
+
+    # 필터 설정 (헤더 행2부터)
+    sheet.auto_filter.ref = f"A{HEADER_ROW2}:{get_column_letter(total_cols)}{last_row}"
+
+    # 데이터 검증 (Result/Severity 드롭다운, write_only 시트는 목록에 직접 추가)
+    for validation in _build_data_validations(round_start_col, data_start_row, last_row, tc_count > 0):
+        sheet.data_validations.append(validation)
+
+    wb.save(output_path)
+    return tc_count
+
+
+def _create_new_testcase_excel_classic(testcases_data: dict, output_path: Path):
+    """일반 Workbook에 셀 단위로 값/스타일을 지정하여 생성 (기존 방식)"""
 
     wb = Workbook()
     sheet = wb.active
@@ -228,49 +627,25 @@ def create_new_testcase_excel(testcases_data: dict, output_path: Path):
     project_info = testcases_data.get("project_info", {})
     project_name = project_info.get("project_name", "Test Project")
     version = project_info.get("version", "v1.0")
-    total_tc = testcases_data.get("total_testcases", 0)
-
-    # 색상 정의 (중앙 설정에서 가져옴)
-    header_fill = PatternFill(start_color=EXCEL_COLORS["header"], end_color=EXCEL_COLORS["header"], fill_type="solid")
-    subheader_fill = PatternFill(start_color=EXCEL_COLORS["subheader"], end_color=EXCEL_COLORS["subheader"], fill_type="solid")
-    round1_fill = PatternFill(start_color=EXCEL_COLORS["round1"], end_color=EXCEL_COLORS["round1"], fill_type="solid")
-    round2_fill = PatternFill(start_color=EXCEL_COLORS["round2"], end_color=EXCEL_COLORS["round2"], fill_type="solid")
-    round3_fill = PatternFill(start_color=EXCEL_COLORS["round3"], end_color=EXCEL_COLORS["round3"], fill_type="solid")
-    summary_fill = PatternFill(start_color=EXCEL_COLORS["summary"], end_color=EXCEL_COLORS["summary"], fill_type="solid")
-    blank_fill = PatternFill(start_color=EXCEL_COLORS["blank_field"], end_color=EXCEL_COLORS["blank_field"], fill_type="solid")
+    total_tc = testcases_data.get("total_testcases")
 
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin")
-    )
+    # 스타일 조합별 스타일 객체 (셀끼리 공유)
+    styles = _new_workbook_styles()
 
     # ===== 상단 요약 영역 (행 1~5) =====
     # 제목
     sheet.merge_cells("A1:N1")
     title_cell = sheet["A1"]
     title_cell.value = f"{project_name} - 테스트케이스"
-    title_cell.font = Font(bold=True, size=16)
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
+    apply_style(title_cell, styles["title"])
     sheet.row_dimensions[1].height = 30
 
     # 요약 정보
-    summary_labels = [
-        ("A3", "Version"), ("B3", version),
-        ("C3", "Total TC"), ("D3", total_tc),
-        ("E3", "Pass"), ("F3", "=COUNTIF(O:O,\"Pass\")+COUNTIF(T:T,\"Pass\")+COUNTIF(Y:Y,\"Pass\")"),
-        ("G3", "Fail"), ("H3", "=COUNTIF(O:O,\"Fail\")+COUNTIF(T:T,\"Fail\")+COUNTIF(Y:Y,\"Fail\")"),
-        ("I3", "N/T"), ("J3", f"={total_tc}-F3-H3"),
-    ]
+    summary_labels = _summary_cells(version, total_tc)
     for cell_ref, value in summary_labels:
         cell = sheet[cell_ref]
         cell.value = value
-        cell.border = thin_border
-        cell.fill = summary_fill
-        if cell_ref[0] in "ACEGI":
-            cell.font = Font(bold=True)
+        apply_style(cell, styles["summary_label"] if cell_ref[0] in "ACEGI" else styles["summary"])
 
     # ===== 헤더 행 1 (병합 헤더) - 행 5 =====
     header_row1 = 5
@@ -293,20 +668,15 @@ def create_new_testcase_excel(testcases_data: dict, output_path: Path):
                           end_row=header_row2, end_column=col_idx)
         cell = sheet.cell(row=header_row1, column=col_idx)
         cell.value = header_text
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
+        apply_style(cell, styles["header"])
         # 병합된 하단 셀에도 테두리
-        sheet.cell(row=header_row2, column=col_idx).border = thin_border
+        apply_style(sheet.cell(row=header_row2, column=col_idx), styles["header_bottom"])
         sheet.column_dimensions[col_letter].width = width
 
     # 테스트 회차 헤더 작성
-    round_fills = [round1_fill, round2_fill, round3_fill]
     round_start_col = len(base_headers) + 1  # O열부터
 
     for round_num in range(1, NUM_TEST_ROUNDS + 1):  # 1차, 2차, 3차
-        round_fill = round_fills[round_num - 1]
         start_col = round_start_col + (round_num - 1) * 5
 
         # 상위 헤더 (회차명) - 5개 컬럼 병합
@@ -314,69 +684,31 @@ def create_new_testcase_excel(testcases_data: dict, output_path: Path):
                           end_row=header_row1, end_column=start_col + 4)
         round_cell = sheet.cell(row=header_row1, column=start_col)
         round_cell.value = f"{round_num}차 테스트"
-        round_cell.font = Font(bold=True, color="FFFFFF")
-        round_cell.fill = round_fill
-        round_cell.alignment = header_alignment
-        round_cell.border = thin_border
+        apply_style(round_cell, styles["round_headers"][round_num - 1])
 
         # 하위 헤더 (세부 항목)
         for sub_idx, sub_header in enumerate(round_headers):
             col = start_col + sub_idx
             cell = sheet.cell(row=header_row2, column=col)
             cell.value = sub_header
-            cell.font = Font(bold=True, color="FFFFFF", size=9)
-            cell.fill = round_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
+            apply_style(cell, styles["round_subheaders"][round_num - 1])
 
             # 컬럼 너비
             col_letter = get_column_letter(col)
-            if sub_header == "Result":
-                sheet.column_dimensions[col_letter].width = 8
-            elif sub_header == "Severity":
-                sheet.column_dimensions[col_letter].width = 10
-            elif sub_header == "Comments":
-                sheet.column_dimensions[col_letter].width = 20
-            elif sub_header == "Issue #":
-                sheet.column_dimensions[col_letter].width = 10
-            else:
-                sheet.column_dimensions[col_letter].width = 10
+            sheet.column_dimensions[col_letter].width = ROUND_SUBCOLUMN_WIDTHS.get(sub_header, 10)
 
     # 행 높이 설정
     sheet.row_dimensions[header_row1].height = 25
     sheet.row_dimensions[header_row2].height = 20
 
     # ===== 데이터 작성 =====
-    data_alignment = Alignment(vertical="top", wrap_text=True)
     testcases = testcases_data.get("testcases", [])
     data_start_row = header_row2 + 1  # 7행부터
 
     # 총 컬럼 수 (기본 컬럼 + 회차별 컬럼)
     total_cols = len(base_headers) + len(ROUND_SUBCOLUMNS) * NUM_TEST_ROUNDS
 
-    def safe_cell_value(value):
-        """openpyxl에서 불법 문자 제거 및 안전한 셀 값 생성
-
-        openpyxl은 XML에서 허용되지 않는 제어 문자를 거부함
-        - ASCII 0x00-0x08, 0x0B-0x0C, 0x0E-0x1F (탭, 줄바꿈 제외)
-        이러한 문자를 제거하여 안전하게 처리
-        """
-        import re
-        if not value:
-            return value
-        str_val = str(value)
-        # XML에서 허용되지 않는 제어 문자 제거 (탭 \x09, 줄바꿈 \x0A, 캐리지리턴 \x0D 제외)
-        # 허용되지 않는 범위: \x00-\x08, \x0B-\x0C, \x0E-\x1F
-        illegal_xml_chars = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
-        clean_val = illegal_xml_chars.sub('', str_val)
-        return clean_val
-
-    # 공란 처리 대상 필드 (필드명, 컬럼 인덱스)
-    blank_check_fields = [
-        ("pre_condition", 8),
-        ("test_step", 9),
-        ("expected_result", 10),
-    ]
+    blank_check_fields = BLANK_CHECK_FIELDS
 
     for idx, tc in enumerate(testcases, start=1):
         row = data_start_row + idx - 1
@@ -397,6 +729,10 @@ def create_new_testcase_excel(testcases_data: dict, output_path: Path):
         sheet.cell(row=row, column=13).value = tc.get("importance", "")
         sheet.cell(row=row, column=14).value = tc.get("writer", "")
 
+        # 모든 셀에 스타일 적용
+        for col in range(1, total_cols + 1):
+            apply_style(sheet.cell(row=row, column=col), styles["data"])
+
         # 공란 필드에 노란색 배경 + 코멘트 적용
         blank_reasons = tc.get("_blank_reasons", {})
         for field_name, col_idx in blank_check_fields:
@@ -404,19 +740,13 @@ def create_new_testcase_excel(testcases_data: dict, output_path: Path):
             # 값이 비어있고 _blank_reasons에 해당 필드가 있으면 노란색 + 코멘트 적용
             if not value and field_name in blank_reasons:
                 cell = sheet.cell(row=row, column=col_idx)
-                cell.fill = blank_fill
+                apply_style(cell, styles["blank"])
                 comment = Comment(
                     text=blank_reasons[field_name],
                     author="TC Generator"
                 )
                 cell.comment = comment
 
-        # 모든 셀에 스타일 적용
-        for col in range(1, total_cols + 1):
-            cell = sheet.cell(row=row, column=col)
-            cell.alignment = data_alignment
-            cell.border = thin_border
-
     # 필터 설정 (헤더 행2부터)
     last_row = data_start_row + len(testcases) - 1 if testcases else data_start_row
     last_col_letter = get_column_letter(total_cols)
@@ -426,53 +756,41 @@ def create_new_testcase_excel(testcases_data: dict, output_path: Path):
     sheet.freeze_panes = f"A{data_start_row}"
 
     # 데이터 검증 (Result 컬럼에 드롭다운 - 중앙 설정에서 옵션 가져옴)
-    from openpyxl.worksheet.datavalidation import DataValidation
-    result_options_str = ",".join(RESULT_OPTIONS)
-    result_validation = DataValidation(
-        type="list",
-        formula1=f'"{result_options_str}"',
-        allow_blank=True
-    )
-    result_validation.error = "유효한 결과값을 선택하세요"
-    result_validation.errorTitle = "Invalid Result"
-
-    severity_options_str = ",".join(SEVERITY_OPTIONS)
-    severity_validation = DataValidation(
-        type="list",
-        formula1=f'"{severity_options_str}"',
-        allow_blank=True
-    )
-
-    sheet.add_data_validation(result_validation)
-    sheet.add_data_validation(severity_validation)
-
-    # Result 컬럼에 validation 적용 (O, T, Y열 등)
-    for round_num in range(NUM_TEST_ROUNDS):
-        result_col = round_start_col + round_num * 5
-        severity_col = result_col + 1
-        result_col_letter = get_column_letter(result_col)
-        severity_col_letter = get_column_letter(severity_col)
-
-        if testcases:
-            result_validation.add(f"{result_col_letter}{data_start_row}:{result_col_letter}{last_row}")
-            severity_validation.add(f"{severity_col_letter}{data_start_row}:{severity_col_letter}{last_row}")
+    for validation in _build_data_validations(round_start_col, data_start_row, last_row, bool(testcases)):
+        sheet.add_data_validation(validation)
 
     wb.save(output_path)
-    print(f"Created new Excel file with {len(testcases)} test cases: {output_path}")
-    print(f"  - 1차/2차/3차 테스트 회차 컬럼 포함")
-    print(f"  - 상단 요약 영역 포함")
-
-    return output_path
+    return len(testcases)
 
 
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python write_excel.py <testcases_json> <output_xlsx> [template_xlsx]")
+        print("Usage: python write_excel.py <testcases_json> <output_xlsx> [template_xlsx] [--engine stream|classic]")
+        sys.exit(1)
+
+    engine = DEFAULT_EXCEL_ENGINE
+    positional = []
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] == "--engine" and i + 1 < len(args):
+            engine = args[i + 1]
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+
+    if len(positional) < 2:
+        print("Usage: python write_excel.py <testcases_json> <output_xlsx> [template_xlsx] [--engine stream|classic]")
+        sys.exit(1)
+
+    if engine not in EXCEL_ENGINES:
+        print(f"Error: Unknown engine: {engine} (choose from: {', '.join(EXCEL_ENGINES)})")
         sys.exit(1)
 
-    testcases_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2])
-    template_path = Path(sys.argv[3]) if len(sys.argv) > 3 else None
+    testcases_path = Path(positional[0])
+    output_path = Path(positional[1])
+    template_path = Path(positional[2]) if len(positional) > 2 else None
 
     if not testcases_path.exists():
         print(f"Error: File not found: {testcases_path}")
@@ -482,9 +800,9 @@ def main():
         testcases_data = json.load(f)
 
     if template_path and template_path.exists():
-        write_testcases_to_template(testcases_data, template_path, output_path)
+        write_testcases_to_template(testcases_data, template_path, output_path, engine=engine)
     else:
-        create_new_testcase_excel(testcases_data, output_path)
+        create_new_testcase_excel(testcases_data, output_path, engine=engine)
 
     return output_path
 
@@ -0,0 +1,403 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+xlsx 시트 XML 직접 수정 (특정 셀 값/채우기/메모만 패치)
+
+Reference 컬럼 하나를 바꾸려고 load_workbook으로 전체 워크북을 읽고 다시 저장하면
+TC가 많을수록 수 분이 걸리고, openpyxl이 지원하지 않는 서식은 저장 시 사라집니다.
+이 모듈은 대상 시트 XML에서 지정한 셀만 수정하고, 필요한 경우에만
+styles.xml(채우기 스타일 추가)과 메모 파트(comments, VML, rels, [Content_Types].xml)를 다시 씁니다.
+기존 VML은 그대로 두고 새로 메모를 단 셀의 도형만 끝에 덧붙이므로 기존 메모의 크기/위치/표시 여부는 유지됩니다.
+나머지 파트는 압축 해제 내용 그대로 복사합니다.
+
+사용 예:
+    patcher = SheetPatcher(excel_path)
+    header_row = find_header_row(patcher)
+    patcher.set_value(7, ref_col, "화면 정의서 12P")
+    patcher.set_fill(7, ref_col, "FFFF00")
+    patcher.set_comment(7, ref_col, "[자동매핑] 신뢰도: 40%", "Reference Mapper")
+    patcher.save(output_path)
+"""
+
+import os
+import posixpath
+import re
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from lxml import etree
+from openpyxl.comments.comment_sheet import CommentRecord, CommentSheet
+from openpyxl.comments.shape_writer import ShapeWriter, excelns, officens, vmlns
+from openpyxl.utils import coordinate_to_tuple, get_column_letter
+from openpyxl.xml.functions import Element as xml_element, fromstring as xml_fromstring, tostring as xml_tostring
+
+from xlsx_template import (
+    _ILLEGAL_XML_CHARS,
+    PKG_REL_NS,
+    REL_NS,
+    STYLES_PART,
+    SheetTemplate,
+    _part_path,
+    _q,
+)
+
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+COMMENTS_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
+VML_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/vmlDrawing"
+VML_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.vmlDrawing"
+
+# 새 메모 파트 이름 (openpyxl과 동일한 규칙)
+NEW_COMMENTS_PART = "xl/comments/comment{0}.xml"
+NEW_VML_PART = "xl/drawings/commentsDrawing{0}.vml"
+
+# worksheet 자식 요소 중 legacyDrawing보다 뒤에 와야 하는 요소
+_AFTER_LEGACY_DRAWING = (
+    "legacyDrawingHF", "drawingHF", "picture", "oleObjects", "controls",
+    "webPublishItems", "tableParts", "extLst",
+)
+
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# VML 메모 도형 (type="#_x0000_t202")과 도형 번호
+COMMENT_SHAPE_TYPE = "_x0000_t202"
+_SHAPE_ID = re.compile(r"_x0000_s(\d+)$")
+
+
+def _new_part_name(existing_names, pattern: str) -> str:
+    """zip 안에서 겹치지 않는 새 파트 이름"""
+    number = 1
+    while pattern.format(number) in existing_names:
+        number += 1
+    return pattern.format(number)
+
+
+def _add_relationship(rels_root, rel_type: str, target: str) -> str:
+    """rels에 관계 추가 후 새 rId 반환"""
+    used = {rel.get("Id") for rel in rels_root.iter(f"{{{PKG_REL_NS}}}Relationship")}
+    number = 1
+    while f"rId{number}" in used:
+        number += 1
+    rel_id = f"rId{number}"
+    etree.SubElement(rels_root, f"{{{PKG_REL_NS}}}Relationship", Id=rel_id, Type=rel_type, Target=target)
+    return rel_id
+
+
+def _tostring(root) -> bytes:
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _comment_shape_cells(vml_root) -> set:
+    """VML에 메모 도형이 있는 셀 (0부터 시작하는 행, 열)"""
+    cells = set()
+    for shape in vml_root.iter(f"{{{vmlns}}}shape"):
+        if shape.get("type") != "#" + COMMENT_SHAPE_TYPE:
+            continue
+        client_data = shape.find(f"{{{excelns}}}ClientData")
+        row = client_data.find(f"{{{excelns}}}Row") if client_data is not None else None
+        column = client_data.find(f"{{{excelns}}}Column") if client_data is not None else None
+        if row is not None and column is not None:
+            cells.add((int(row.text), int(column.text)))
+    return cells
+
+
+def _next_shape_id(vml_root) -> int:
+    """새 도형 번호 (기존 도형 다음 번호, 도형이 없으면 idmap 블록의 첫 메모 번호)"""
+    ids = [
+        int(match.group(1))
+        for shape in vml_root.iter(f"{{{vmlns}}}shape")
+        for match in [_SHAPE_ID.match(shape.get("id", ""))] if match
+    ]
+    if ids:
+        return max(ids) + 1
+    idmap = vml_root.find(f".//{{{officens}}}idmap")
+    block = int(idmap.get("data", "1").split(",")[0]) if idmap is not None else 1
+    return block * 1024 + 2  # openpyxl과 같은 규칙 (블록 1 → 1026)
+
+
+def _append_comment_shapes(vml_bytes: bytes, vml_root, records: Dict[str, CommentRecord]) -> bytes:
+    """기존 VML 끝에 records 중 도형이 없는 셀의 메모 도형만 추가 (기존 내용은 바이트 그대로 유지)"""
+    existing = _comment_shape_cells(vml_root)
+    writer = ShapeWriter([])
+
+    # openpyxl로 도형 생성 (shapelayout/shapetype은 기존 VML에 없을 때만)
+    generated = xml_element("xml")
+    if vml_root.find(f"{{{vmlns}}}shapetype[@id='{COMMENT_SHAPE_TYPE}']") is None:
+        writer.add_comment_shapetype(generated)
+        if vml_root.find(f"{{{officens}}}shapelayout") is not None:
+            generated.remove(generated.find(f"{{{officens}}}shapelayout"))
+
+    shape_id = _next_shape_id(vml_root)
+    for ref in sorted(records, key=coordinate_to_tuple):
+        row, column = coordinate_to_tuple(ref)
+        if (row - 1, column - 1) in existing:
+            continue  # 메모만 바뀐 셀은 기존 도형 재사용
+        writer.add_comment_shape(generated, shape_id, ref, records[ref].height, records[ref].width)
+        shape_id += 1
+
+    if not len(generated):
+        return vml_bytes
+
+    # 기존 VML의 접두사(v:, o:, x:)로 직렬화
+    wrapper = etree.Element("xml", nsmap=vml_root.nsmap)
+    wrapper.extend(list(etree.fromstring(xml_tostring(generated))))
+    end = vml_bytes.rfind(b"</xml>")
+    if end < 0:
+        # 닫는 태그가 따로 없는 VML (<xml .../>)은 전체를 다시 직렬화
+        vml_root.extend(list(wrapper))
+        return etree.tostring(vml_root)
+
+    xml = etree.tostring(wrapper)
+    shapes = xml[xml.index(b">") + 1:xml.rindex(b"</xml>")]
+    return vml_bytes[:end] + shapes + vml_bytes[end:]
+
+
+class SheetPatcher(SheetTemplate):
+    """xlsx 시트 하나의 셀을 XML 수준에서 수정하고 저장
+
+    셀 조회(cell(row=, column=).value)와 스타일 번호 조회는 SheetTemplate과 동일합니다.
+    """
+
+    def __init__(self, xlsx_path: Path, sheet_name: str = None):
+        super().__init__(xlsx_path, sheet_name)
+        self._fill_styles: Dict[tuple, int] = {}
+        self._comments: Dict[str, CommentRecord] = {}
+        self._grown = False
+
+    @property
+    def max_row(self) -> int:
+        """시트에 기록된 마지막 행 번호 (openpyxl sheet.max_row와 동일)"""
+        return max(self._rows, default=1)
+
+    # ------------------------------------------------------------------
+    # 셀 수정
+    # ------------------------------------------------------------------
+
+    def _ensure_row(self, row: int):
+        row_elem = self._rows.get(row)
+        if row_elem is not None:
+            return row_elem
+
+        sheet_data = self._sheet_tree.find(_q("sheetData"))
+        row_elem = etree.Element(_q("row"), r=str(row))
+        later = [r for r in self._rows if r > row]
+        if later:
+            self._rows[min(later)].addprevious(row_elem)
+        else:
+            sheet_data.append(row_elem)
+        self._rows[row] = row_elem
+        self._cells[row] = {}
+        self._grown = True
+        return row_elem
+
+    def _ensure_cell(self, row: int, column: int):
+        elem = self._cell_element(row, column)
+        if elem is not None:
+            return elem
+
+        row_elem = self._ensure_row(row)
+        cells = self._cells[row]
+        elem = etree.Element(_q("c"), r=f"{get_column_letter(column)}{row}")
+        later = [c for c in cells if c > column]
+        if later:
+            cells[min(later)].addprevious(elem)
+        else:
+            row_elem.append(elem)
+        cells[column] = elem
+        # spans는 선택 속성이며 열 범위가 바뀌었으므로 제거
+        row_elem.attrib.pop("spans", None)
+        self._grown = True
+        return elem
+
+    def set_value(self, row: int, column: int, value):
+        """셀 값 변경 (문자열은 inlineStr, 스타일 번호는 유지)"""
+        elem = self._ensure_cell(row, column)
+        for child in list(elem):
+            elem.remove(child)
+        elem.attrib.pop("t", None)
+
+        if value is None or value == "":
+            return
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            etree.SubElement(elem, _q("v")).text = str(value)
+            return
+
+        elem.set("t", "inlineStr")
+        text = etree.SubElement(etree.SubElement(elem, _q("is")), _q("t"))
+        text.set(_XML_SPACE, "preserve")
+        text.text = _ILLEGAL_XML_CHARS.sub("", str(value))
+
+    def fill_style_id(self, style_id: int, rgb: str) -> int:
+        """style_id의 채우기만 단색(rgb)으로 바꾼 스타일 번호 (필요할 때 한 번만 추가)"""
+        key = (style_id, rgb)
+        if key in self._fill_styles:
+            return self._fill_styles[key]
+
+        xf = self._copy_xf(style_id)
+        if xf is None:
+            return style_id
+
+        fills = self._styles_tree.find(_q("fills"))
+        fill = etree.SubElement(fills, _q("fill"))
+        pattern = etree.SubElement(fill, _q("patternFill"), patternType="solid")
+        # openpyxl PatternFill(start_color="FFFF00")과 같은 ARGB 표기
+        color = rgb if len(rgb) == 8 else "00" + rgb
+        etree.SubElement(pattern, _q("fgColor"), rgb=color)
+        etree.SubElement(pattern, _q("bgColor"), rgb=color)
+        fill_count = len(fills.findall(_q("fill")))
+        fills.set("count", str(fill_count))
+
+        xf.set("fillId", str(fill_count - 1))
+        xf.set("applyFill", "1")
+        self._fill_styles[key] = self._append_xf(xf)
+        return self._fill_styles[key]
+
+    def set_fill(self, row: int, column: int, rgb: str):
+        """셀 채우기를 단색으로 변경 (글꼴/테두리/정렬은 유지)"""
+        elem = self._ensure_cell(row, column)
+        style_id = self.fill_style_id(int(elem.get("s", 0)), rgb)
+        if style_id:
+            elem.set("s", str(style_id))
+
+    def set_comment(self, row: int, column: int, text: str, author: str):
+        """셀 메모 지정 (같은 셀의 기존 메모는 교체)"""
+        self._ensure_cell(row, column)
+        ref = f"{get_column_letter(column)}{row}"
+        record = CommentRecord(ref=ref, author=author)
+        record.text.t = text
+        self._comments[ref] = record
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def _insert_legacy_drawing(self, rel_id: str):
+        legacy = etree.Element(_q("legacyDrawing"))
+        legacy.set(f"{{{REL_NS}}}id", rel_id)
+        for tag in _AFTER_LEGACY_DRAWING:
+            anchor = self._sheet_tree.find(_q(tag))
+            if anchor is not None:
+                anchor.addprevious(legacy)
+                return
+        self._sheet_tree.append(legacy)
+
+    def _comment_parts(self, zin: zipfile.ZipFile) -> Dict[str, bytes]:
+        """기존 메모와 새 메모를 합친 comments/VML/rels/[Content_Types].xml 파트"""
+        names = set(zin.namelist())
+        sheet_dir, sheet_file = posixpath.split(self.sheet_part)
+        rels_part = posixpath.join(sheet_dir, "_rels", sheet_file + ".rels")
+        if rels_part in names:
+            rels_root = etree.fromstring(zin.read(rels_part))
+        else:
+            rels_root = etree.Element(f"{{{PKG_REL_NS}}}Relationships", nsmap={None: PKG_REL_NS})
+        relationships = list(rels_root.iter(f"{{{PKG_REL_NS}}}Relationship"))
+
+        # 기존 메모 로드 (서식 있는 텍스트 유지)
+        records: Dict[str, CommentRecord] = {}
+        comments_rel = next((r for r in relationships if r.get("Type") == COMMENTS_REL_TYPE), None)
+        if comments_rel is not None:
+            comments_part = _part_path(sheet_dir, comments_rel.get("Target"))
+            existing = CommentSheet.from_tree(xml_fromstring(zin.read(comments_part)))
+            authors = existing.authors.author
+            for record in existing.commentList:
+                record.author = authors[record.authorId]
+                records[record.ref] = record
+        else:
+            comments_part = _new_part_name(names, NEW_COMMENTS_PART)
+            _add_relationship(rels_root, COMMENTS_REL_TYPE, "/" + comments_part)
+        records.update(self._comments)
+
+        comment_sheet = CommentSheet.from_comments(
+            sorted(records.values(), key=lambda record: coordinate_to_tuple(record.ref))
+        )
+
+        # VML (메모 표시용 도형, 기존 VML이 있으면 그대로 두고 새 메모 도형만 추가)
+        vml_bytes = vml_root = None
+        legacy = self._sheet_tree.find(_q("legacyDrawing"))
+        vml_rel = None
+        if legacy is not None:
+            legacy_id = legacy.get(f"{{{REL_NS}}}id")
+            vml_rel = next((r for r in relationships if r.get("Id") == legacy_id), None)
+        if vml_rel is not None:
+            vml_part = _part_path(sheet_dir, vml_rel.get("Target"))
+            try:
+                vml_bytes = zin.read(vml_part)
+                vml_root = etree.fromstring(vml_bytes)
+            except (KeyError, etree.XMLSyntaxError):
+                vml_root = None  # 정형 XML이 아닌 VML은 새로 생성
+        else:
+            if legacy is not None:
+                legacy.getparent().remove(legacy)
+            vml_part = _new_part_name(names, NEW_VML_PART)
+            self._insert_legacy_drawing(_add_relationship(rels_root, VML_REL_TYPE, "/" + vml_part))
+
+        # 콘텐츠 형식 등록
+        content_types = etree.fromstring(zin.read(CONTENT_TYPES_PART))
+        overrides = {o.get("PartName") for o in content_types.iter(f"{{{CONTENT_TYPES_NS}}}Override")}
+        defaults = {d.get("Extension", "").lower() for d in content_types.iter(f"{{{CONTENT_TYPES_NS}}}Default")}
+        if "/" + comments_part not in overrides:
+            etree.SubElement(
+                content_types, f"{{{CONTENT_TYPES_NS}}}Override",
+                PartName="/" + comments_part, ContentType=CommentSheet.mime_type
+            )
+        if "vml" not in defaults and "/" + vml_part not in overrides:
+            default = etree.Element(f"{{{CONTENT_TYPES_NS}}}Default", Extension="vml", ContentType=VML_CONTENT_TYPE)
+            content_types.insert(0, default)
+
+        if vml_root is not None:
+            vml = _append_comment_shapes(vml_bytes, vml_root, self._comments)
+        else:
+            vml = comment_sheet.write_shapes()
+
+        return {
+            comments_part: xml_tostring(comment_sheet.to_tree()),
+            vml_part: vml,
+            rels_part: _tostring(rels_root),
+            CONTENT_TYPES_PART: _tostring(content_types),
+        }
+
+    def _update_dimension(self):
+        dimension = self._sheet_tree.find(_q("dimension"))
+        if dimension is None:
+            return
+        last_col = max((max(c, default=0) for c in self._cells.values()), default=1)
+        dimension.set("ref", f"A1:{get_column_letter(max(last_col, 1))}{self.max_row}")
+
+    def save(self, output_path: Optional[Path] = None) -> Path:
+        """수정한 파트만 교체한 xlsx 저장 (output_path가 없으면 원본 덮어쓰기)
+
+        임시 파일에 쓴 뒤 교체하므로 원본에 덮어써도 중간에 실패하면 원본이 유지됩니다.
+        """
+        output_path = Path(output_path) if output_path else self.xlsx_path
+
+        with zipfile.ZipFile(self.xlsx_path, "r") as zin:
+            replaced = self._comment_parts(zin) if self._comments else {}
+            if self._grown:
+                self._update_dimension()
+            replaced[self.sheet_part] = _tostring(self._sheet_tree)
+            if self._styles_modified:
+                replaced[STYLES_PART] = _tostring(self._styles_tree)
+
+            fd, tmp_path = tempfile.mkstemp(dir=str(output_path.resolve().parent), suffix=".xlsx.tmp")
+            os.close(fd)
+            try:
+                with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zout:
+                    for item in zin.infolist():
+                        if item.filename in replaced:
+                            zout.writestr(item, replaced.pop(item.filename), zipfile.ZIP_DEFLATED)
+                        else:
+                            zout.writestr(item, zin.read(item.filename))
+                    # 새로 만든 파트 (메모, VML, rels)
+                    for name, data in replaced.items():
+                        zout.writestr(name, data)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+        return output_path
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+openpyxl 워크북 DOM 없이 xlsx 시트에 데이터 행을 스트리밍으로 기록
+
+템플릿 방식 Excel 출력은 템플릿을 복사한 뒤 load_workbook으로 전체를 읽고
+모든 셀을 객체로 만든 다음 다시 저장합니다 (템플릿 파싱 2회 + 시트 전체 메모리).
+이 모듈은 템플릿 zip에서 대상 시트 XML, 공유 문자열, 스타일만 한 번 읽고
+데이터 행은 XML 문자열로 만들어 새 zip의 시트 파트에 바로 써 넣습니다.
+나머지 파트(서식, 그림, 다른 시트 등)는 그대로 복사하므로 템플릿 내용이 보존됩니다.
+
+- 헤더 탐색: cell(row=, column=).value 형식으로 template 셀 값을 조회 (openpyxl 시트와 동일)
+- 스타일: 템플릿 셀의 스타일 번호(s)를 사용, 표시 형식만 다른 스타일과 줄바꿈용 스타일은 styles.xml에 추가
+- 문자열: inlineStr로 기록 (sharedStrings.xml은 수정하지 않음)
+"""
+
+import copy
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from lxml import etree
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+
+# SpreadsheetML 네임스페이스
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+WORKBOOK_PART = "xl/workbook.xml"
+STYLES_PART = "xl/styles.xml"
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+
+# 시트 XML 직렬화 시 sheetData 내용 자리 표시
+_ROWS_PLACEHOLDER = "__TC_TEMPLATE_ROWS__"
+
+# 한 번에 zip에 쓰는 행 수
+WRITE_BATCH_ROWS = 1000
+
+# XML에서 허용되지 않는 제어 문자 (탭, 줄바꿈, 캐리지리턴 제외)
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+def _q(tag: str) -> str:
+    return f"{{{MAIN_NS}}}{tag}"
+
+
+_DEFAULT_NS_DECL = f' xmlns="{MAIN_NS}"'
+
+
+def _part_path(base_dir: str, target: str) -> str:
+    """관계(rels) Target을 zip 내 파트 경로로 변환 (절대/상대 경로 모두)"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _element_xml(elem) -> str:
+    """템플릿 요소를 시트 본문에 넣을 XML 문자열로 직렬화 (중복 기본 네임스페이스 선언 제거)"""
+    return etree.tostring(elem, encoding="unicode").replace(_DEFAULT_NS_DECL, "", 1)
+
+
+class _CellValue:
+    """find_header_row 등에서 sheet.cell(...).value로 조회하기 위한 값 래퍼"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class SheetTemplate:
+    """xlsx 템플릿의 시트 하나를 읽고, 데이터 행을 채운 새 xlsx를 스트리밍으로 생성
+
+    사용 예:
+        template = SheetTemplate(template_path)
+        header_row = find_header_row(template)
+        template.write(output_path, header_row + 1, rows)
+    """
+
+    def __init__(self, xlsx_path: Path, sheet_name: str = None):
+        self.xlsx_path = Path(xlsx_path)
+
+        with zipfile.ZipFile(self.xlsx_path, "r") as zf:
+            self.sheet_part, self.sheet_name = self._locate_sheet(zf, sheet_name)
+            self._shared_strings = self._load_shared_strings(zf)
+            self._sheet_tree = etree.fromstring(zf.read(self.sheet_part))
+            self._styles_tree = etree.fromstring(zf.read(STYLES_PART)) if STYLES_PART in zf.NameToInfo else None
+
+        # 행 번호 → {열 번호: <c> 요소}, 행 번호 → <row> 요소
+        self._rows: Dict[int, etree._Element] = {}
+        self._cells: Dict[int, Dict[int, etree._Element]] = {}
+        sheet_data = self._sheet_tree.find(_q("sheetData"))
+        next_row = 1
+        for row in sheet_data.iterchildren(_q("row")):
+            row_idx = int(row.get("r", next_row))
+            next_row = row_idx + 1
+            self._rows[row_idx] = row
+            cells = {}
+            next_col = 1
+            for cell in row.iterchildren(_q("c")):
+                ref = cell.get("r")
+                col_idx = column_index_from_string(_CELL_REF.match(ref).group(1)) if ref else next_col
+                next_col = col_idx + 1
+                cells[col_idx] = cell
+            self._cells[row_idx] = cells
+
+        self._wrap_styles: Dict[int, int] = {}
+        self._number_format_styles: Dict[Tuple[int, int], int] = {}
+        self._styles_modified = False
+
+    # ------------------------------------------------------------------
+    # 템플릿 읽기
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _locate_sheet(zf: zipfile.ZipFile, sheet_name: Optional[str]) -> Tuple[str, str]:
+        """시트 이름(없으면 활성 시트)의 파트 경로"""
+        workbook = etree.fromstring(zf.read(WORKBOOK_PART))
+        sheets = workbook.findall(f"{_q('sheets')}/{_q('sheet')}")
+        if not sheets:
+            raise ValueError("워크북에 시트가 없습니다.")
+
+        target = None
+        if sheet_name:
+            target = next((s for s in sheets if s.get("name") == sheet_name), None)
+        if target is None:
+            view = workbook.find(f"{_q('bookViews')}/{_q('workbookView')}")
+            active = int(view.get("activeTab", 0)) if view is not None else 0
+            target = sheets[active] if active < len(sheets) else sheets[0]
+
+        rels_root = etree.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        rel_id = target.get(f"{{{REL_NS}}}id")
+        for rel in rels_root.iter(f"{{{PKG_REL_NS}}}Relationship"):
+            if rel.get("Id") == rel_id:
+                return _part_path("xl", rel.get("Target")), target.get("name")
+
+        raise ValueError(f"시트 파트를 찾을 수 없습니다: {target.get('name')}")
+
+    @staticmethod
+    def _load_shared_strings(zf: zipfile.ZipFile) -> list:
+        if SHARED_STRINGS_PART not in zf.NameToInfo:
+            return []
+        root = etree.fromstring(zf.read(SHARED_STRINGS_PART))
+        return ["".join(si.itertext(_q("t"))) for si in root.iterchildren(_q("si"))]
+
+    def _cell_element(self, row: int, column: int):
+        return self._cells.get(row, {}).get(column)
+
+    def cell(self, row: int, column: int) -> _CellValue:
+        """셀 값 조회 (공유 문자열/인라인 문자열/숫자)"""
+        elem = self._cell_element(row, column)
+        if elem is None:
+            return _CellValue(None)
+
+        cell_type = elem.get("t", "n")
+        if cell_type == "inlineStr":
+            is_elem = elem.find(_q("is"))
+            return _CellValue("".join(is_elem.itertext(_q("t"))) if is_elem is not None else None)
+
+        v = elem.find(_q("v"))
+        if v is None or v.text is None:
+            return _CellValue(None)
+        if cell_type == "s":
+            return _CellValue(self._shared_strings[int(v.text)])
+        if cell_type == "n":
+            number = float(v.text)
+            return _CellValue(int(number) if number.is_integer() else number)
+        return _CellValue(v.text)
+
+    def style_id(self, row: int, column: int) -> int:
+        """셀의 스타일 번호 (cellXfs 인덱스, 없으면 0)"""
+        elem = self._cell_element(row, column)
+        return int(elem.get("s", 0)) if elem is not None else 0
+
+    def number_format_id(self, row: int, column: int) -> int:
+        """셀의 표시 형식 번호 (numFmtId, 없으면 0 = General)"""
+        elem = self._cell_element(row, column)
+        if elem is None:
+            return 0
+        xf = self._xf(int(elem.get("s", 0)))
+        return int(xf.get("numFmtId", 0)) if xf is not None else 0
+
+    def number_format_style_id(self, style_id: int, num_fmt_id: int) -> int:
+        """style_id의 표시 형식만 num_fmt_id로 바꾼 스타일 번호 (필요할 때 한 번만 styles.xml에 추가)"""
+        xf = self._xf(style_id)
+        if xf is None or int(xf.get("numFmtId", 0)) == num_fmt_id:
+            return style_id
+
+        key = (style_id, num_fmt_id)
+        if key not in self._number_format_styles:
+            xf = copy.deepcopy(xf)
+            xf.set("numFmtId", str(num_fmt_id))
+            if num_fmt_id:
+                xf.set("applyNumberFormat", "1")
+            elif "applyNumberFormat" in xf.attrib:
+                del xf.attrib["applyNumberFormat"]
+            self._number_format_styles[key] = self._append_xf(xf)
+        return self._number_format_styles[key]
+
+    def wrap_style_id(self, style_id: int) -> int:
+        """style_id에 줄바꿈 정렬(세로 위, 자동 줄바꿈)을 적용한 스타일 번호
+
+        가로 정렬만 유지하고 정렬을 다시 지정하며, 필요할 때 한 번만 styles.xml에 추가합니다.
+        """
+        if style_id in self._wrap_styles:
+            return self._wrap_styles[style_id]
+
+        xf = self._copy_xf(style_id)
+        if xf is None:
+            return style_id
+
+        old_alignment = xf.find(_q("alignment"))
+        horizontal = old_alignment.get("horizontal") if old_alignment is not None else None
+        if old_alignment is not None:
+            xf.remove(old_alignment)
+
+        alignment = etree.Element(_q("alignment"))
+        if horizontal:
+            alignment.set("horizontal", horizontal)
+        alignment.set("vertical", "top")
+        alignment.set("wrapText", "1")
+        # alignment는 xf의 첫 번째 자식이어야 함
+        xf.insert(0, alignment)
+        xf.set("applyAlignment", "1")
+
+        self._wrap_styles[style_id] = self._append_xf(xf)
+        return self._wrap_styles[style_id]
+
+    def _xf(self, style_id: int):
+        """cellXfs[style_id] (스타일 정보가 없으면 None)"""
+        if self._styles_tree is None:
+            return None
+        xfs = self._styles_tree.find(_q("cellXfs")).findall(_q("xf"))
+        if style_id >= len(xfs):
+            return None
+        return xfs[style_id]
+
+    def _copy_xf(self, style_id: int):
+        """cellXfs[style_id] 복사본 (스타일 정보가 없으면 None)"""
+        xf = self._xf(style_id)
+        return copy.deepcopy(xf) if xf is not None else None
+
+    def _append_xf(self, xf) -> int:
+        """cellXfs 끝에 xf 추가 후 새 스타일 번호 반환"""
+        cell_xfs = self._styles_tree.find(_q("cellXfs"))
+        cell_xfs.append(xf)
+        count = len(cell_xfs.findall(_q("xf")))
+        cell_xfs.set("count", str(count))
+        self._styles_modified = True
+        return count - 1
+
+    # ------------------------------------------------------------------
+    # 새 xlsx 쓰기
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cell_xml(ref: str, value: Any, style_id: int) -> str:
+        style_attr = f' s="{style_id}"' if style_id else ""
+        if value is None or value == "":
+            return f'<c r="{ref}"{style_attr}/>'
+        if isinstance(value, bool):
+            return f'<c r="{ref}"{style_attr} t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, (int, float)):
+            return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+        text = escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+        return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+    def _row_xml(self, row_idx: int, values: Dict[int, Tuple[Any, int]]) -> str:
+        """새 데이터 행 XML (템플릿에 같은 행이 있으면 나머지 셀과 행 속성 유지)"""
+        template_row = self._rows.get(row_idx)
+        attrs = ""
+        kept_cells = {}
+        if template_row is not None:
+            # 네임스페이스 속성(x14ac:dyDescent 등 표시용 힌트)은 제외
+            attrs = "".join(
+                f' {k}="{escape(v, {chr(34): "&quot;"})}"' for k, v in template_row.attrib.items()
+                if k not in ("r", "spans") and not k.startswith("{")
+            )
+            kept_cells = {
+                col: _element_xml(elem)
+                for col, elem in self._cells[row_idx].items()
+                if col not in values
+            }
+
+        parts = [f'<row r="{row_idx}"{attrs}>']
+        for col_idx in sorted(set(values) | set(kept_cells)):
+            if col_idx in values:
+                value, style_id = values[col_idx]
+                parts.append(self._cell_xml(f"{get_column_letter(col_idx)}{row_idx}", value, style_id))
+            else:
+                parts.append(kept_cells[col_idx])
+        parts.append("</row>")
+        return "".join(parts)
+
+    def _split_sheet_xml(self, last_row: int, last_col: int) -> Tuple[bytes, bytes]:
+        """sheetData 앞/뒤 XML (dimension 범위 갱신)"""
+        tree = copy.deepcopy(self._sheet_tree)
+        dimension = tree.find(_q("dimension"))
+        if dimension is not None:
+            dimension.set("ref", f"A1:{get_column_letter(max(last_col, 1))}{max(last_row, 1)}")
+
+        sheet_data = tree.find(_q("sheetData"))
+        for row in list(sheet_data):
+            sheet_data.remove(row)
+        sheet_data.text = _ROWS_PLACEHOLDER
+
+        xml = etree.tostring(tree, xml_declaration=True, encoding="UTF-8", standalone=True)
+        head, tail = xml.split(_ROWS_PLACEHOLDER.encode("ascii"))
+        return head, tail
+
+    def write(
+        self,
+        output_path: Path,
+        start_row: int,
+        rows: Iterable[Dict[int, Tuple[Any, int]]],
+        row_count: int
+    ) -> int:
+        """start_row부터 데이터 행을 채운 새 xlsx 생성
+
+        Args:
+            output_path: 출력 xlsx 경로
+            start_row: 첫 데이터 행 번호
+            rows: 행마다 {열 번호: (값, 스타일 번호)} (지정한 열만 덮어씀)
+            row_count: rows의 행 수 (dimension 계산용)
+
+        Returns:
+            기록한 데이터 행 수
+        """
+        last_template_row = max(self._rows, default=0)
+        last_template_col = max((max(c, default=0) for c in self._cells.values()), default=0)
+        last_row = max(last_template_row, start_row + row_count - 1)
+        head, tail = self._split_sheet_xml(last_row, last_template_col)
+
+        written = 0
+        with zipfile.ZipFile(self.xlsx_path, "r") as zin, \
+                zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                if item.filename == self.sheet_part:
+                    info = zipfile.ZipInfo(item.filename, date_time=item.date_time)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with zout.open(info, "w", force_zip64=True) as f:
+                        f.write(head)
+                        written = self._write_rows(f, start_row, rows)
+                        f.write(tail)
+                elif item.filename == STYLES_PART and self._styles_modified:
+                    continue  # 행 기록 중 추가된 스타일 반영을 위해 마지막에 기록
+                else:
+                    zout.writestr(item, zin.read(item.filename))
+
+            if self._styles_modified:
+                styles_info = zin.getinfo(STYLES_PART)
+                zout.writestr(
+                    styles_info,
+                    etree.tostring(self._styles_tree, xml_declaration=True, encoding="UTF-8", standalone=True)
+                )
+
+        return written
+
+    def _write_rows(self, f, start_row: int, rows: Iterable[Dict[int, Tuple[Any, int]]]) -> int:
+        """데이터 행 + 이후 템플릿 행을 행 번호 순서대로 기록"""
+        batch = []
+        row_idx = start_row
+
+        # 데이터 시작 전 템플릿 행은 그대로
+        for template_row_idx in sorted(r for r in self._rows if r < start_row):
+            batch.append(_element_xml(self._rows[template_row_idx]))
+
+        for values in rows:
+            batch.append(self._row_xml(row_idx, values))
+            row_idx += 1
+            if len(batch) >= WRITE_BATCH_ROWS:
+                f.write("".join(batch).encode("utf-8"))
+                batch = []
+
+        # 데이터보다 뒤에 있는 템플릿 행은 그대로
+        for template_row_idx in sorted(r for r in self._rows if r >= row_idx):
+            batch.append(_element_xml(self._rows[template_row_idx]))
+
+        f.write("".join(batch).encode("utf-8"))
+        return row_idx - start_row
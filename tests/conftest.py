@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""테스트 공통 설정: 스킬 스크립트(testcase-generator/scripts)를 import 경로에 추가"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "testcase-generator" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""KeywordMatcher 1회 스캔 결과가 테이블 순서대로 `keyword in text`를 검사하던 방식과 같은지 테스트"""
+
+import random
+
+import pytest
+
+from generate_testcase import (
+    KEYWORD_MATCHER,
+    KeywordMatcher,
+    _group_table,
+    _keyword_table,
+    ACTION_KEYWORDS,
+    COMPONENT_TYPE_KEYWORDS,
+    CONDITION_PATTERNS,
+    PRECONDITION_KEYWORDS,
+    SHORTCUT_MAP,
+    TITLE_KEYWORD_MAP,
+    TITLE_TYPE_KEYWORDS,
+    match_keywords,
+)
+
+
+TABLES = {
+    "type": _group_table(COMPONENT_TYPE_KEYWORDS),
+    "title_type": _group_table(TITLE_TYPE_KEYWORDS),
+    "title": _keyword_table(TITLE_KEYWORD_MAP),
+    "shortcut": _keyword_table(SHORTCUT_MAP),
+    "condition": _keyword_table(CONDITION_PATTERNS),
+    "precondition": _group_table(PRECONDITION_KEYWORDS),
+    "action": _group_table(ACTION_KEYWORDS),
+}
+
+
+def linear_first_match(tables, text):
+    """기존 방식: 테이블마다 앞쪽 항목부터 키워드 포함 여부를 검사해 첫 일치 값 사용"""
+    result = {}
+    for name, entries in tables.items():
+        for keywords, value in entries:
+            if any(keyword in text for keyword in keywords):
+                result[name] = value
+                break
+    return result
+
+
+def random_texts(count, seed=0):
+    keywords = sorted({keyword for entries in TABLES.values() for keywords, _ in entries for keyword in keywords})
+    filler = ["항목", "선택", "화면", "the", "a", "-", " ", "\n", "설정값", "x"]
+    rnd = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rnd.randint(0, 6)):
+            word = rnd.choice(keywords) if rnd.random() < 0.6 else rnd.choice(filler)
+            # 키워드 일부만 잘라 넣어 접두사/부분 일치도 섞음
+            if rnd.random() < 0.2 and len(word) > 2:
+                word = word[:rnd.randint(1, len(word) - 1)]
+            parts.append(word)
+        texts.append(rnd.choice(["", " ", "_"]).join(parts).lower())
+    return texts
+
+
+def test_rule_tables_match_linear_first_match():
+    for text in random_texts(3000):
+        assert KEYWORD_MATCHER.scan(text) == linear_first_match(TABLES, text), text
+
+
+@pytest.mark.parametrize("text, expected", [
+    # 앞쪽 항목이 우선 (텍스트 내 위치와 무관)
+    ("save as and open", {"action": "open"}),
+    # 더 긴 키워드 안의 접두사 키워드도 일치
+    ("saveas", {"action": "save"}),
+    ("save as", {"action": "save"}),
+    ("nothing", {}),
+])
+def test_priority_and_overlapping_keywords(text, expected):
+    matcher = KeywordMatcher({"action": [(["open"], "open"), (["save"], "save"), (["save as"], "save_as")]})
+    assert matcher.scan(text) == expected
+    assert expected == linear_first_match(
+        {"action": [(["open"], "open"), (["save"], "save"), (["save as"], "save_as")]}, text
+    )
+
+
+def test_same_keyword_in_several_tables():
+    tables = {
+        "first": [(["ab"], 1), (["b"], 2)],
+        "second": [(["b"], "x"), (["abc"], "y")],
+    }
+    matcher = KeywordMatcher(tables)
+    for text in ["abc", "b", "ab", "cab", "xyz", "abcab"]:
+        assert matcher.scan(text) == linear_first_match(tables, text), text
+
+
+def test_cached_result_is_read_only():
+    hits = match_keywords("save button")
+    with pytest.raises(TypeError):
+        hits["type"] = "popup"
+    assert match_keywords("save button") == KEYWORD_MATCHER.scan("save button")
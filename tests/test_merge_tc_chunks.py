@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""TC 청크 k-way 병합 순서 테스트 (전역 안정 정렬과 같은 순서인지)"""
+
+import json
+
+from merge_tc_chunks import ChunkMerger, merge_tc_chunks
+from merge_tc_chunks import testcase_sort_key as sort_key
+
+
+def tc(tc_id, page, title, reference_extra=""):
+    return {"test_case_id": tc_id, "reference": f"화면 정의서 {page}P{reference_extra}", "title": title}
+
+
+def write_chunk(output_dir, number, testcases, project_info=None):
+    path = output_dir / f"tc_chunk_{number:03d}.json"
+    path.write_text(
+        json.dumps({"project_info": project_info or {}, "testcases": testcases}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    return path
+
+
+def legacy_order(chunks):
+    """기존 방식: 청크 파일명 순으로 이어 붙인 뒤 전역 안정 정렬"""
+    all_tcs = [t for _, testcases in sorted(chunks.items()) for t in testcases]
+    return [t["title"] for t in sorted(all_tcs, key=sort_key)]
+
+
+def merged_titles(output_dir):
+    data = json.loads((output_dir / "tc_data.json").read_text(encoding="utf-8"))
+    return data, [t["title"] for t in data["testcases"]]
+
+
+def test_ties_keep_chunk_file_order_then_chunk_order(tmp_path):
+    # CHUNK 번호가 없는 ID는 정렬 키가 (페이지, 0, 0)으로 같음
+    chunks = {
+        1: [tc("IT_OP_001", 3, "c1-p3-a"), tc("IT_OP_002", 1, "c1-p1-a"), tc("IT_OP_003", 3, "c1-p3-b")],
+        2: [tc("IT_OP_004", 1, "c2-p1-a"), tc("IT_OP_005", 3, "c2-p3-a"), tc("IT_OP_006", 1, "c2-p1-b")],
+        3: [tc("IT_OP_007", 3, "c3-p3-a"), tc("IT_OP_008", 2, "c3-p2-a")],
+    }
+    # 추가 순서(파일 생성 순서)와 무관하게 파일명 순
+    for number in (3, 1, 2):
+        write_chunk(tmp_path, number, chunks[number])
+
+    merge_tc_chunks(tmp_path)
+    data, titles = merged_titles(tmp_path)
+
+    assert titles == [
+        "c1-p1-a", "c2-p1-a", "c2-p1-b",
+        "c3-p2-a",
+        "c1-p3-a", "c1-p3-b", "c2-p3-a", "c3-p3-a",
+    ]
+    assert titles == legacy_order(chunks)
+    assert [t["test_case_id"] for t in data["testcases"]] == [f"IT_OP_{i:03d}" for i in range(1, 9)]
+
+
+def test_chunk_ids_order_within_page(tmp_path):
+    # 같은 페이지에서는 (청크 번호, 순번) 순 - 청크 파일명 순서보다 ID의 청크 번호가 우선
+    chunks = {
+        1: [tc("CHUNK2_002", 5, "chunk2-2"), tc("CHUNK2_001", 5, "chunk2-1")],
+        2: [tc("CHUNK1_010", 5, "chunk1-10"), tc("CHUNK1_002", 5, "chunk1-2"), tc("CHUNK1_003", 4, "chunk1-3")],
+    }
+    for number, testcases in chunks.items():
+        write_chunk(tmp_path, number, testcases)
+
+    merge_tc_chunks(tmp_path)
+    _, titles = merged_titles(tmp_path)
+
+    assert titles == ["chunk1-3", "chunk1-2", "chunk1-10", "chunk2-1", "chunk2-2"]
+    assert titles == legacy_order(chunks)
+
+
+def test_cross_references_follow_new_ids(tmp_path):
+    chunks = {
+        1: [tc("CHUNK1_001", 2, "a", " (CHUNK2_001 참고)")],
+        2: [tc("CHUNK2_001", 1, "b", " (CHUNK1_001, CHUNK2_001 참고)")],
+    }
+    for number, testcases in chunks.items():
+        write_chunk(tmp_path, number, testcases)
+
+    merge_tc_chunks(tmp_path, prefix="IT_XX")
+    data, titles = merged_titles(tmp_path)
+
+    assert titles == ["b", "a"]
+    references = [t["reference"] for t in data["testcases"]]
+    assert references == ["화면 정의서 1P (IT_XX_002, IT_XX_001 참고)", "화면 정의서 2P (IT_XX_001 참고)"]
+
+
+def test_readding_chunk_replaces_previous(tmp_path):
+    merger = ChunkMerger(tmp_path)
+    merger.add("tc_chunk_001.json", {"testcases": [tc("IT_OP_001", 1, "old")]})
+    merger.add("tc_chunk_002.json", {"testcases": [tc("IT_OP_002", 1, "other")]})
+    merger.add("tc_chunk_001.json", {"testcases": [tc("IT_OP_001", 1, "new")]})
+
+    assert len(merger) == 2
+    assert [t["title"] for t in merger.iter_testcases("IT_OP")] == ["new", "other"]
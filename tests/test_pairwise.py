@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""IPOG 조합 생성 커버리지 / 제약 조건 테스트"""
+
+from itertools import combinations, product
+
+import pytest
+
+from test_design_techniques import (
+    ForbiddenCombination,
+    ImplicationRule,
+    TestCondition as Condition,
+    generate_pairwise_combinations,
+    generate_tway_combinations,
+)
+
+
+def make_conditions(sizes):
+    return [
+        Condition(f"조건{i + 1}", [f"값{i + 1}-{v + 1}" for v in range(size)])
+        for i, size in enumerate(sizes)
+    ]
+
+
+def satisfies(row, constraints):
+    """조합 하나가 금지 조합/조건부 제약을 모두 지키는지"""
+    for constraint in constraints:
+        if isinstance(constraint, ForbiddenCombination):
+            if all(row[name] == value for name, value in constraint.values.items()):
+                return False
+        elif all(row[name] == value for name, value in constraint.if_values.items()):
+            if row[constraint.then_condition] not in constraint.then_values:
+                return False
+    return True
+
+
+def required_tuples(conditions, strength, constraints=()):
+    """제약을 지키는 전체 조합에서 실제로 나올 수 있는 t-way 값 조합 (커버 대상)"""
+    names = [c.name for c in conditions]
+    required = set()
+    for values in product(*(c.values for c in conditions)):
+        row = dict(zip(names, values))
+        if satisfies(row, constraints):
+            for group in combinations(names, strength):
+                required.add(tuple((name, row[name]) for name in group))
+    return required
+
+
+def covered_tuples(conditions, combos, strength):
+    names = [c.name for c in conditions]
+    return {
+        tuple((name, combo.conditions[name]) for name in group)
+        for combo in combos
+        for group in combinations(names, strength)
+    }
+
+
+@pytest.mark.parametrize("sizes", [
+    [2, 2],
+    [3, 3, 3],
+    [4, 4, 4, 4, 4],
+    [2, 5, 3, 4, 2, 3],
+    [3] * 8,
+])
+def test_pairwise_covers_all_pairs(sizes):
+    conditions = make_conditions(sizes)
+    combos = generate_pairwise_combinations(conditions)
+
+    assert covered_tuples(conditions, combos, 2) >= required_tuples(conditions, 2)
+    # 모든 조합은 조건마다 유효한 값 하나씩
+    for combo in combos:
+        assert set(combo.conditions) == {c.name for c in conditions}
+        for condition in conditions:
+            assert combo.conditions[condition.name] in condition.values
+
+
+def test_pairwise_many_conditions_without_full_product():
+    """조건 40개(4^40 조합)도 전체 조합을 탐색하지 않고 모든 쌍을 커버"""
+    conditions = make_conditions([4] * 40)
+    combos = generate_pairwise_combinations(conditions)
+
+    names = [c.name for c in conditions]
+    for first, second in combinations(names, 2):
+        seen = {(combo.conditions[first], combo.conditions[second]) for combo in combos}
+        assert len(seen) == 16
+    assert len(combos) < 60
+
+
+def test_tway_covers_all_triples():
+    conditions = make_conditions([3, 2, 3, 2, 3])
+    combos = generate_tway_combinations(conditions, 3)
+    assert covered_tuples(conditions, combos, 3) >= required_tuples(conditions, 3)
+
+
+def test_forbidden_combination_never_generated():
+    conditions = [
+        Condition("버튼 상태", ["활성", "비활성"]),
+        Condition("동작", ["클릭", "더블클릭", "마우스오버"]),
+        Condition("권한", ["관리자", "일반", "게스트"]),
+    ]
+    constraints = [ForbiddenCombination({"버튼 상태": "비활성", "동작": "클릭"})]
+    combos = generate_pairwise_combinations(conditions, constraints)
+
+    assert all(satisfies(combo.conditions, constraints) for combo in combos)
+    assert covered_tuples(conditions, combos, 2) >= required_tuples(conditions, 2, constraints)
+    assert (("버튼 상태", "비활성"), ("동작", "클릭")) not in covered_tuples(conditions, combos, 2)
+
+
+def test_implication_rule_restricts_values():
+    conditions = [
+        Condition("버튼 상태", ["활성", "비활성"]),
+        Condition("동작", ["클릭", "더블클릭", "마우스오버"]),
+        Condition("권한", ["관리자", "일반", "게스트"]),
+    ]
+    constraints = [
+        ForbiddenCombination({"버튼 상태": "비활성", "동작": "클릭"}),
+        ImplicationRule({"권한": "게스트"}, "버튼 상태", ["비활성"]),
+    ]
+    combos = generate_pairwise_combinations(conditions, constraints)
+
+    assert all(satisfies(combo.conditions, constraints) for combo in combos)
+    for combo in combos:
+        if combo.conditions["권한"] == "게스트":
+            assert combo.conditions["버튼 상태"] == "비활성"
+            assert combo.conditions["동작"] != "클릭"
+    # 제약상 나올 수 없는 쌍(게스트 + 클릭 등)은 빼고 나머지 쌍은 모두 커버
+    assert covered_tuples(conditions, combos, 2) == required_tuples(conditions, 2, constraints)
+
+
+def test_constraints_on_many_conditions():
+    conditions = make_conditions([3] * 8)
+    constraints = [
+        ForbiddenCombination({"조건1": "값1-1", "조건2": "값2-1"}),
+        ForbiddenCombination({"조건3": "값3-2", "조건4": "값4-3", "조건5": "값5-1"}),
+        ImplicationRule({"조건6": "값6-1"}, "조건7", ["값7-2"]),
+        ImplicationRule({"조건7": "값7-2", "조건8": "값8-3"}, "조건1", ["값1-3"]),
+    ]
+    combos = generate_pairwise_combinations(conditions, constraints)
+
+    assert all(satisfies(combo.conditions, constraints) for combo in combos)
+    assert covered_tuples(conditions, combos, 2) >= required_tuples(conditions, 2, constraints)
+
+
+def test_unknown_constraint_value_raises():
+    conditions = make_conditions([2, 2])
+    with pytest.raises(ValueError):
+        generate_pairwise_combinations(conditions, [ForbiddenCombination({"조건1": "없는 값"})])